@@ -0,0 +1,208 @@
+"""
+Hot/cold archival of applications for long-closed jobs
+
+Applications (with their status history) for jobs closed longer than
+ARCHIVE_AFTER_DAYS are moved in batches into ArchivedApplication, which
+keeps a few listing columns and the rest as compressed JSON. This keeps
+the hot application tables and their indexes sized to active pipelines.
+Reopening a job restores its applications under their original ids.
+"""
+import json
+import logging
+import threading
+import zlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.jobs.models import Job
+from .caching import invalidate_job
+from .models import Application, ApplicationStatusHistory, ArchivedApplication, ResumeText
+from .resume_search import store_resume_texts
+
+logger = logging.getLogger(__name__)
+
+# Columns kept on ArchivedApplication itself; everything else goes in `data`
+INDEXED_FIELDS = ['candidate_name', 'candidate_email', 'status', 'score', 'applied_at']
+PAYLOAD_FIELDS = [
+    'candidate_phone', 'linkedin_url', 'cover_letter', 'resume_file', 'resume_sha256',
+    'parsed_skills', 'parsed_experience', 'parsed_education',
+    'parsed_email', 'parsed_phone', 'experience_years', 'education_level',
+    'education_field', 'updated_at'
+]
+HISTORY_FIELDS = ['id', 'from_status', 'to_status', 'changed_by_id', 'changed_at', 'notes']
+
+
+def compress(payload):
+    raw = json.dumps(payload, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+    return zlib.compress(raw, settings.ARCHIVE_COMPRESSION_LEVEL)
+
+
+def decompress(data):
+    return json.loads(zlib.decompress(bytes(data)))
+
+
+def _to_archive(application):
+    payload = {field: getattr(application, field) for field in PAYLOAD_FIELDS}
+    payload['resume_file'] = application.resume_file.name
+    try:
+        payload['resume_text'] = application.resume_text.text
+    except ResumeText.DoesNotExist:
+        pass
+    payload['status_history'] = [
+        {field: getattr(entry, field) for field in HISTORY_FIELDS}
+        for entry in application.status_history.all()
+    ]
+    return ArchivedApplication(
+        id=application.id,
+        job_id=application.job_id,
+        data=compress(payload),
+        **{field: getattr(application, field) for field in INDEXED_FIELDS}
+    )
+
+
+def jobs_due_for_archival(older_than_days=None):
+    """Closed jobs past the archival age that still have hot applications"""
+    days = settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    cutoff = timezone.now() - timedelta(days=days)
+    return Job.objects.filter(
+        status='closed',
+        closed_at__lt=cutoff,
+        applications__isnull=False
+    ).distinct()
+
+
+def archive_job(job, batch_size=None):
+    """Move every application for a job into the archive, return the count"""
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    archived = 0
+    while True:
+        batch = list(
+            Application.objects.filter(job=job)
+            .select_related('resume_text')
+            .prefetch_related('status_history')
+            .order_by('id')[:batch_size]
+        )
+        if not batch:
+            break
+        ids = [application.id for application in batch]
+        with transaction.atomic():
+            ArchivedApplication.objects.bulk_create([_to_archive(app) for app in batch])
+            ApplicationStatusHistory.objects.filter(application_id__in=ids).delete()
+            Application.objects.filter(id__in=ids).delete()
+        archived += len(batch)
+
+    if archived:
+        invalidate_job(job.id)
+        logger.info(f"Archived {archived} applications for job {job.id}")
+    return archived
+
+
+def restore_job(job, batch_size=None):
+    """Move a job's archived applications back to the hot tables, return the count"""
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    restored = 0
+    while True:
+        batch = list(ArchivedApplication.objects.filter(job=job).order_by('id')[:batch_size])
+        if not batch:
+            break
+
+        now = timezone.now()
+        applications, history, texts = [], [], []
+        for archived in batch:
+            payload = decompress(archived.data)
+            applications.append(Application(
+                id=archived.id,
+                job_id=archived.job_id,
+                candidate_name=archived.candidate_name,
+                candidate_email=archived.candidate_email,
+                status=archived.status,
+                score=archived.score,
+                applied_at=archived.applied_at,
+                candidate_phone=payload['candidate_phone'],
+                linkedin_url=payload['linkedin_url'],
+                cover_letter=payload['cover_letter'],
+                resume_file=payload['resume_file'],
+                resume_sha256=payload.get('resume_sha256', ''),
+                parsed_skills=payload['parsed_skills'],
+                parsed_experience=payload['parsed_experience'],
+                parsed_education=payload['parsed_education'],
+                parsed_email=payload['parsed_email'],
+                parsed_phone=payload['parsed_phone'],
+                experience_years=payload.get('experience_years'),
+                education_level=payload.get('education_level'),
+                education_field=payload.get('education_field', ''),
+                # Restored rows count as changed for sync clients
+                updated_at=now,
+            ))
+            if payload.get('resume_text'):
+                texts.append((archived.id, payload['resume_text']))
+            for entry in payload['status_history']:
+                history.append(ApplicationStatusHistory(
+                    application_id=archived.id,
+                    **{**entry, 'changed_at': parse_datetime(entry['changed_at'])}
+                ))
+
+        # Recruiters deleted since archival would fail the foreign key
+        users = set(User.objects.filter(
+            id__in={entry.changed_by_id for entry in history if entry.changed_by_id}
+        ).values_list('id', flat=True))
+        for entry in history:
+            if entry.changed_by_id not in users:
+                entry.changed_by_id = None
+
+        # bulk_create stamps auto_now_add fields; put the original times back
+        applied_at = {app.id: app.applied_at for app in applications}
+        changed_at = {entry.id: entry.changed_at for entry in history}
+        with transaction.atomic():
+            Application.objects.bulk_create(applications)
+            ApplicationStatusHistory.objects.bulk_create(history)
+            store_resume_texts(texts)
+            for app in applications:
+                app.applied_at = applied_at[app.id]
+            for entry in history:
+                entry.changed_at = changed_at[entry.id]
+            Application.objects.bulk_update(applications, ['applied_at'])
+            ApplicationStatusHistory.objects.bulk_update(history, ['changed_at'])
+            ArchivedApplication.objects.filter(id__in=applied_at.keys()).delete()
+        restored += len(batch)
+
+    if restored:
+        invalidate_job(job.id)
+        logger.info(f"Restored {restored} archived applications for job {job.id}")
+    return restored
+
+
+def start_restore(job):
+    """
+    Restore a job's archived applications
+
+    Small archives are restored inline; larger ones in a background thread.
+    Each batch commits on its own, so a failed restore resumes where it
+    stopped the next time this is called. Returns True if it finished inline.
+    """
+    total = ArchivedApplication.objects.filter(job=job).count()
+    if total <= settings.ARCHIVE_RESTORE_INLINE_LIMIT:
+        restore_job(job)
+        return True
+    threading.Thread(
+        target=_restore_in_thread,
+        args=(job,),
+        name=f"job-restore-{job.pk}",
+        daemon=True
+    ).start()
+    return False
+
+
+def _restore_in_thread(job):
+    try:
+        restore_job(job)
+    except Exception:
+        logger.exception(f"Restoring archived applications for job {job.id} failed")
+    finally:
+        connection.close()
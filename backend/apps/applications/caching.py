@@ -0,0 +1,57 @@
+"""
+Versioned cache namespaces for application read paths
+
+Cached results are stored under keys that embed a namespace version.
+Bumping the version invalidates every key in the namespace at once
+without having to track or delete the individual keys.
+"""
+from django.core.cache import cache
+
+VERSION_TIMEOUT = None  # versions never expire on their own
+
+# Namespace for results spanning all applications (list facet counts)
+APPLICATIONS_NAMESPACE = 'applications'
+
+
+def _version_key(namespace):
+    return f"ats:version:{namespace}"
+
+
+def get_version(namespace):
+    """Return the current version number for a cache namespace"""
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), 1, VERSION_TIMEOUT)
+        version = cache.get(_version_key(namespace), 1)
+    return version
+
+
+def bump_version(namespace):
+    """Invalidate every key in a namespace"""
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        # Key missing (evicted or never read) - start a fresh version
+        cache.set(_version_key(namespace), 2, VERSION_TIMEOUT)
+
+
+def make_key(namespace, *parts):
+    """Build a cache key bound to the namespace's current version"""
+    suffix = ':'.join(str(part) for part in parts)
+    return f"ats:{namespace}:v{get_version(namespace)}:{suffix}"
+
+
+def job_namespace(job_id):
+    """Namespace for per-job cached data (leaderboards)"""
+    return f"job:{job_id}"
+
+
+def invalidate_applications():
+    """Drop cached cross-job results after any application write"""
+    bump_version(APPLICATIONS_NAMESPACE)
+
+
+def invalidate_job(job_id):
+    """Drop cached per-job results after a score or status write"""
+    bump_version(job_namespace(job_id))
+    invalidate_applications()
@@ -0,0 +1,192 @@
+"""
+Fast bulk deletion for jobs and applications
+
+Django's deletion collector loads every related Application and
+ApplicationStatusHistory instance into memory to cascade and send
+signals, and never removes resume files. This path instead deletes by
+primary key in indexed batches with plain DELETE statements, writes the
+tombstones and cache invalidations the signals would have, and queues
+the resume files for a background sweep.
+"""
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.jobs.matching import invalidate_index
+from apps.jobs.models import Job, JobDeletion
+from .archive import decompress
+from .caching import invalidate_job
+from .models import (
+    Application, ApplicationStatusHistory, ApplicationTombstone,
+    ArchivedApplication, PendingFileDeletion, ResumeText
+)
+from .resume_search import remove_from_index
+
+logger = logging.getLogger(__name__)
+
+
+def _queue_files(names):
+    PendingFileDeletion.objects.bulk_create(
+        [PendingFileDeletion(name=name) for name in names if name]
+    )
+
+
+def delete_applications(application_ids):
+    """
+    Delete applications by id without loading model instances
+
+    Returns the number of applications deleted. Callers pass batches of
+    at most DELETE_BATCH_SIZE ids.
+    """
+    rows = list(
+        Application.objects.filter(id__in=application_ids)
+        .values_list('id', 'job_id', 'resume_file')
+    )
+    if not rows:
+        return 0
+    ids = [row[0] for row in rows]
+
+    with transaction.atomic():
+        ApplicationTombstone.objects.bulk_create([
+            ApplicationTombstone(application_id=application_id, job_id=job_id)
+            for application_id, job_id, _ in rows
+        ])
+        _queue_files(resume_file for _, _, resume_file in rows)
+        ApplicationStatusHistory.objects.filter(application_id__in=ids).delete()
+        ResumeText.objects.filter(application_id__in=ids).delete()
+        remove_from_index(ids)
+        # Dependents are gone and the post_delete work is done above, so
+        # skip the collector and issue a single DELETE
+        Application.objects.filter(id__in=ids)._raw_delete(Application.objects.db)
+
+    for job_id in {row[1] for row in rows}:
+        invalidate_job(job_id)
+    return len(ids)
+
+
+def _delete_archived(job_id, batch_size):
+    while True:
+        batch = list(
+            ArchivedApplication.objects.filter(job_id=job_id)
+            .values_list('id', 'data')[:batch_size]
+        )
+        if not batch:
+            return
+        with transaction.atomic():
+            _queue_files(decompress(data).get('resume_file') for _, data in batch)
+            ArchivedApplication.objects.filter(id__in=[row[0] for row in batch]).delete()
+
+
+def start_job_deletion(job, user):
+    """
+    Delete a job and everything under it
+
+    Small jobs are deleted inline; larger ones in a background thread.
+    Returns the JobDeletion progress record.
+    """
+    total = job.applications.count()
+    deletion = JobDeletion.objects.create(
+        job_id=job.id,
+        job_title=job.title,
+        total=total,
+        started_by=user
+    )
+    # Stop new applications while the delete is running
+    Job.objects.filter(pk=job.pk).update(status='closed', closed_at=timezone.now())
+    invalidate_index()
+
+    if total <= settings.JOB_DELETE_INLINE_LIMIT:
+        run_job_deletion(deletion.pk)
+        deletion.refresh_from_db()
+    else:
+        threading.Thread(
+            target=_run_in_thread,
+            args=(deletion.pk,),
+            name=f"job-deletion-{deletion.pk}",
+            daemon=True
+        ).start()
+    return deletion
+
+
+def _run_in_thread(deletion_id):
+    try:
+        run_job_deletion(deletion_id)
+    finally:
+        connection.close()
+
+
+def run_job_deletion(deletion_id):
+    deletion = JobDeletion.objects.get(pk=deletion_id)
+    batch_size = settings.DELETE_BATCH_SIZE
+    try:
+        while True:
+            ids = list(
+                Application.objects.filter(job_id=deletion.job_id)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            deleted = delete_applications(ids)
+            JobDeletion.objects.filter(pk=deletion_id).update(deleted=F('deleted') + deleted)
+
+        _delete_archived(deletion.job_id, batch_size)
+        # Only small dependents remain, so the collector is cheap now
+        Job.objects.filter(pk=deletion.job_id).delete()
+
+        JobDeletion.objects.filter(pk=deletion_id).update(
+            status='completed',
+            finished_at=timezone.now()
+        )
+        logger.info(f"Deleted job {deletion.job_id} and {deletion.total} applications")
+    except Exception as e:
+        logger.error(f"Deleting job {deletion.job_id} failed: {str(e)}")
+        JobDeletion.objects.filter(pk=deletion_id).update(
+            status='failed',
+            error=str(e),
+            finished_at=timezone.now()
+        )
+        return
+
+    start_file_sweep()
+
+
+def sweep_pending_files(limit=None):
+    """Remove queued resume files from storage, return the number removed"""
+    storage = Application._meta.get_field('resume_file').storage
+    batch_size = settings.DELETE_BATCH_SIZE
+    removed = 0
+    while limit is None or removed < limit:
+        batch = list(PendingFileDeletion.objects.all()[:batch_size])
+        if not batch:
+            break
+        for pending in batch:
+            try:
+                storage.delete(pending.name)
+            except Exception as e:
+                logger.warning(f"Could not delete resume file {pending.name}: {str(e)}")
+        PendingFileDeletion.objects.filter(id__in=[pending.id for pending in batch]).delete()
+        removed += len(batch)
+    return removed
+
+
+_sweep_lock = threading.Lock()
+
+
+def start_file_sweep():
+    """Run the file sweep in the background unless one is already running"""
+    if not _sweep_lock.acquire(blocking=False):
+        return
+
+    def sweep():
+        try:
+            sweep_pending_files()
+        finally:
+            _sweep_lock.release()
+            connection.close()
+
+    threading.Thread(target=sweep, name='resume-file-sweep', daemon=True).start()
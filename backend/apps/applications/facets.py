@@ -0,0 +1,117 @@
+"""
+Facet counts for the applications list
+
+Counts by status, job, score bucket and skill for whatever filters the
+list request carries, one grouped query per facet. Results are cached
+briefly under the normalized filter set in the 'applications' namespace,
+which every application write bumps (see caching.py).
+"""
+import hashlib
+import json
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Q
+
+from .caching import APPLICATIONS_NAMESPACE, make_key
+from .models import Application
+
+FACETS = ('status', 'job', 'score', 'skills')
+
+# Query params that don't change which applications match
+NON_FILTER_PARAMS = {'page', 'page_size', 'ordering', 'facets', 'format'}
+
+# Expand each application's parsed_skills array into rows, per vendor
+SKILL_ROWS_SQL = {
+    'sqlite': "applications_application a, json_each(a.parsed_skills) s",
+    'mysql': (
+        "applications_application a JOIN JSON_TABLE(a.parsed_skills, '$[*]' "
+        "COLUMNS (value VARCHAR(100) PATH '$')) s"
+    ),
+    'postgresql': (
+        "applications_application a CROSS JOIN LATERAL "
+        "jsonb_array_elements_text(a.parsed_skills) AS s(value)"
+    ),
+}
+
+
+def filter_key(query_params, facets):
+    """Stable key for a filter set: order of params and values doesn't matter"""
+    filters = {
+        key: sorted(query_params.getlist(key))
+        for key in query_params if key not in NON_FILTER_PARAMS
+    }
+    raw = json.dumps([filters, sorted(facets)], sort_keys=True)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def status_facet(queryset):
+    counts = dict(queryset.order_by().values_list('status').annotate(count=Count('id')))
+    return [
+        {'value': value, 'label': label, 'count': counts.get(value, 0)}
+        for value, label in Application.STATUS_CHOICES
+    ]
+
+
+def job_facet(queryset):
+    rows = (
+        queryset.order_by().values('job_id', 'job__title')
+        .annotate(count=Count('id'))
+        .order_by('-count', 'job_id')[:settings.APPLICATION_FACETS_JOB_LIMIT]
+    )
+    return [{'value': row['job_id'], 'label': row['job__title'], 'count': row['count']} for row in rows]
+
+
+def score_facet(queryset):
+    """Fixed-width score buckets in one conditional aggregate; the last bucket includes 100"""
+    width = settings.APPLICATION_FACETS_SCORE_BUCKET
+    buckets = [(low, min(low + width - 1, 100)) for low in range(0, 101, width)]
+    if len(buckets) > 1 and buckets[-1][0] == 100:
+        # 100 alone would be a bucket of one; fold it into the previous one
+        buckets[-2:] = [(buckets[-2][0], 100)]
+    counts = queryset.order_by().aggregate(**{
+        f'b{low}': Count('id', filter=Q(score__gte=low, score__lte=high))
+        for low, high in buckets
+    })
+    return [{'min': low, 'max': high, 'count': counts[f'b{low}']} for low, high in buckets]
+
+
+def skills_facet(queryset):
+    limit = settings.APPLICATION_FACETS_SKILL_LIMIT
+    rows_sql = SKILL_ROWS_SQL.get(connection.vendor)
+    if rows_sql is None:
+        counter = Counter()
+        for skills in queryset.order_by().values_list('parsed_skills', flat=True).iterator():
+            counter.update(set(skills or []))
+        ranked = sorted(counter.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    else:
+        subquery, params = queryset.order_by().values('id').query.sql_with_params()
+        sql = (
+            f"SELECT s.value, COUNT(DISTINCT a.id) AS count FROM {rows_sql} "
+            f"WHERE a.id IN ({subquery}) "
+            f"GROUP BY s.value ORDER BY count DESC, s.value LIMIT %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [*params, limit])
+            ranked = cursor.fetchall()
+    return [{'value': value, 'count': count} for value, count in ranked]
+
+
+FACET_FUNCTIONS = {
+    'status': status_facet,
+    'job': job_facet,
+    'score': score_facet,
+    'skills': skills_facet,
+}
+
+
+def get_facets(queryset, query_params, facets):
+    """{facet: [buckets]} for the filtered queryset, cached per filter set"""
+    key = make_key(APPLICATIONS_NAMESPACE, 'facets', filter_key(query_params, facets))
+    result = cache.get(key)
+    if result is None:
+        result = {facet: FACET_FUNCTIONS[facet](queryset) for facet in facets}
+        cache.set(key, result, settings.APPLICATION_FACETS_CACHE_TIMEOUT)
+    return result
@@ -0,0 +1,22 @@
+import django_filters
+
+from .models import Application
+
+
+class ApplicationFilter(django_filters.FilterSet):
+    """
+    Application list filters
+
+    Besides job and status: ?min_experience=3&max_experience=8,
+    ?min_education_level=3 (bachelor or higher, see structured_fields.py)
+    and ?education_field=computer (case-insensitive contains).
+    """
+    min_experience = django_filters.NumberFilter(field_name='experience_years', lookup_expr='gte')
+    max_experience = django_filters.NumberFilter(field_name='experience_years', lookup_expr='lte')
+    min_education_level = django_filters.NumberFilter(field_name='education_level', lookup_expr='gte')
+    max_education_level = django_filters.NumberFilter(field_name='education_level', lookup_expr='lte')
+    education_field = django_filters.CharFilter(lookup_expr='icontains')
+
+    class Meta:
+        model = Application
+        fields = ['status', 'job', 'education_level']
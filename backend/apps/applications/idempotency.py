@@ -0,0 +1,77 @@
+"""
+Idempotent application submission
+
+Clients may send an `Idempotency-Key` header; the first response for a
+key is cached and replayed for retries carrying the same key. Without a
+key, a submission matching a recent application on job, email and resume
+hash returns that application instead of storing and parsing the resume
+again. A short cache lock serializes concurrent identical submissions.
+"""
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Application
+
+MAX_KEY_LENGTH = 255
+
+
+def file_sha256(uploaded_file):
+    """Hash an uploaded file chunk by chunk and rewind it"""
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+def request_fingerprint(job_id, candidate_email):
+    """What an idempotency key is bound to; reuse for another request is refused"""
+    return f"{job_id}:{str(candidate_email).strip().lower()}"
+
+
+def _response_key(idempotency_key):
+    return f"ats:idempotency:{hashlib.sha256(idempotency_key.encode()).hexdigest()}"
+
+
+def _lock_key(job_id, candidate_email, resume_sha256):
+    return f"ats:apply-lock:{request_fingerprint(job_id, candidate_email)}:{resume_sha256}"
+
+
+def get_cached_response(idempotency_key):
+    """Return {'fingerprint', 'status', 'data'} for a key, or None"""
+    return cache.get(_response_key(idempotency_key))
+
+
+def store_response(idempotency_key, fingerprint, status_code, data):
+    cache.set(
+        _response_key(idempotency_key),
+        {'fingerprint': fingerprint, 'status': status_code, 'data': data},
+        settings.IDEMPOTENCY_KEY_TTL
+    )
+
+
+def acquire_submission_lock(job_id, candidate_email, resume_sha256):
+    """Return True if no identical submission is currently being processed"""
+    return cache.add(
+        _lock_key(job_id, candidate_email, resume_sha256), 1,
+        settings.IDEMPOTENCY_LOCK_SECONDS
+    )
+
+
+def release_submission_lock(job_id, candidate_email, resume_sha256):
+    cache.delete(_lock_key(job_id, candidate_email, resume_sha256))
+
+
+def find_duplicate(job_id, candidate_email, resume_sha256):
+    """Most recent matching application inside the dedupe window, or None"""
+    since = timezone.now() - timedelta(seconds=settings.APPLICATION_DEDUPE_WINDOW_SECONDS)
+    return Application.objects.filter(
+        job_id=job_id,
+        candidate_email__iexact=candidate_email,
+        resume_sha256=resume_sha256,
+        applied_at__gte=since
+    ).order_by('-applied_at').first()
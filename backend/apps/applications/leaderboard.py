@@ -0,0 +1,42 @@
+"""
+Top-K candidate leaderboard per job
+
+Answers "best-scoring candidates for this job in status X" from the
+(job, status, -score, id) index. Results are cached per job and the
+cache is invalidated whenever a score or status changes for that job.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from .caching import job_namespace, make_key
+from .models import Application
+from .serializers import ApplicationListSerializer
+
+
+def get_leaderboard(job, status=None, min_score=None, limit=10):
+    """
+    Return the top `limit` applications for a job ordered by score
+
+    Ties on score are broken by application id so the order is stable
+    between requests and across pages of the cached list.
+    """
+    max_size = settings.LEADERBOARD_MAX_SIZE
+    limit = max(1, min(limit, max_size))
+
+    key = make_key(job_namespace(job.id), 'leaderboard', status or '*', min_score)
+    entries = cache.get(key)
+
+    if entries is None:
+        queryset = Application.objects.filter(job=job)
+        if status:
+            queryset = queryset.filter(status=status)
+        if min_score is not None:
+            queryset = queryset.filter(score__gte=min_score)
+        queryset = queryset.select_related('job').order_by('-score', 'id')[:max_size]
+
+        entries = [dict(entry) for entry in ApplicationListSerializer(queryset, many=True).data]
+        for rank, entry in enumerate(entries, start=1):
+            entry['rank'] = rank
+        cache.set(key, entries, settings.LEADERBOARD_CACHE_TIMEOUT)
+
+    return entries[:limit]
@@ -0,0 +1,195 @@
+"""
+In-process resume parser backend
+
+Extracts text from PDF (pypdf) and DOCX (the document.xml part) and runs
+the port of the Go text analyzer (text_analyzer.py), in a bounded pool of
+worker processes so a slow or malformed file can't stall a web worker.
+Each worker's address space is capped at LOCAL_PARSER_MEMORY_LIMIT_MB and
+each file gets LOCAL_PARSER_TIMEOUT seconds.
+
+Workers are started with 'spawn' rather than forked from a threaded
+server process; the worker code below does not touch Django.
+"""
+import io
+import logging
+import multiprocessing
+import os
+import resource
+import signal
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from xml.etree import ElementTree
+
+from django.conf import settings
+from pypdf import PdfReader
+
+from .parsing import BaseParserBackend, ResumeParseError
+from .text_analyzer import analyze
+
+logger = logging.getLogger(__name__)
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+class ParseTimeout(Exception):
+    pass
+
+
+def file_type(filename):
+    """'pdf', 'docx' or 'unknown', as the Go service detects it"""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.pdf':
+        return 'pdf'
+    if extension in ('.doc', '.docx'):
+        return 'docx'
+    return 'unknown'
+
+
+def extract_pdf_text(source):
+    reader = PdfReader(source)
+    text = ''.join((page.extract_text() or '') + '\n' for page in reader.pages)
+    if not text.strip():
+        raise ResumeParseError("no text content found in PDF")
+    return text
+
+
+def extract_docx_text(source):
+    try:
+        with zipfile.ZipFile(source) as archive:
+            root = ElementTree.fromstring(archive.read('word/document.xml'))
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ResumeParseError(f"failed to read DOCX: {e}")
+
+    paragraphs = []
+    for paragraph in root.iter(f'{WORD_NAMESPACE}p'):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f'{WORD_NAMESPACE}t':
+                parts.append(node.text or '')
+            elif node.tag == f'{WORD_NAMESPACE}tab':
+                parts.append('\t')
+            elif node.tag in (f'{WORD_NAMESPACE}br', f'{WORD_NAMESPACE}cr'):
+                parts.append('\n')
+        paragraphs.append(''.join(parts))
+    text = '\n'.join(paragraphs)
+    if not text.strip():
+        raise ResumeParseError("no text content found in DOCX")
+    return text
+
+
+EXTRACTORS = {
+    'pdf': extract_pdf_text,
+    'docx': extract_docx_text,
+}
+
+
+def _init_worker(memory_limit):
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _on_alarm(signum, frame):
+    raise ParseTimeout()
+
+
+def parse_file(source, filename, job_requirements, timeout):
+    """
+    Worker entry point: extract and analyze one resume
+
+    `source` is a file path or the file's bytes. Every failure comes back
+    as ResumeParseError.
+    """
+    kind = file_type(filename)
+    if kind not in EXTRACTORS:
+        raise ResumeParseError(f"unsupported file type: {kind} (must be PDF or DOCX)")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    # Tasks run on the worker's main thread, so SIGALRM interrupts them
+    signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        text = EXTRACTORS[kind](source)
+        return analyze(text, job_requirements)
+    except ResumeParseError:
+        raise
+    except ParseTimeout:
+        raise ResumeParseError(f"Parsing timed out after {timeout}s")
+    except MemoryError:
+        raise ResumeParseError("Parsing exceeded the memory limit")
+    except Exception as e:
+        raise ResumeParseError(f"Failed to parse resume: {e}")
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _read_source(resume_file):
+    """Local path for file system storage, the file's bytes otherwise"""
+    try:
+        return resume_file.path
+    except NotImplementedError:
+        with resume_file.open('rb') as f:
+            return f.read()
+
+
+class LocalParserBackend(BaseParserBackend):
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=settings.LOCAL_PARSER_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(settings.LOCAL_PARSER_MEMORY_LIMIT_MB * 1024 * 1024,),
+                    max_tasks_per_child=settings.LOCAL_PARSER_MAX_TASKS_PER_CHILD or None,
+                )
+            return self._executor
+
+    def _discard_executor(self, executor):
+        """
+        Replace a broken or stuck pool; the next parse starts a new one
+
+        A worker stuck past its alarm (e.g. inside C code) never exits on
+        its own, so the old pool's processes are terminated, failing any
+        other parse still running on them.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        # No public API for this before Python 3.14 (terminate_workers)
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+
+    def parse(self, application, job_requirements, base_url=None, session=None):
+        resume_file = application.resume_file
+        timeout = settings.LOCAL_PARSER_TIMEOUT
+        executor = self._get_executor()
+        try:
+            future = executor.submit(
+                parse_file, _read_source(resume_file), resume_file.name, job_requirements, timeout
+            )
+            # Covers time queued behind other files plus this file's own limit
+            return future.result(timeout=settings.LOCAL_PARSER_QUEUE_TIMEOUT + timeout)
+        except FutureTimeout:
+            if not future.cancel():
+                # Running past its alarm: don't hand this pool more work
+                logger.warning(f"Local parser worker stuck on application {application.id}, replacing pool")
+                self._discard_executor(executor)
+            raise ResumeParseError("Local parser pool did not finish in time")
+        except BrokenProcessPool:
+            logger.warning(f"Local parser worker died on application {application.id}, replacing pool")
+            self._discard_executor(executor)
+            raise ResumeParseError("Local parser worker exited unexpectedly")
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.applications.archive import archive_job, jobs_due_for_archival
+
+
+class Command(BaseCommand):
+    help = 'Move applications for jobs closed longer than ARCHIVE_AFTER_DAYS into the archive'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days', type=int, default=None,
+            help='Override ARCHIVE_AFTER_DAYS'
+        )
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='List the jobs that would be archived without moving anything'
+        )
+
+    def handle(self, *args, **options):
+        jobs = jobs_due_for_archival(options['older_than_days'])
+        total = 0
+        for job in jobs:
+            if options['dry_run']:
+                self.stdout.write(f'Would archive job {job.id} "{job.title}" (closed {job.closed_at:%Y-%m-%d})')
+                continue
+            archived = archive_job(job, batch_size=options['batch_size'])
+            total += archived
+            self.stdout.write(f'Archived {archived} applications for job {job.id} "{job.title}"')
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Archived {total} applications'))
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.applications.caching import invalidate_job
+from apps.applications.models import Application
+from apps.applications.structured_fields import STRUCTURED_FIELDS, apply_structured_fields
+
+
+class Command(BaseCommand):
+    help = (
+        'Derive experience_years, education_level and education_field from '
+        'each application\'s parsed experience/education text, in id-ordered batches'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--start-id', type=int, default=0, help='Resume after this application id')
+
+    def handle(self, *args, **options):
+        last_id = options['start_id']
+        scanned = updated = 0
+        jobs = set()
+        while True:
+            batch = list(
+                Application.objects.filter(id__gt=last_id)
+                .only('id', 'job_id', 'parsed_experience', 'parsed_education', *STRUCTURED_FIELDS)
+                .order_by('id')[:options['batch_size']]
+            )
+            if not batch:
+                break
+
+            changed = []
+            for application in batch:
+                before = [getattr(application, field) for field in STRUCTURED_FIELDS]
+                apply_structured_fields(application)
+                if [getattr(application, field) for field in STRUCTURED_FIELDS] != before:
+                    # Sync clients pick changes up by updated_at
+                    application.updated_at = timezone.now()
+                    changed.append(application)
+
+            with transaction.atomic():
+                Application.objects.bulk_update(changed, STRUCTURED_FIELDS + ['updated_at'])
+            jobs.update(application.job_id for application in changed)
+
+            scanned += len(batch)
+            updated += len(changed)
+            last_id = batch[-1].id
+            self.stdout.write(f'Scanned {scanned} (last id {last_id}), updated {updated}')
+
+        for job_id in jobs:
+            invalidate_job(job_id)
+        self.stdout.write(self.style.SUCCESS(f'Backfilled {updated} of {scanned} applications'))
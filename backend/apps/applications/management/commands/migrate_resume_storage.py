@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.files.storage import FileSystemStorage, storages
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.applications.archive import decompress
+from apps.applications.models import Application, ArchivedApplication
+
+
+class Command(BaseCommand):
+    help = (
+        'Copy resume files between storages in parallel, keeping their names '
+        '(e.g. from local disk to the S3 resume storage). Safe to re-run: files '
+        'already present with the same size are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', default='default', help='Storage alias to copy from')
+        parser.add_argument('--destination', default='resumes', help='Storage alias to copy to')
+        parser.add_argument('--workers', type=int, default=8)
+        parser.add_argument(
+            '--delete-source', action='store_true',
+            help='Delete each file from the source once copied and verified (never a skipped file)'
+        )
+
+    def handle(self, *args, **options):
+        source = storages[options['source']]
+        destination = storages[options['destination']]
+        if self._location(source) == self._location(destination):
+            raise CommandError(
+                f"'{options['source']}' and '{options['destination']}' are the same location; "
+                f"nothing to copy (with --delete-source every file would be lost)"
+            )
+        workers = options['workers']
+        counts = {'copied': 0, 'skipped': 0, 'failed': 0}
+
+        def copy(name):
+            if not source.exists(name) and destination.exists(name):
+                # Moved by an earlier --delete-source run
+                result = 'skipped'
+            elif destination.exists(name) and destination.size(name) == source.size(name):
+                result = 'skipped'
+            else:
+                if destination.exists(name):
+                    destination.delete(name)
+                with source.open(name, 'rb') as f:
+                    saved = destination.save(name, f)
+                if saved != name:
+                    raise RuntimeError(f"stored as {saved}")
+                if destination.size(name) != source.size(name):
+                    raise RuntimeError('size differs after copy, source kept')
+                result = 'copied'
+                # Only a copy made and checked by this run frees the source
+                if options['delete_source']:
+                    source.delete(name)
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {}
+            for name in self._resume_names():
+                if len(pending) >= workers * 4:
+                    self._collect(pending, counts, wait(pending, return_when=FIRST_COMPLETED).done)
+                pending[executor.submit(copy, name)] = name
+            self._collect(pending, counts, wait(pending).done)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Copied {counts['copied']}, skipped {counts['skipped']}, failed {counts['failed']}"
+        ))
+
+    def _collect(self, pending, counts, done):
+        for future in done:
+            name = pending.pop(future)
+            try:
+                counts[future.result()] += 1
+            except Exception as e:
+                counts['failed'] += 1
+                self.stderr.write(f'{name}: {e}')
+        total = sum(counts.values())
+        if done and total % 500 < len(done):
+            self.stdout.write(f'{total} files processed')
+
+    def _location(self, storage):
+        """Where a storage keeps its files, to tell two aliases for the same place"""
+        if isinstance(storage, FileSystemStorage):
+            return ('file', os.path.realpath(storage.location))
+        if hasattr(storage, 'bucket_name'):
+            return ('s3', storage.endpoint_url, storage.bucket_name, storage.location)
+        return (type(storage), id(storage))
+
+    def _resume_names(self):
+        """Every stored resume name, hot and archived, once each"""
+        seen = set()
+        hot = Application.objects.exclude(resume_file='').values_list('resume_file', flat=True)
+        archived = (
+            decompress(data).get('resume_file')
+            for data in ArchivedApplication.objects.values_list('data', flat=True).iterator(chunk_size=1000)
+        )
+        for names in (hot.iterator(chunk_size=1000), archived):
+            for name in names:
+                if name and name not in seen:
+                    seen.add(name)
+                    yield name
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.applications.uploads import prune_expired_uploads
+
+
+class Command(BaseCommand):
+    help = 'Delete expired resumable uploads and their temp files'
+
+    def handle(self, *args, **options):
+        removed = prune_expired_uploads()
+        self.stdout.write(self.style.SUCCESS(f'Removed {removed} expired uploads'))
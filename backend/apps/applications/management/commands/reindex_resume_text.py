@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.applications.models import ResumeText
+from apps.applications.resume_search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the resume full-text index from stored resume text'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if backend is None:
+            self.stderr.write('No full-text backend for this database')
+            return
+
+        indexed, last_id = 0, 0
+        while True:
+            batch = list(
+                ResumeText.objects.filter(application_id__gt=last_id)
+                .order_by('application_id')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            backend.index([(row.application_id, row.text) for row in batch])
+            indexed += len(batch)
+            last_id = batch[-1].application_id
+
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} resumes'))
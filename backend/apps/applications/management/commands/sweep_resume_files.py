@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.applications.deletion import sweep_pending_files
+
+
+class Command(BaseCommand):
+    help = 'Remove resume files queued for deletion by bulk deletes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=None, help='Stop after about this many files')
+
+    def handle(self, *args, **options):
+        removed = sweep_pending_files(limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f'Removed {removed} resume files'))
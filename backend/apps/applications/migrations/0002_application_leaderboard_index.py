@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'status', '-score', 'id'], name='application_job_id_60939d_idx'),
+        ),
+    ]
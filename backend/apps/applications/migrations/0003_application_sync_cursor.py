@@ -0,0 +1,29 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_application_leaderboard_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('application_id', models.BigIntegerField()),
+                ('job_id', models.BigIntegerField(db_index=True)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['updated_at', 'id'], name='application_updated_1aac0a_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_closed_at'),
+        ('applications', '0004_reparserun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('candidate_name', models.CharField(max_length=200)),
+                ('candidate_email', models.EmailField(max_length=254)),
+                ('status', models.CharField(choices=[('new', 'New'), ('screening', 'Screening'), ('phone_screen', 'Phone Screen'), ('interview', 'Interview'), ('offer', 'Offer'), ('rejected', 'Rejected')], max_length=20)),
+                ('score', models.IntegerField(default=0)),
+                ('applied_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('data', models.BinaryField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='jobs.job')),
+            ],
+            options={
+                'ordering': ['-applied_at'],
+                'indexes': [models.Index(fields=['job', 'status'], name='application_job_id_c5da49_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_archivedapplication'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingFileDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_pendingfiledeletion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='resume_sha256',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'candidate_email', 'resume_sha256'], name='application_job_id_39f2c5_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_resume_sha256'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64, unique=True)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveIntegerField()),
+                ('offset', models.PositiveIntegerField(default=0)),
+                ('sha256', models.CharField(blank=True, max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_search_index(apps, schema_editor):
+    """Create the vendor's full-text index over extracted resume text"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'mysql':
+        schema_editor.execute(
+            "CREATE TABLE applications_resume_search ("
+            "application_id BIGINT NOT NULL PRIMARY KEY, "
+            "body MEDIUMTEXT NOT NULL, "
+            "FULLTEXT INDEX applications_resume_search_body (body)"
+            ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE applications_resume_fts USING fts5"
+            "(body, tokenize='porter unicode61')"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'mysql':
+        schema_editor.execute("DROP TABLE IF EXISTS applications_resume_search")
+    elif vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS applications_resume_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_resumeupload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeText',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='resume_text', serialize=False, to='applications.application')),
+                ('data', models.BinaryField()),
+                ('length', models.PositiveIntegerField(default=0, help_text='Characters before compression')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
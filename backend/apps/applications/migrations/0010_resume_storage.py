@@ -0,0 +1,19 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:45
+
+import apps.applications.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0009_resumetext'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='resume_file',
+            field=models.FileField(storage=apps.applications.storage.resume_storage, upload_to='resumes/%Y/%m/%d/'),
+        ),
+    ]
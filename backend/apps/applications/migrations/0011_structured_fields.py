@@ -0,0 +1,40 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0010_resume_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='education_field',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='education_level',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Diploma'), (2, 'Associate'), (3, 'Bachelor'), (4, 'Master'), (5, 'Doctorate')], null=True),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='experience_years',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'experience_years'], name='application_job_id_e93ece_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'education_level'], name='application_job_id_4d2742_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'education_field'], name='application_job_id_49743e_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:57
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('applications', '0011_structured_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedView',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('criteria', models.JSONField(blank=True, default=dict)),
+                ('ordering', models.CharField(choices=[('-score', '-score'), ('score', 'score'), ('-applied_at', '-applied_at'), ('applied_at', 'applied_at'), ('-candidate_name', '-candidate_name'), ('candidate_name', 'candidate_name'), ('-experience_years', '-experience_years'), ('experience_years', 'experience_years'), ('-education_level', '-education_level'), ('education_level', 'education_level')], default='-score', max_length=30)),
+                ('results', models.BinaryField(blank=True, null=True)),
+                ('result_count', models.PositiveIntegerField(default=0)),
+                ('truncated', models.BooleanField(default=False, help_text='More matches than SAVED_VIEW_MAX_RESULTS')),
+                ('sync_token', models.CharField(blank=True, max_length=255)),
+                ('refreshed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_views', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='savedview',
+            constraint=models.UniqueConstraint(fields=('user', 'name'), name='unique_saved_view_name'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.27 on 2026-10-19 03:01
+
+from django.db import migrations, models
+
+from ats_backend.online_migrations import AddIndexOnline
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0012_savedview'),
+    ]
+
+    operations = [
+        # Built online: the history table grows with every status change
+        AddIndexOnline(
+            model_name='applicationstatushistory',
+            index=models.Index(fields=['application', '-changed_at'], name='status_history_app_changed'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-19 03:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0013_status_history_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reparserun',
+            name='generation',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,6 +1,17 @@
-from django.db import models
+import zlib
+
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from apps.jobs.models import Job
+from apps.realtime.events import (
+    publish_application_event, SCORE_UPDATED, STATUS_CHANGED
+)
+from apps.webhooks.outbox import (
+    record_event, APPLICATION_CREATED, APPLICATION_STATUS_CHANGED
+)
+from .caching import invalidate_applications, invalidate_job
+from .storage import resume_storage
+from .structured_fields import EDUCATION_LEVEL_CHOICES
 
 
 class Application(models.Model):
@@ -27,7 +38,8 @@ class Application(models.Model):
     cover_letter = models.TextField(blank=True)
     
     # Resume file
-    resume_file = models.FileField(upload_to='resumes/%Y/%m/%d/')
+    resume_file = models.FileField(upload_to='resumes/%Y/%m/%d/', storage=resume_storage)
+    resume_sha256 = models.CharField(max_length=64, blank=True)
     
     # Application status
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='new')
@@ -40,6 +52,13 @@ class Application(models.Model):
     parsed_phone = models.CharField(max_length=20, blank=True)
     score = models.IntegerField(default=0, help_text="Matching score 0-100")
     
+    # Typed copies of the parsed text, for range filters (structured_fields.py)
+    experience_years = models.PositiveSmallIntegerField(null=True, blank=True)
+    education_level = models.PositiveSmallIntegerField(
+        choices=EDUCATION_LEVEL_CHOICES, null=True, blank=True
+    )
+    education_field = models.CharField(max_length=100, blank=True)
+    
     # Timestamps
     applied_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -49,25 +68,72 @@ class Application(models.Model):
         indexes = [
             models.Index(fields=['status', 'applied_at']),
             models.Index(fields=['job', 'status']),
+            # Leaderboard: top-K by score within a job/status, stable ties on id
+            models.Index(fields=['job', 'status', '-score', 'id']),
+            # Incremental sync cursor: (updated_at, id)
+            models.Index(fields=['updated_at', 'id']),
+            # Duplicate submission check: job + email + resume hash
+            models.Index(fields=['job', 'candidate_email', 'resume_sha256']),
+            # Recruiter range filters within a job
+            models.Index(fields=['job', 'experience_years']),
+            models.Index(fields=['job', 'education_level']),
+            models.Index(fields=['job', 'education_field']),
         ]
     
     def __str__(self):
         return f"{self.candidate_name} - {self.job.title} ({self.status})"
     
     def save(self, *args, **kwargs):
-        """Track status changes"""
-        if self.pk:
-            # Get old instance to compare status
-            old_instance = Application.objects.get(pk=self.pk)
+        """Track status changes and record outbox events in the same transaction"""
+        changed_by = kwargs.pop('changed_by', None)
+        old_instance = None
+        with transaction.atomic():
+            if self.pk:
+                # Lock the row so concurrent changes to one application
+                # write their history and events one after the other
+                old_instance = Application.objects.select_for_update().get(pk=self.pk)
+                if old_instance.status != self.status:
+                    # Status changed - create history entry
+                    ApplicationStatusHistory.objects.create(
+                        application=self,
+                        from_status=old_instance.status,
+                        to_status=self.status,
+                        changed_by=changed_by
+                    )
+            super().save(*args, **kwargs)
+            
+            # Webhook deliveries (apps/webhooks)
+            if old_instance is None:
+                record_event(
+                    self, APPLICATION_CREATED,
+                    candidate_name=self.candidate_name,
+                    candidate_email=self.candidate_email,
+                    status=self.status,
+                    applied_at=self.applied_at.isoformat()
+                )
+            elif old_instance.status != self.status:
+                record_event(
+                    self, APPLICATION_STATUS_CHANGED,
+                    from_status=old_instance.status, to_status=self.status
+                )
+        
+        # Leaderboards are keyed on score and status - drop them when either moves
+        if (old_instance is None or old_instance.status != self.status
+                or old_instance.score != self.score):
+            invalidate_job(self.job_id)
+        else:
+            # Any other field may still move facet counts
+            invalidate_applications()
+        
+        # Push changes to open SSE streams
+        if old_instance is not None:
             if old_instance.status != self.status:
-                # Status changed - create history entry
-                ApplicationStatusHistory.objects.create(
-                    application=self,
-                    from_status=old_instance.status,
-                    to_status=self.status,
-                    changed_by=kwargs.pop('changed_by', None)
+                publish_application_event(
+                    self, STATUS_CHANGED,
+                    from_status=old_instance.status, to_status=self.status
                 )
-        super().save(*args, **kwargs)
+            if old_instance.score != self.score:
+                publish_application_event(self, SCORE_UPDATED, score=self.score)
 
 
 class ApplicationStatusHistory(models.Model):
@@ -94,6 +160,206 @@ class ApplicationStatusHistory(models.Model):
     class Meta:
         ordering = ['-changed_at']
         verbose_name_plural = 'Application status histories'
+        indexes = [
+            # An application's history, newest first
+            models.Index(fields=['application', '-changed_at'], name='status_history_app_changed'),
+        ]
     
     def __str__(self):
         return f"{self.application.candidate_name}: {self.from_status} → {self.to_status}"
+
+
+class ApplicationTombstone(models.Model):
+    """
+    Record of a deleted application so polling clients can drop it
+    from their local mirror
+    """
+    application_id = models.BigIntegerField()
+    job_id = models.BigIntegerField(db_index=True)
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    
+    class Meta:
+        ordering = ['id']
+    
+    def __str__(self):
+        return f"Application {self.application_id} deleted at {self.deleted_at}"
+
+
+class ReparseRun(models.Model):
+    """
+    Progress of a job-level batch re-parse (see reparse.py)
+    """
+    STATUS_CHOICES = [
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('cancelled', 'Cancelled'),
+        ('failed', 'Failed'),
+    ]
+    
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='reparse_runs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='running')
+    started_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='reparse_runs'
+    )
+    
+    # Progress
+    total = models.PositiveIntegerField(default=0)
+    done = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    
+    # Resume point: applications are processed in id order
+    last_application_id = models.BigIntegerField(default=0)
+    # Bumped on every resume; only the worker of the current generation writes
+    generation = models.PositiveIntegerField(default=0)
+    # Base URL the parser downloads resumes from
+    base_url = models.CharField(max_length=200)
+    error = models.TextField(blank=True)
+    
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-started_at']
+    
+    def __str__(self):
+        return f"Reparse {self.job_id} ({self.status}) {self.done + self.failed}/{self.total}"
+    
+    @property
+    def remaining(self):
+        return max(self.total - self.done - self.failed, 0)
+
+
+class ArchivedApplication(models.Model):
+    """
+    Cold copy of an application (and its status history) for a job that
+    has been closed for a long time - see archive.py
+    
+    Only the columns used for listing are kept as columns; everything
+    else is stored as zlib-compressed JSON in `data`.
+    """
+    # Same id as the original application so it can be restored in place
+    id = models.BigIntegerField(primary_key=True)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='archived_applications')
+    candidate_name = models.CharField(max_length=200)
+    candidate_email = models.EmailField()
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    score = models.IntegerField(default=0)
+    applied_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    data = models.BinaryField()
+    
+    class Meta:
+        ordering = ['-applied_at']
+        indexes = [
+            models.Index(fields=['job', 'status']),
+        ]
+    
+    def __str__(self):
+        return f"{self.candidate_name} - archived ({self.status})"
+
+
+class PendingFileDeletion(models.Model):
+    """
+    Resume file left behind by a bulk delete, removed by the file sweep
+    """
+    name = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['id']
+    
+    def __str__(self):
+        return self.name
+
+
+class ResumeUpload(models.Model):
+    """
+    Resumable resume upload in progress
+
+    Chunks are appended to a temp file at `offset`; once `offset` reaches
+    `size` the upload is complete and its token can be passed to the
+    create endpoint as `upload_token` until `expires_at`.
+    """
+    token = models.CharField(max_length=64, unique=True)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveIntegerField()
+    offset = models.PositiveIntegerField(default=0)
+    sha256 = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+    
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
+    
+    @property
+    def is_complete(self):
+        return self.offset == self.size
+
+
+class ResumeText(models.Model):
+    """
+    Full text extracted from an application's resume, zlib-compressed
+
+    Kept out of the application row so listings never load it; the
+    searchable copy lives in the full-text index (see resume_search.py).
+    """
+    application = models.OneToOneField(
+        Application,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='resume_text'
+    )
+    data = models.BinaryField()
+    length = models.PositiveIntegerField(default=0, help_text="Characters before compression")
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"Resume text for application {self.application_id}"
+    
+    @property
+    def text(self):
+        return zlib.decompress(bytes(self.data)).decode()
+
+
+class SavedView(models.Model):
+    """
+    A recruiter's saved application query with its results materialized
+
+    `results` holds the matching [sort_key, id] pairs in list order as
+    zlib-compressed JSON; `sync_token` is the sync cursor they are
+    current as of, so a refresh only looks at what changed since (see
+    saved_views.py).
+    """
+    SORT_FIELDS = ['score', 'applied_at', 'candidate_name', 'experience_years', 'education_level']
+    ORDERING_CHOICES = [
+        (prefix + field, prefix + field) for field in SORT_FIELDS for prefix in ('-', '')
+    ]
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_views')
+    name = models.CharField(max_length=200)
+    criteria = models.JSONField(default=dict, blank=True)
+    ordering = models.CharField(max_length=30, choices=ORDERING_CHOICES, default='-score')
+    
+    # Materialized results
+    results = models.BinaryField(null=True, blank=True)
+    result_count = models.PositiveIntegerField(default=0)
+    truncated = models.BooleanField(default=False, help_text="More matches than SAVED_VIEW_MAX_RESULTS")
+    sync_token = models.CharField(max_length=255, blank=True)
+    refreshed_at = models.DateTimeField(null=True, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['name']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'name'], name='unique_saved_view_name'),
+        ]
+    
+    def __str__(self):
+        return f"{self.name} ({self.user})"
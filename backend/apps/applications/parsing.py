@@ -0,0 +1,114 @@
+"""
+Resume parsing
+Feature #6: Resume Parsing & Scoring
+
+Parsing goes through a pluggable backend chosen by RESUME_PARSER_BACKEND:
+- RemoteParserBackend: the Golang microservice over HTTP (default)
+- LocalParserBackend: in-process process pool (see local_parser.py)
+
+Both return the service's ParsedData shape.
+"""
+from urllib.parse import urljoin
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .storage import signed_url
+from .structured_fields import STRUCTURED_FIELDS, apply_structured_fields
+
+# Application fields written from a parse result
+PARSED_FIELDS = [
+    'parsed_skills', 'parsed_experience', 'parsed_education',
+    'parsed_email', 'parsed_phone', 'score'
+] + STRUCTURED_FIELDS
+
+
+class ResumeParseError(Exception):
+    """Raised when the parser answers with an error"""
+
+
+def build_resume_url(application, base_url):
+    """Absolute URL the parser downloads the resume from (presigned on object storage)"""
+    return urljoin(base_url, signed_url(application.resume_file.name, settings.RESUME_PARSER_URL_EXPIRY))
+
+
+def request_parse(resume_url, job_requirements, session=None):
+    """
+    Call the parser service for one resume and return its `data` payload
+
+    Raises ResumeParseError for error responses; network errors from
+    `requests` propagate to the caller.
+    """
+    http = session or requests
+    response = http.post(
+        f"{settings.GOLANG_SERVICE_URL}/parse-resume",
+        json={
+            "file_url": resume_url,
+            "job_requirements": job_requirements
+        },
+        timeout=180
+    )
+
+    if response.status_code != 200:
+        raise ResumeParseError(f"Golang service error: {response.status_code} - {response.text}")
+
+    data = response.json()
+    if not data.get('success'):
+        raise ResumeParseError(f"Golang service returned error: {data.get('error')}")
+    return data.get('data', {})
+
+
+class BaseParserBackend:
+    """
+    Parser backend interface
+
+    parse() returns the ParsedData dict for an application's resume.
+    `base_url` is the absolute URL the site is served from, for backends
+    that fetch the resume over HTTP; `session` comes from make_session().
+    """
+    def parse(self, application, job_requirements, base_url, session=None):
+        raise NotImplementedError
+
+    def make_session(self, concurrency):
+        """Shared state for many parse() calls from `concurrency` threads"""
+        return None
+
+
+class RemoteParserBackend(BaseParserBackend):
+    """The Golang parser service at GOLANG_SERVICE_URL"""
+    def parse(self, application, job_requirements, base_url, session=None):
+        return request_parse(build_resume_url(application, base_url), job_requirements, session)
+
+    def make_session(self, concurrency):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+
+_backend = None
+
+
+def get_parser_backend():
+    global _backend
+    if _backend is None:
+        _backend = import_string(settings.RESUME_PARSER_BACKEND)()
+    return _backend
+
+
+def parse_resume(application, job_requirements, base_url, session=None):
+    """Parse one application's resume with the configured backend"""
+    return get_parser_backend().parse(application, job_requirements, base_url, session)
+
+
+def apply_parsed_data(application, parsed_data):
+    """Copy a parse result onto an application (does not save)"""
+    application.parsed_skills = parsed_data.get('skills', [])
+    application.parsed_experience = parsed_data.get('experience', '')
+    application.parsed_education = parsed_data.get('education', '')
+    application.parsed_email = parsed_data.get('email', '')
+    application.parsed_phone = parsed_data.get('phone', '')
+    application.score = parsed_data.get('score', 0)
+    apply_structured_fields(application)
@@ -0,0 +1,213 @@
+"""
+Batch re-parse of every application for a job
+
+Applications are walked in id order in batches. Each batch is fanned out
+to the parser backend with bounded concurrency (over a pooled HTTP
+session for the remote parser), and the results are written back with one bulk UPDATE per batch together
+with the run's progress and resume cursor. A run can be cancelled
+between batches and resumed from its cursor later, including after the
+worker process died. The run's updated_at is its heartbeat, bumped after
+every parse, so a slow batch is not mistaken for a dead worker.
+
+Each start or resume bumps the run's generation, and a worker only keeps
+going and writes while its generation is current. A worker still
+finishing a batch when its run is cancelled and resumed therefore drops
+that batch instead of running alongside the new worker.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from apps.realtime.events import publish_application_event, PARSE_COMPLETE
+from apps.webhooks.outbox import record_events, APPLICATION_PARSED
+from .caching import invalidate_job
+from .models import Application, ReparseRun
+from .parsing import PARSED_FIELDS, apply_parsed_data, get_parser_backend, parse_resume
+from .resume_search import store_resume_texts
+
+logger = logging.getLogger(__name__)
+
+
+class ReparseConflict(Exception):
+    """Raised when a run is already in progress for the job"""
+
+
+def is_stale(run):
+    """A running run whose worker stopped reporting progress"""
+    cutoff = timezone.now() - timedelta(seconds=settings.REPARSE_STALE_SECONDS)
+    return run.status == 'running' and run.updated_at < cutoff
+
+
+def start_reparse(job, user, base_url, resume=False):
+    """
+    Start a new run for a job, or resume its latest unfinished one
+
+    Raises ReparseConflict if a live run is already in progress.
+    """
+    with transaction.atomic():
+        # The job row lock serializes concurrent starts for the same job
+        Job.objects.select_for_update().get(pk=job.pk)
+        latest = job.reparse_runs.first()
+        if latest and latest.status == 'running' and not is_stale(latest):
+            raise ReparseConflict(f"Reparse run {latest.id} is already in progress")
+
+        if resume and latest and latest.status != 'completed':
+            run = latest
+            run.status = 'running'
+            run.base_url = base_url
+            run.error = ''
+            run.finished_at = None
+            run.generation += 1
+            run.save()
+        else:
+            if latest and latest.status == 'running':
+                # Stale run left behind by a dead worker
+                ReparseRun.objects.filter(pk=latest.pk).update(
+                    status='failed',
+                    error='Worker stopped reporting progress',
+                    finished_at=timezone.now()
+                )
+            run = ReparseRun.objects.create(
+                job=job,
+                started_by=user,
+                base_url=base_url,
+                total=job.applications.count()
+            )
+
+        transaction.on_commit(lambda: threading.Thread(
+            target=execute_run,
+            args=(run.pk, run.generation),
+            name=f"reparse-run-{run.pk}",
+            daemon=True
+        ).start())
+    return run
+
+
+def cancel_reparse(run):
+    """Ask the worker to stop after its current batch"""
+    ReparseRun.objects.filter(pk=run.pk, status='running').update(
+        status='cancelled',
+        finished_at=timezone.now()
+    )
+    run.refresh_from_db()
+    return run
+
+
+def _current(run_id, generation):
+    """The run's row while this worker still owns it"""
+    return ReparseRun.objects.filter(pk=run_id, status='running', generation=generation)
+
+
+def _heartbeat(run_id, generation):
+    _current(run_id, generation).update(updated_at=timezone.now())
+
+
+def _write_batch(run, generation, parsed, texts, failed, last_application_id):
+    """
+    Persist one batch of results and the run's progress atomically
+
+    Returns False, writing nothing, if the run was resumed by another
+    worker meanwhile. A cancelled run still gets its last batch.
+    """
+    now = timezone.now()
+    for application in parsed:
+        application.updated_at = now
+
+    with transaction.atomic():
+        # First, so the row lock orders this batch against a resume
+        owned = ReparseRun.objects.filter(pk=run.pk, generation=generation).update(
+            done=F('done') + len(parsed),
+            failed=F('failed') + failed,
+            last_application_id=last_application_id,
+            updated_at=now
+        )
+        if not owned:
+            return False
+        Application.objects.bulk_update(parsed, PARSED_FIELDS + ['updated_at'])
+        store_resume_texts(texts)
+        record_events([
+            (application, APPLICATION_PARSED, {'score': application.score, 'skills': application.parsed_skills})
+            for application in parsed
+        ])
+        for application in parsed:
+            publish_application_event(
+                application, PARSE_COMPLETE,
+                score=application.score, skills=application.parsed_skills
+            )
+
+    run.last_application_id = last_application_id
+    if parsed:
+        invalidate_job(run.job_id)
+    return True
+
+
+def execute_run(run_id, generation):
+    """Worker loop - runs in a background thread"""
+    concurrency = settings.REPARSE_CONCURRENCY
+    try:
+        run = ReparseRun.objects.select_related('job').get(pk=run_id)
+        job_requirements = run.job.get_requirements_list()
+        session = get_parser_backend().make_session(concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while _current(run_id, generation).exists():
+                batch = list(
+                    Application.objects
+                    .filter(job_id=run.job_id, id__gt=run.last_application_id)
+                    .only('id', 'job_id', 'resume_file')
+                    .order_by('id')[:settings.REPARSE_BATCH_SIZE]
+                )
+                if not batch:
+                    _current(run_id, generation).update(
+                        status='completed',
+                        finished_at=timezone.now()
+                    )
+                    logger.info(f"Reparse run {run_id} completed for job {run.job_id}")
+                    return
+
+                futures = {
+                    executor.submit(
+                        parse_resume,
+                        application,
+                        job_requirements,
+                        run.base_url,
+                        session
+                    ): application
+                    for application in batch
+                }
+
+                parsed, texts, failed = [], [], 0
+                for future in as_completed(futures):
+                    application = futures[future]
+                    try:
+                        parsed_data = future.result()
+                        apply_parsed_data(application, parsed_data)
+                        parsed.append(application)
+                        if parsed_data.get('text') is not None:
+                            texts.append((application.id, parsed_data['text']))
+                    except Exception as e:
+                        failed += 1
+                        logger.warning(f"Reparse failed for application {application.id}: {str(e)}")
+                    _heartbeat(run_id, generation)
+
+                if not _write_batch(run, generation, parsed, texts, failed, batch[-1].id):
+                    logger.info(f"Reparse run {run_id} was resumed by another worker, stopping")
+                    return
+
+    except Exception as e:
+        logger.error(f"Reparse run {run_id} failed: {str(e)}")
+        ReparseRun.objects.filter(pk=run_id, generation=generation).update(
+            status='failed',
+            error=str(e),
+            finished_at=timezone.now()
+        )
+    finally:
+        connection.close()
+
@@ -0,0 +1,208 @@
+"""
+Full-text candidate search over extracted resume text
+
+The parser returns the resume's full text with each parse result. It is
+stored zlib-compressed in ResumeText, and a plain copy goes into the
+database's full-text index:
+- MySQL: InnoDB table with a FULLTEXT index (applications_resume_search)
+- SQLite: FTS5 virtual table keyed on the application id (local development)
+
+Both are joined to applications_application, so a search scoped to a job
+or status is filtered inside the same query as the ranking.
+"""
+import re
+import zlib
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+
+from apps.jobs.search import tokenize
+from .models import ResumeText
+
+FTS_TABLE = 'applications_resume_fts'
+FULLTEXT_TABLE = 'applications_resume_search'
+
+
+def _scope(job_id, status):
+    """Extra WHERE clauses and params on applications_application"""
+    clauses, params = [], []
+    if job_id is not None:
+        clauses.append("a.job_id = %s")
+        params.append(job_id)
+    if status:
+        clauses.append("a.status = %s")
+        params.append(status)
+    return ''.join(f" AND {clause}" for clause in clauses), params
+
+
+class BaseResumeSearchBackend:
+    """
+    Resume full-text backend interface
+
+    search() returns [(application_id, relevance), ...] best match first.
+    index() takes [(application_id, text), ...].
+    """
+    def search(self, query, limit, job_id=None, status=None):
+        raise NotImplementedError
+
+    def index(self, rows):
+        raise NotImplementedError
+
+    def remove(self, application_ids):
+        raise NotImplementedError
+
+
+class MySQLFullTextBackend(BaseResumeSearchBackend):
+    def search(self, query, limit, job_id=None, status=None):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Boolean mode: every term required, prefix match
+        against = ' '.join(f'+{token}*' for token in tokens)
+        scope, params = _scope(job_id, status)
+        sql = (
+            f"SELECT s.application_id, MATCH(s.body) AGAINST (%s IN BOOLEAN MODE) AS relevance "
+            f"FROM {FULLTEXT_TABLE} s "
+            f"JOIN applications_application a ON a.id = s.application_id "
+            f"WHERE MATCH(s.body) AGAINST (%s IN BOOLEAN MODE){scope} "
+            f"ORDER BY relevance DESC, s.application_id DESC LIMIT %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [against, against, *params, limit])
+            return [(row[0], float(row[1])) for row in cursor.fetchall()]
+
+    def index(self, rows):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {FULLTEXT_TABLE} (application_id, body) VALUES (%s, %s) "
+                f"ON DUPLICATE KEY UPDATE body = VALUES(body)",
+                rows
+            )
+
+    def remove(self, application_ids):
+        placeholders = ', '.join(['%s'] * len(application_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FULLTEXT_TABLE} WHERE application_id IN ({placeholders})",
+                list(application_ids)
+            )
+
+
+class SQLiteFTS5Backend(BaseResumeSearchBackend):
+    def search(self, query, limit, job_id=None, status=None):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        scope, params = _scope(job_id, status)
+        sql = (
+            f"SELECT {FTS_TABLE}.rowid, bm25({FTS_TABLE}) AS rank "
+            f"FROM {FTS_TABLE} "
+            f"JOIN applications_application a ON a.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s{scope} "
+            f"ORDER BY rank, {FTS_TABLE}.rowid DESC LIMIT %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [match, *params, limit])
+            # bm25 is lower-is-better; flip it so relevance sorts descending
+            return [(row[0], -row[1]) for row in cursor.fetchall()]
+
+    def index(self, rows):
+        self.remove([application_id for application_id, _ in rows])
+        with connection.cursor() as cursor:
+            cursor.executemany(f"INSERT INTO {FTS_TABLE} (rowid, body) VALUES (%s, %s)", rows)
+
+    def remove(self, application_ids):
+        placeholders = ', '.join(['%s'] * len(application_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})",
+                list(application_ids)
+            )
+
+
+VENDOR_BACKENDS = {
+    'mysql': MySQLFullTextBackend,
+    'sqlite': SQLiteFTS5Backend,
+}
+
+_backend = None
+
+
+def get_search_backend():
+    """
+    Return the configured backend, or pick one for the database vendor
+
+    Returns None when the database has no supported full-text index.
+    """
+    global _backend
+    if _backend is None:
+        if settings.RESUME_SEARCH_BACKEND:
+            _backend = import_string(settings.RESUME_SEARCH_BACKEND)()
+        else:
+            backend_class = VENDOR_BACKENDS.get(connection.vendor)
+            _backend = backend_class() if backend_class else False
+    return _backend or None
+
+
+def store_resume_texts(rows):
+    """
+    Save extracted text for [(application_id, text), ...] and index it
+
+    Text is capped at RESUME_TEXT_MAX_CHARS. An empty text clears any
+    stored text for that application.
+    """
+    rows = [(application_id, (text or '')[:settings.RESUME_TEXT_MAX_CHARS]) for application_id, text in rows]
+    kept = [(application_id, text) for application_id, text in rows if text.strip()]
+    cleared = [application_id for application_id, text in rows if not text.strip()]
+    backend = get_search_backend()
+
+    with transaction.atomic():
+        if kept:
+            ResumeText.objects.bulk_create(
+                [
+                    ResumeText(
+                        application_id=application_id,
+                        data=zlib.compress(text.encode(), settings.ARCHIVE_COMPRESSION_LEVEL),
+                        length=len(text)
+                    )
+                    for application_id, text in kept
+                ],
+                update_conflicts=True,
+                unique_fields=['application'],
+                update_fields=['data', 'length', 'updated_at']
+            )
+            if backend:
+                backend.index(kept)
+        if cleared:
+            ResumeText.objects.filter(application_id__in=cleared).delete()
+            remove_from_index(cleared)
+
+
+def remove_from_index(application_ids):
+    backend = get_search_backend()
+    if backend and application_ids:
+        backend.remove(list(application_ids))
+
+
+def search_resumes(query, limit, job_id=None, status=None):
+    """[(application_id, relevance), ...] best match first, [] without a backend"""
+    backend = get_search_backend()
+    if backend is None:
+        return []
+    return backend.search(query, limit, job_id=job_id, status=status)
+
+
+def make_snippet(text, query, width=None):
+    """Excerpt of `text` around the first query term, or its start"""
+    width = width or settings.RESUME_SEARCH_SNIPPET_CHARS
+    text = ' '.join(text.split())
+    start = 0
+    tokens = tokenize(query)
+    if tokens:
+        found = re.search(r'\b(' + '|'.join(re.escape(token) for token in tokens) + r')', text, re.IGNORECASE)
+        if found:
+            start = max(0, found.start() - width // 3)
+    snippet = text[start:start + width]
+    return ('…' if start else '') + snippet + ('…' if start + width < len(text) else '')
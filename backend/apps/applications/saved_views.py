@@ -0,0 +1,203 @@
+"""
+Saved recruiter views
+
+A saved view is a fixed application query (criteria + ordering) whose
+results are materialized on the SavedView row as [sort_key, id] pairs in
+list order. Paging reads a slice of that list and loads only the
+applications on the page.
+
+The list is kept current incrementally: a refresh reads the applications
+changed and deleted since the view's sync cursor (the streams in
+sync.py), re-evaluates only those rows against the criteria and merges
+them in. A full rebuild is only needed for a new or edited view, an
+expired cursor, more than SAVED_VIEW_REBUILD_THRESHOLD changes at once,
+or a truncated list losing rows it can't replace.
+"""
+import json
+import operator
+import zlib
+from datetime import datetime, timedelta
+from functools import reduce
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from .models import Application, SavedView
+from .sync import InvalidSyncToken, SyncTokenExpired, get_changes, head_cursor
+
+# Same fields as the list's ?search=
+SEARCH_FIELDS = ['candidate_name', 'candidate_email', 'parsed_skills']
+
+RANGE_LOOKUPS = {
+    'min_score': 'score__gte',
+    'max_score': 'score__lte',
+    'min_experience': 'experience_years__gte',
+    'max_experience': 'experience_years__lte',
+    'min_education_level': 'education_level__gte',
+}
+
+# Rows re-evaluated per query during a refresh
+REFRESH_CHUNK_SIZE = 1000
+
+
+def criteria_queryset(criteria):
+    """Applications matching a saved view's criteria"""
+    queryset = Application.objects.all()
+    if criteria.get('job'):
+        queryset = queryset.filter(job_id=criteria['job'])
+    if criteria.get('status'):
+        queryset = queryset.filter(status__in=criteria['status'])
+    for key, lookup in RANGE_LOOKUPS.items():
+        if criteria.get(key) is not None:
+            queryset = queryset.filter(**{lookup: criteria[key]})
+    if criteria.get('education_field'):
+        queryset = queryset.filter(education_field__icontains=criteria['education_field'])
+    # Every skill is required; matched as a quoted string in the JSON text
+    for skill in criteria.get('skills', []):
+        queryset = queryset.filter(parsed_skills__icontains=json.dumps(skill))
+    # Every search term must match one of the fields
+    for term in (criteria.get('search') or '').split():
+        queryset = queryset.filter(
+            reduce(operator.or_, (Q(**{f'{field}__icontains': term}) for field in SEARCH_FIELDS))
+        )
+    return queryset
+
+
+def _sort_value(value):
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return value.lower()
+    return value
+
+
+def sort_entries(entries, ordering):
+    """Order [sort_key, id] pairs like ORDER BY <ordering> NULLS LAST, id"""
+    entries.sort(key=lambda entry: entry[1])
+    # Stable sorts: equal keys keep id order, also with reverse=True
+    if ordering.startswith('-'):
+        entries.sort(key=lambda entry: (entry[0] is not None, entry[0] if entry[0] is not None else 0), reverse=True)
+    else:
+        entries.sort(key=lambda entry: (entry[0] is None, entry[0] if entry[0] is not None else 0))
+
+
+def _entries(queryset, ordering):
+    field = ordering.lstrip('-')
+    return [[_sort_value(value), application_id] for value, application_id in queryset.values_list(field, 'id')]
+
+
+def load_results(view):
+    """A view's materialized [sort_key, id] list"""
+    if not view.results:
+        return []
+    return json.loads(zlib.decompress(bytes(view.results)))
+
+
+def _store(view, entries, sync_token, truncated):
+    view.results = zlib.compress(json.dumps(entries, separators=(',', ':')).encode())
+    view.result_count = len(entries)
+    view.truncated = truncated
+    view.sync_token = sync_token
+    view.refreshed_at = timezone.now()
+    view.save(update_fields=['results', 'result_count', 'truncated', 'sync_token', 'refreshed_at'])
+    return view
+
+
+def rebuild_view(view):
+    """Run the view's query from scratch and store the first SAVED_VIEW_MAX_RESULTS matches"""
+    limit = settings.SAVED_VIEW_MAX_RESULTS
+    # Taken first, a settle window behind the head: anything changing during
+    # the query, or committed late with an earlier updated_at, is
+    # re-evaluated by the next refresh
+    cursor = head_cursor()
+
+    field = view.ordering.lstrip('-')
+    expression = Lower(field) if field == 'candidate_name' else F(field)
+    order = expression.desc(nulls_last=True) if view.ordering.startswith('-') else expression.asc(nulls_last=True)
+    entries = _entries(criteria_queryset(view.criteria).order_by(order, 'id')[:limit + 1], view.ordering)
+    sort_entries(entries, view.ordering)
+    return _store(view, entries[:limit], cursor.encode(), truncated=len(entries) > limit)
+
+
+def refresh_view(view):
+    """Bring a view's materialized results up to date"""
+    if not view.sync_token:
+        return rebuild_view(view)
+
+    token = view.sync_token
+    changed_ids, deleted_ids = set(), set()
+    try:
+        while True:
+            changed, deleted, cursor, has_more = get_changes(
+                Application.objects.only('id', 'updated_at'),
+                token=token,
+                limit=settings.SYNC_MAX_PAGE_SIZE,
+                job_id=view.criteria.get('job'),
+            )
+            changed_ids.update(application.id for application in changed)
+            deleted_ids.update(deleted)
+            token = cursor.encode()
+            if len(changed_ids) + len(deleted_ids) > settings.SAVED_VIEW_REBUILD_THRESHOLD:
+                return rebuild_view(view)
+            if not has_more:
+                break
+    except (InvalidSyncToken, SyncTokenExpired):
+        return rebuild_view(view)
+
+    entries = load_results(view)
+    stale = changed_ids | deleted_ids
+    matching = criteria_queryset(view.criteria)
+    changed_ids = sorted(changed_ids)
+    current = []
+    for start in range(0, len(changed_ids), REFRESH_CHUNK_SIZE):
+        current += _entries(matching.filter(id__in=changed_ids[start:start + REFRESH_CHUNK_SIZE]), view.ordering)
+
+    if view.truncated:
+        # A listed row that left or moved may let rows past the cap in, and
+        # those are not in the list. Rows re-read unchanged (the settle
+        # window in sync.py) are fine.
+        current_keys = {application_id: key for key, application_id in current}
+        missing = object()
+        if any(
+            application_id in stale and current_keys.get(application_id, missing) != key
+            for key, application_id in entries
+        ):
+            return rebuild_view(view)
+
+    kept = [entry for entry in entries if entry[1] not in stale] + current
+    sort_entries(kept, view.ordering)
+
+    limit = settings.SAVED_VIEW_MAX_RESULTS
+    return _store(view, kept[:limit], token, truncated=view.truncated or len(kept) > limit)
+
+
+def get_results(view):
+    """
+    A view's [sort_key, id] list, refreshed first unless that happened in
+    the last SAVED_VIEW_REFRESH_SECONDS (so paging through a view reads
+    one consistent list)
+    """
+    def is_fresh(view):
+        interval = timedelta(seconds=settings.SAVED_VIEW_REFRESH_SECONDS)
+        return view.refreshed_at is not None and view.refreshed_at > timezone.now() - interval
+
+    if not is_fresh(view):
+        with transaction.atomic():
+            # One refresh at a time per view; waiters reuse its result
+            view = SavedView.objects.select_for_update().get(pk=view.pk)
+            if not is_fresh(view):
+                refresh_view(view)
+    return load_results(view)
+
+
+def reset_view(view):
+    """Drop a view's results after its definition changed (rebuilt on next read)"""
+    view.results = None
+    view.result_count = 0
+    view.truncated = False
+    view.sync_token = ''
+    view.refreshed_at = None
+    view.save(update_fields=['results', 'result_count', 'truncated', 'sync_token', 'refreshed_at'])
@@ -1,5 +1,16 @@
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Application, ApplicationStatusHistory
+from .models import (
+    Application, ApplicationStatusHistory, ReparseRun, ArchivedApplication, ResumeUpload, SavedView
+)
+from .idempotency import file_sha256
+from .storage import signed_url
+from .structured_fields import EDUCATION_LEVEL_CHOICES
+from .uploads import (
+    SIGNATURE_LENGTH, UploadRejected, check_extension, check_signature, check_size,
+    get_completed_upload, open_upload
+)
 from apps.jobs.serializers import JobSerializer, JobListSerializer
 
 
@@ -33,21 +44,24 @@ class ApplicationSerializer(serializers.ModelSerializer):
             'linkedin_url', 'cover_letter', 'resume_file', 'resume_url', 'status',
             'parsed_skills', 'parsed_experience', 'parsed_education',
             'parsed_email', 'parsed_phone', 'score',
+            'experience_years', 'education_level', 'education_field',
             'applied_at', 'updated_at', 'status_history'
         ]
         read_only_fields = [
             'id', 'applied_at', 'updated_at', 
             'parsed_skills', 'parsed_experience', 'parsed_education',
-            'parsed_email', 'parsed_phone', 'score'
+            'parsed_email', 'parsed_phone', 'score',
+            'experience_years', 'education_level', 'education_field'
         ]
     
     def get_resume_url(self, obj):
-        """Get full URL for resume file"""
+        """Get full URL for resume file (presigned on object storage)"""
         if obj.resume_file:
+            url = signed_url(obj.resume_file.name, settings.RESUME_URL_EXPIRY)
             request = self.context.get('request')
             if request:
-                return request.build_absolute_uri(obj.resume_file.url)
-            return obj.resume_file.url
+                return request.build_absolute_uri(url)
+            return url
         return None
 
 
@@ -62,37 +76,51 @@ class ApplicationListSerializer(serializers.ModelSerializer):
         model = Application
         fields = [
             'id', 'job_id', 'job_title', 'candidate_name', 'candidate_email',
-            'status', 'score', 'applied_at'
+            'status', 'score', 'experience_years', 'education_level', 'applied_at'
+        ]
+
+
+class ApplicationSyncSerializer(serializers.ModelSerializer):
+    """
+    Serializer for incremental sync - list fields plus the parsed summary
+    """
+    job_id = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = Application
+        fields = [
+            'id', 'job_id', 'candidate_name', 'candidate_email',
+            'status', 'score', 'parsed_skills', 'applied_at', 'updated_at'
         ]
 
 
 class ApplicationCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating new applications (public endpoint)
+
+    The resume comes either as `resume_file` or as the `upload_token` of a
+    completed resumable upload.
     """
     job_id = serializers.IntegerField(write_only=True)
+    upload_token = serializers.CharField(write_only=True, required=False)
     
     class Meta:
         model = Application
         fields = [
             'job_id', 'candidate_name', 'candidate_email', 'candidate_phone',
-            'linkedin_url', 'cover_letter', 'resume_file'
+            'linkedin_url', 'cover_letter', 'resume_file', 'upload_token'
         ]
+        extra_kwargs = {'resume_file': {'required': False}}
     
     def validate_resume_file(self, value):
-        """Validate resume file size and type"""
-        # Check file size (max 10MB)
-        if value.size > 10485760:
-            raise serializers.ValidationError("Resume file size cannot exceed 10MB")
-        
-        # Check file extension
-        allowed_extensions = ['.pdf', '.doc', '.docx']
-        ext = value.name.lower().split('.')[-1]
-        if f'.{ext}' not in allowed_extensions:
-            raise serializers.ValidationError(
-                "Only PDF, DOC, and DOCX files are allowed"
-            )
-        
+        """Validate resume file size, extension and content type"""
+        try:
+            check_size(value.size)
+            check_extension(value.name)
+            check_signature(value.name, value.read(SIGNATURE_LENGTH))
+        except UploadRejected as e:
+            raise serializers.ValidationError(str(e))
+        value.seek(0)
         return value
     
     def validate_job_id(self, value):
@@ -106,6 +134,46 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Job not found")
         return value
 
+    def validate(self, attrs):
+        """Resolve the resume source and fingerprint it for duplicate detection"""
+        token = attrs.pop('upload_token', None)
+        if token and attrs.get('resume_file'):
+            raise serializers.ValidationError("Send either resume_file or upload_token, not both")
+        if token:
+            upload = get_completed_upload(token)
+            if upload is None:
+                raise serializers.ValidationError({'upload_token': "Upload not found, incomplete or expired"})
+            self.resume_upload = upload
+            attrs['resume_file'] = open_upload(upload)
+            attrs['resume_sha256'] = upload.sha256
+            return attrs
+        if not attrs.get('resume_file'):
+            raise serializers.ValidationError({'resume_file': "A resume file is required"})
+        # Streamed uploads were hashed on the way in
+        resume_file = attrs['resume_file']
+        attrs['resume_sha256'] = getattr(resume_file, 'sha256', None) or file_sha256(resume_file)
+        return attrs
+
+
+class ResumeUploadStartSerializer(serializers.Serializer):
+    """
+    Start a resumable resume upload
+    """
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+
+
+class ResumeUploadSerializer(serializers.ModelSerializer):
+    """
+    Progress of a resumable resume upload
+    """
+    complete = serializers.BooleanField(source='is_complete', read_only=True)
+    
+    class Meta:
+        model = ResumeUpload
+        fields = ['token', 'filename', 'size', 'offset', 'complete', 'expires_at']
+        read_only_fields = fields
+
 
 class ApplicationUpdateSerializer(serializers.ModelSerializer):
     """
@@ -123,6 +191,16 @@ class ApplicationUpdateSerializer(serializers.ModelSerializer):
         return value
 
 
+class BulkDeleteSerializer(serializers.Serializer):
+    """
+    Serializer for bulk deletes
+    """
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1
+    )
+
+
 class BulkStatusUpdateSerializer(serializers.Serializer):
     """
     Serializer for bulk status updates
@@ -132,3 +210,148 @@ class BulkStatusUpdateSerializer(serializers.Serializer):
         min_length=1
     )
     status = serializers.ChoiceField(choices=Application.STATUS_CHOICES)
+
+
+class LeaderboardQuerySerializer(serializers.Serializer):
+    """
+    Query parameters for the per-job leaderboard
+    """
+    status = serializers.ChoiceField(choices=Application.STATUS_CHOICES, required=False)
+    min_score = serializers.IntegerField(min_value=0, max_value=100, required=False)
+    limit = serializers.IntegerField(min_value=1, required=False, default=10)
+
+
+class SyncQuerySerializer(serializers.Serializer):
+    """
+    Query parameters for incremental sync
+    """
+    token = serializers.CharField(required=False)
+    job = serializers.IntegerField(required=False)
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+
+class MatchQuerySerializer(serializers.Serializer):
+    """
+    Query parameters for matching an application against open jobs
+    """
+    min_score = serializers.IntegerField(min_value=0, max_value=100, required=False, default=1)
+    limit = serializers.IntegerField(min_value=1, max_value=50, required=False, default=10)
+    include_current = serializers.BooleanField(required=False, default=False)
+
+
+class ResumeSearchQuerySerializer(serializers.Serializer):
+    """
+    Query parameters for full-text search over resume text
+    """
+    q = serializers.CharField(max_length=200)
+    job = serializers.IntegerField(required=False)
+    status = serializers.ChoiceField(choices=Application.STATUS_CHOICES, required=False)
+    limit = serializers.IntegerField(min_value=1, required=False, default=20)
+
+
+class ReparseRunSerializer(serializers.ModelSerializer):
+    """
+    Progress of a job-level batch re-parse
+    """
+    status = serializers.SerializerMethodField()
+    remaining = serializers.IntegerField(read_only=True)
+    throughput_per_second = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ReparseRun
+        fields = [
+            'id', 'job', 'status', 'total', 'done', 'failed', 'remaining',
+            'throughput_per_second', 'started_by', 'started_at', 'updated_at',
+            'finished_at', 'error'
+        ]
+    
+    def get_status(self, obj):
+        """Report runs whose worker stopped heartbeating as stalled"""
+        from .reparse import is_stale
+        return 'stalled' if is_stale(obj) else obj.status
+    
+    def get_throughput_per_second(self, obj):
+        end = obj.finished_at or timezone.now()
+        elapsed = max((end - obj.started_at).total_seconds(), 0.001)
+        return round((obj.done + obj.failed) / elapsed, 2)
+
+
+class ReparseStartSerializer(serializers.Serializer):
+    """
+    Options for starting a job-level batch re-parse
+    """
+    resume = serializers.BooleanField(required=False, default=False)
+
+
+class ArchivedApplicationListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for archived application listings
+    """
+    job_title = serializers.CharField(source='job.title', read_only=True)
+    
+    class Meta:
+        model = ArchivedApplication
+        fields = [
+            'id', 'job', 'job_title', 'candidate_name', 'candidate_email',
+            'status', 'score', 'applied_at', 'archived_at'
+        ]
+
+
+class ArchivedApplicationSerializer(ArchivedApplicationListSerializer):
+    """
+    Archived application with its decompressed details and status history
+    """
+    details = serializers.SerializerMethodField()
+    
+    class Meta(ArchivedApplicationListSerializer.Meta):
+        fields = ArchivedApplicationListSerializer.Meta.fields + ['details']
+    
+    def get_details(self, obj):
+        from .archive import decompress
+        return decompress(obj.data)
+
+
+class SavedViewCriteriaSerializer(serializers.Serializer):
+    """
+    What a saved view matches: every given criterion must hold
+    """
+    job = serializers.IntegerField(required=False)
+    status = serializers.ListField(
+        child=serializers.ChoiceField(choices=Application.STATUS_CHOICES), required=False
+    )
+    min_score = serializers.IntegerField(min_value=0, max_value=100, required=False)
+    max_score = serializers.IntegerField(min_value=0, max_value=100, required=False)
+    skills = serializers.ListField(
+        child=serializers.CharField(max_length=100), required=False, max_length=20
+    )
+    min_experience = serializers.IntegerField(min_value=0, required=False)
+    max_experience = serializers.IntegerField(min_value=0, required=False)
+    min_education_level = serializers.ChoiceField(choices=EDUCATION_LEVEL_CHOICES, required=False)
+    education_field = serializers.CharField(max_length=100, required=False)
+    search = serializers.CharField(max_length=200, required=False)
+
+
+class SavedViewSerializer(serializers.ModelSerializer):
+    """
+    A recruiter's saved view and the state of its materialized results
+    """
+    class Meta:
+        model = SavedView
+        fields = [
+            'id', 'name', 'criteria', 'ordering', 'result_count', 'truncated',
+            'refreshed_at', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'result_count', 'truncated', 'refreshed_at', 'created_at', 'updated_at']
+    
+    def validate_name(self, value):
+        views = SavedView.objects.filter(user=self.context['request'].user, name=value)
+        if self.instance is not None:
+            views = views.exclude(pk=self.instance.pk)
+        if views.exists():
+            raise serializers.ValidationError('You already have a saved view with this name')
+        return value
+    
+    def validate_criteria(self, value):
+        criteria = SavedViewCriteriaSerializer(data=value)
+        criteria.is_valid(raise_exception=True)
+        return dict(criteria.validated_data)
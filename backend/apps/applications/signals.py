@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .caching import invalidate_job
+from .models import Application, ApplicationTombstone
+from .resume_search import remove_from_index
+
+
+@receiver(post_delete, sender=Application)
+def application_deleted(sender, instance, **kwargs):
+    """Drop cached per-job results and leave a tombstone for sync clients"""
+    invalidate_job(instance.job_id)
+    remove_from_index([instance.pk])
+    ApplicationTombstone.objects.create(
+        application_id=instance.pk,
+        job_id=instance.job_id
+    )
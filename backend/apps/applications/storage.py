@@ -0,0 +1,34 @@
+"""
+Resume file storage
+
+`Application.resume_file` is stored in the 'resumes' storage alias (see
+RESUME_STORAGE in settings): the local file system by default, or an
+S3-compatible object store shared by every API replica. With object
+storage, files are streamed straight to and from the store, and the
+parser and recruiters get short-lived presigned URLs instead of having
+the API serve the bytes.
+"""
+from django.core.files.storage import storages
+
+
+def resume_storage():
+    """Storage for resume files (callable so tests and settings can swap it)"""
+    return storages['resumes']
+
+
+def signs_urls(storage=None):
+    """True when the storage hands out presigned, expiring URLs"""
+    return getattr(storage or resume_storage(), 'querystring_auth', False)
+
+
+def signed_url(name, expire):
+    """
+    URL to read a stored resume
+
+    Presigned and valid for `expire` seconds on object storage; the
+    storage's plain (relative, for local files) URL otherwise.
+    """
+    storage = resume_storage()
+    if signs_urls(storage):
+        return storage.url(name, expire=expire)
+    return storage.url(name)
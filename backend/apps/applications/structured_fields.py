@@ -0,0 +1,56 @@
+"""
+Typed columns derived from the parser's free-text results
+
+The parser reports experience as "1 year" / "5+ years" and education as
+"<degree> in <field>", "<degree>" or "Degree in <field>". These are
+turned into experience_years, an ordinal education_level and
+education_field so recruiters' range filters can use an index.
+"""
+import re
+
+# Ordinal education levels - higher is more advanced
+DIPLOMA, ASSOCIATE, BACHELOR, MASTER, DOCTORATE = 1, 2, 3, 4, 5
+
+EDUCATION_LEVEL_CHOICES = [
+    (DIPLOMA, 'Diploma'),
+    (ASSOCIATE, 'Associate'),
+    (BACHELOR, 'Bachelor'),
+    (MASTER, 'Master'),
+    (DOCTORATE, 'Doctorate'),
+]
+
+# Degree names the parser reports (golang-service text_analyzer.go) -> level
+DEGREE_LEVELS = {
+    'ph.d': DOCTORATE, 'phd': DOCTORATE, 'doctor of philosophy': DOCTORATE,
+    'master': MASTER, 'm.s': MASTER, 'm.sc': MASTER, 'mba': MASTER, 'm.a': MASTER,
+    'bachelor': BACHELOR, 'b.s': BACHELOR, 'b.sc': BACHELOR, 'b.a': BACHELOR,
+    'b.e': BACHELOR, 'b.tech': BACHELOR,
+    'associate': ASSOCIATE,
+    'diploma': DIPLOMA,
+}
+
+# Anything above this is a misread (e.g. a year), not a career length
+MAX_EXPERIENCE_YEARS = 60
+
+STRUCTURED_FIELDS = ['experience_years', 'education_level', 'education_field']
+
+
+def parse_experience_years(experience):
+    """'5+ years' -> 5, '' -> None"""
+    match = re.search(r'\d+', experience or '')
+    if not match:
+        return None
+    years = int(match.group())
+    return years if years <= MAX_EXPERIENCE_YEARS else None
+
+
+def parse_education(education):
+    """'Master in Computer Science' -> (MASTER, 'Computer Science')"""
+    degree, _, field = (education or '').partition(' in ')
+    return DEGREE_LEVELS.get(degree.strip().lower()), field.strip()
+
+
+def apply_structured_fields(application):
+    """Derive the typed columns from parsed_experience/parsed_education (does not save)"""
+    application.experience_years = parse_experience_years(application.parsed_experience)
+    application.education_level, application.education_field = parse_education(application.parsed_education)
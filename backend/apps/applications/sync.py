@@ -0,0 +1,161 @@
+"""
+Incremental sync for polling clients
+
+A sync token is an opaque cursor over two streams:
+- changed applications, keyed on the indexed (updated_at, id) pair
+- deletions, keyed on the tombstone id
+
+A client sends back the token it received last time and gets only the
+rows that changed since then, plus the ids that were deleted.
+
+updated_at and tombstone ids are assigned before commit, so a row can
+become visible after a later one was already returned. The cursor
+therefore never moves past rows written in the last SYNC_SETTLE_SECONDS:
+those are returned again on the next call, and clients deduplicate on the
+application id (a re-sent change or deletion is a plain upsert/delete).
+"""
+import base64
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ApplicationTombstone
+
+
+class InvalidSyncToken(Exception):
+    """Raised when a sync token cannot be decoded"""
+
+
+class SyncTokenExpired(Exception):
+    """Raised when a token is older than the tombstone retention window"""
+
+
+class SyncCursor:
+    """
+    Position in the change and deletion streams
+    """
+    def __init__(self, updated_at=None, application_id=0, tombstone_id=0, issued_at=None):
+        self.updated_at = updated_at
+        self.application_id = application_id
+        self.tombstone_id = tombstone_id
+        self.issued_at = issued_at or timezone.now()
+
+    def encode(self):
+        payload = {
+            'u': self.updated_at.isoformat() if self.updated_at else None,
+            'i': self.application_id,
+            't': self.tombstone_id,
+            'at': self.issued_at.isoformat(),
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token):
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            updated_at = parse_datetime(payload['u']) if payload['u'] else None
+            return cls(
+                updated_at=updated_at,
+                application_id=int(payload['i']),
+                tombstone_id=int(payload['t']),
+                issued_at=parse_datetime(payload['at']),
+            )
+        except (ValueError, KeyError, TypeError):
+            raise InvalidSyncToken("Invalid sync token")
+
+
+def settled_before():
+    """Rows written before this are assumed committed (see module docstring)"""
+    return timezone.now() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+
+def _settled_tombstone_head(settled):
+    """Highest tombstone id with no unsettled tombstone at or below it"""
+    unsettled = ApplicationTombstone.objects.filter(deleted_at__gt=settled).aggregate(first=Min('id'))['first']
+    if unsettled is not None:
+        return unsettled - 1
+    return ApplicationTombstone.objects.aggregate(head=Max('id'))['head'] or 0
+
+
+def head_cursor():
+    """Cursor at the settled end of both streams (a settle window behind the head)"""
+    settled = settled_before()
+    return SyncCursor(updated_at=settled, application_id=0, tombstone_id=_settled_tombstone_head(settled))
+
+
+def get_changes(queryset, token=None, limit=None, job_id=None):
+    """
+    Return (changed_applications, deleted_ids, next_cursor, has_more)
+
+    `queryset` is the caller's base application queryset; it is ordered on
+    the sync cursor here. With no token the first call walks every
+    application and starts the deletion stream at the current head, since
+    a fresh client has nothing to delete.
+    """
+    limit = min(limit or settings.SYNC_PAGE_SIZE, settings.SYNC_MAX_PAGE_SIZE)
+    settled = settled_before()
+
+    if token:
+        cursor = SyncCursor.decode(token)
+        retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if cursor.issued_at < timezone.now() - retention:
+            raise SyncTokenExpired("Sync token expired, a full resync is required")
+    else:
+        cursor = SyncCursor(tombstone_id=_settled_tombstone_head(settled))
+
+    # Changed applications after the (updated_at, id) cursor
+    changed = queryset
+    if job_id:
+        changed = changed.filter(job_id=job_id)
+    if cursor.updated_at is not None:
+        changed = changed.filter(
+            Q(updated_at__gt=cursor.updated_at) |
+            Q(updated_at=cursor.updated_at, id__gt=cursor.application_id)
+        )
+    changed = list(changed.order_by('updated_at', 'id')[:limit + 1])
+    more_changed = len(changed) > limit
+    changed = changed[:limit]
+    # The cursor stops at the last settled row; rows after it are sent again
+    settled_changed = [application for application in changed if application.updated_at <= settled]
+
+    # Deletions after the tombstone cursor
+    tombstones = ApplicationTombstone.objects.filter(id__gt=cursor.tombstone_id)
+    if job_id:
+        tombstones = tombstones.filter(job_id=job_id)
+    tombstones = list(
+        tombstones.order_by('id').values_list('id', 'application_id', 'deleted_at')[:limit + 1]
+    )
+    more_deleted = len(tombstones) > limit
+    tombstones = tombstones[:limit]
+    settled_tombstones = []
+    for tombstone in tombstones:
+        if tombstone[2] > settled:
+            break
+        settled_tombstones.append(tombstone)
+
+    next_cursor = SyncCursor(
+        updated_at=settled_changed[-1].updated_at if settled_changed else cursor.updated_at,
+        application_id=settled_changed[-1].id if settled_changed else cursor.application_id,
+        tombstone_id=settled_tombstones[-1][0] if settled_tombstones else cursor.tombstone_id,
+    )
+    # A page ending in unsettled rows is the end for now: everything after
+    # it is newer still and comes once it has settled
+    has_more = (
+        (more_changed and len(settled_changed) == len(changed)) or
+        (more_deleted and len(settled_tombstones) == len(tombstones))
+    )
+    deleted_ids = [application_id for _, application_id, _ in tombstones]
+    return changed, deleted_ids, next_cursor, has_more
+
+
+def prune_tombstones():
+    """Delete tombstones older than the retention window, return the count"""
+    cutoff = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    deleted, _ = ApplicationTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
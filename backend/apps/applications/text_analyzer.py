@@ -0,0 +1,145 @@
+"""
+Resume text analysis - Python port of golang-service/parsers/text_analyzer.go
+
+Used by the in-process parser backend. Keep it in step with the Go
+version so both backends give the same skills, experience, education,
+contact details and score for the same text. Matching is deliberately
+the same plain substring test the Go service uses.
+
+This module must not import Django: it runs in parser worker processes.
+"""
+import re
+
+SKILL_KEYWORDS = [
+    # Programming Languages
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Golang", "C++", "C#",
+    "Ruby", "PHP", "Swift", "Kotlin", "Rust", "Scala", "R", "MATLAB",
+
+    # Web Technologies
+    "HTML", "CSS", "React", "Angular", "Vue", "Node.js", "Express",
+    "Django", "Flask", "FastAPI", "Spring", "ASP.NET", "jQuery",
+
+    # Databases
+    "SQL", "MySQL", "PostgreSQL", "MongoDB", "Redis", "Oracle",
+    "SQL Server", "MariaDB", "Cassandra", "DynamoDB", "SQLite",
+
+    # Cloud & DevOps
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Jenkins",
+    "Git", "GitHub", "GitLab", "CI/CD", "Terraform", "Ansible",
+
+    # Data Science & ML
+    "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch",
+    "scikit-learn", "Pandas", "NumPy", "Data Analysis", "NLP",
+
+    # Mobile Development
+    "Android", "iOS", "React Native", "Flutter", "Xamarin",
+
+    # Other
+    "REST API", "GraphQL", "Microservices", "Agile", "Scrum",
+    "Linux", "Unix", "Windows Server", "Networking", "Security",
+]
+
+# Go's RE2 \d and \s are ASCII-only, hence re.ASCII
+EXPERIENCE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.ASCII) for pattern in (
+        r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
+        r'experience:\s*(\d+)\+?\s*years?',
+        r'(\d+)\+?\s*years?\s+(?:in|of|with)',
+    )
+]
+
+DEGREES = [
+    "Ph.D", "PhD", "Doctor of Philosophy",
+    "Master", "M.S", "M.Sc", "MBA", "M.A",
+    "Bachelor", "B.S", "B.Sc", "B.A", "B.E", "B.Tech",
+    "Associate", "Diploma",
+]
+
+FIELDS = [
+    "Computer Science", "Software Engineering", "Information Technology",
+    "Engineering", "Mathematics", "Physics", "Business Administration",
+    "Data Science", "Artificial Intelligence",
+]
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}')
+
+PHONE_PATTERNS = [
+    re.compile(pattern, re.ASCII) for pattern in (
+        r'\+?\d{1,3}[\s-]?\(?\d{2,3}\)?[\s-]?\d{3,4}[\s-]?\d{4}',  # International and local
+        r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}',                            # (123) 456-7890
+        r'\d{3}[-\s]?\d{3}[-\s]?\d{4}',                             # 123-456-7890
+    )
+]
+
+
+def extract_skills(text):
+    text_lower = text.lower()
+    return [skill for skill in SKILL_KEYWORDS if skill.lower() in text_lower]
+
+
+def extract_experience(text):
+    for pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            years = match.group(1)
+            return "1 year" if years == "1" else years + "+ years"
+    return ""
+
+
+def extract_education(text):
+    text_lower = text.lower()
+    degree = next((d for d in DEGREES if d.lower() in text_lower), "")
+    field = next((f for f in FIELDS if f.lower() in text_lower), "")
+
+    if degree and field:
+        return f"{degree} in {field}"
+    if degree:
+        return degree
+    if field:
+        return f"Degree in {field}"
+    return ""
+
+
+def extract_email(text):
+    match = EMAIL_PATTERN.search(text)
+    return match.group(0) if match else ""
+
+
+def extract_phone(text):
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return ""
+
+
+def calculate_score(skills, requirements):
+    """Share of requirements matched by a skill, 0-100 (50 with no requirements)"""
+    if not requirements:
+        return 50
+
+    skills_lower = {skill.strip().lower() for skill in skills}
+    match_count = sum(1 for requirement in requirements if requirement_matched(requirement, skills_lower))
+    return min(int(match_count / len(requirements) * 100), 100)
+
+
+def requirement_matched(requirement, skills_lower):
+    """Direct match, else partial match (either contains the other)"""
+    requirement_lower = requirement.strip().lower()
+    return requirement_lower in skills_lower or any(
+        skill in requirement_lower or requirement_lower in skill for skill in skills_lower
+    )
+
+
+def analyze(text, requirements):
+    """Parse result in the parser service's ParsedData shape"""
+    skills = extract_skills(text)
+    return {
+        'skills': skills,
+        'experience': extract_experience(text),
+        'education': extract_education(text),
+        'email': extract_email(text),
+        'phone': extract_phone(text),
+        'score': calculate_score(skills, requirements),
+        'text': text,
+    }
@@ -0,0 +1,178 @@
+"""
+Admission control for the public application endpoint
+
+Each submission starts an expensive resume parse, so intake is guarded by:
+- load shedding: 503 when too many intake parses are already in flight
+  across the deployment (recruiter reparse runs are not counted)
+- per-IP and per-job token buckets: 429 once a bucket is empty
+Both answers carry Retry-After. Recruiter endpoints are not affected.
+"""
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {'s': 1, 'sec': 1, 'm': 60, 'min': 60, 'h': 3600, 'hour': 3600, 'd': 86400, 'day': 86400}
+
+
+def parse_rate(rate):
+    """'10/min' -> (capacity 10, refill 10/60 tokens per second)"""
+    count, period = rate.split('/')
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period.strip().lower()]
+
+
+class ServiceOverloaded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'We are receiving a high volume of applications. Please try again shortly.'
+    default_code = 'service_overloaded'
+
+    def __init__(self, wait, detail=None):
+        super().__init__(detail)
+        # Picked up by DRF's exception handler as the Retry-After header
+        self.wait = wait
+
+
+class LocMemTokenBucketBackend:
+    """
+    Token buckets held in process memory
+
+    Buckets that have refilled completely carry no state worth keeping,
+    so they are pruned once the table grows past `max_keys`.
+    """
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, refill_rate):
+        """Take one token; return 0 if allowed, else seconds until one is available"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_rate)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0
+            else:
+                wait = (1 - tokens) / refill_rate
+            # Each bucket records when it will be full again under its own
+            # scope's rate, so pruning never applies one scope's rate to another
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / refill_rate)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+        return wait
+
+    def _prune(self, now):
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket[2] > now}
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = import_string(settings.APPLICATION_THROTTLE_BACKEND)()
+    return _backend
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token-bucket throttle; `scope` selects the rate in APPLICATION_THROTTLE_RATES
+    """
+    scope = None
+
+    def get_key(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        return self.allow_key(self.get_key(request, view))
+
+    def allow_key(self, key):
+        if key is None:
+            return True
+        capacity, refill_rate = parse_rate(settings.APPLICATION_THROTTLE_RATES[self.scope])
+        self.wait_seconds = get_backend().consume(f"{self.scope}:{key}", capacity, refill_rate)
+        return self.wait_seconds == 0
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ApplicationIPThrottle(TokenBucketThrottle):
+    scope = 'ip'
+
+    def get_key(self, request, view):
+        return self.get_ident(request)
+
+
+class ResumeUploadThrottle(TokenBucketThrottle):
+    scope = 'upload'
+
+    def get_key(self, request, view):
+        return self.get_ident(request)
+
+
+class ApplicationJobThrottle(TokenBucketThrottle):
+    scope = 'job'
+
+    def get_key(self, request, view):
+        # From the query string: request.data would parse the whole
+        # multipart body before a request could be refused. Submissions
+        # without it are charged in create() once the body is parsed.
+        return request.query_params.get('job_id') or None
+
+
+class IntakeParseSlots:
+    """
+    Parser slots held by in-flight intake parses
+
+    Each parse holds one of INTAKE_PARSE_MAX_IN_FLIGHT keys in the default
+    cache, so the count covers every web worker when the cache is shared.
+    Slots expire after INTAKE_PARSE_SLOT_TIMEOUT, so a worker killed
+    mid-parse cannot leak capacity.
+    """
+    prefix = 'intake-parse-slot'
+
+    def _keys(self):
+        return [f'{self.prefix}:{i}' for i in range(settings.INTAKE_PARSE_MAX_IN_FLIGHT)]
+
+    def in_use(self):
+        return len(cache.get_many(self._keys()))
+
+    @contextmanager
+    def hold(self):
+        """Hold a free slot for the duration of a parse (parses anyway if none is free)"""
+        keys = self._keys()
+        # Start at a random slot so concurrent requests don't all race for slot 0
+        offset = random.randrange(len(keys)) if keys else 0
+        held = next(
+            (key for key in keys[offset:] + keys[:offset]
+             if cache.add(key, 1, settings.INTAKE_PARSE_SLOT_TIMEOUT)),
+            None
+        )
+        try:
+            yield
+        finally:
+            if held:
+                cache.delete(held)
+
+
+intake_parses = IntakeParseSlots()
+
+
+def check_parse_capacity():
+    """Shed intake while every intake parse slot is taken"""
+    if intake_parses.in_use() >= settings.INTAKE_PARSE_MAX_IN_FLIGHT:
+        raise ServiceOverloaded(wait=settings.PARSE_QUEUE_RETRY_AFTER)
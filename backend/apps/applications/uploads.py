@@ -0,0 +1,225 @@
+"""
+Streaming and resumable resume uploads
+
+Direct uploads (multipart `resume_file` on create) go through
+ResumeUploadHandler. It writes each chunk straight to a temp file and
+checks size, magic bytes and SHA-256 as the data arrives, so worker
+memory stays flat. Under WSGI a bad upload is rejected as soon as it
+shows; Django's ASGI handler spools the whole body to disk before upload
+handlers run, so there the request size is capped in asgi.py instead.
+
+Resumable uploads are sent in chunks to /api/applications/uploads/ and
+appended to a file under RESUME_UPLOAD_TEMP_DIR. When the last chunk is in,
+the upload's token is passed to create as `upload_token`. The temp
+directory must be shared by every worker that serves upload requests.
+"""
+import hashlib
+import os
+import secrets
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+from django.utils import timezone
+
+from .models import ResumeUpload
+
+# Accepted extension -> file signatures
+RESUME_SIGNATURES = {
+    '.pdf': (b'%PDF-',),
+    '.docx': (b'PK\x03\x04',),
+    '.doc': (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1',),
+}
+SIGNATURE_LENGTH = max(len(sig) for sigs in RESUME_SIGNATURES.values() for sig in sigs)
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadRejected(Exception):
+    """Raised when an upload fails the size, type or offset checks"""
+
+
+def resume_extension(filename):
+    return os.path.splitext(filename or '')[1].lower()
+
+
+def check_extension(filename):
+    if resume_extension(filename) not in RESUME_SIGNATURES:
+        raise UploadRejected("Only PDF, DOC, and DOCX files are allowed")
+
+
+def check_signature(filename, head):
+    """The first bytes must match the extension's file type"""
+    if not head.startswith(RESUME_SIGNATURES[resume_extension(filename)]):
+        raise UploadRejected("File content does not match its PDF, DOC or DOCX extension")
+
+
+def check_size(size):
+    limit = settings.RESUME_MAX_UPLOAD_SIZE
+    if size > limit:
+        raise UploadRejected(f"Resume file size cannot exceed {limit // (1024 * 1024)}MB")
+
+
+class ResumeUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams `resume_file` to disk, validating it chunk by chunk
+
+    On rejection the reason is left on the request as
+    `resume_upload_error` and the rest of the body is not read.
+    """
+    field_name = 'resume_file'
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        self.validating = field_name == self.field_name
+        self.head = b''
+        self.digest = hashlib.sha256()
+        if self.validating:
+            self._run(check_extension, file_name)
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.validating:
+            self._run(check_size, start + len(raw_data))
+            if len(self.head) < SIGNATURE_LENGTH:
+                self.head += raw_data[:SIGNATURE_LENGTH - len(self.head)]
+                if len(self.head) == SIGNATURE_LENGTH:
+                    self._run(check_signature, self.file_name, self.head)
+            self.digest.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        if self.validating and len(self.head) < SIGNATURE_LENGTH:
+            # File shorter than the longest signature
+            self._run(check_signature, self.file_name, self.head)
+        uploaded = super().file_complete(file_size)
+        if self.validating:
+            uploaded.sha256 = self.digest.hexdigest()
+        return uploaded
+
+    def _run(self, check, *args):
+        try:
+            check(*args)
+        except UploadRejected as e:
+            self.request.resume_upload_error = str(e)
+            self.file.close()
+            raise StopUpload(connection_reset=True)
+
+
+def _temp_path(upload):
+    return os.path.join(settings.RESUME_UPLOAD_TEMP_DIR, f"{upload.token}.part")
+
+
+def start_upload(filename, size):
+    """Register a resumable upload and return it"""
+    check_extension(filename)
+    check_size(size)
+    if size <= 0:
+        raise UploadRejected("Upload size must be positive")
+    os.makedirs(settings.RESUME_UPLOAD_TEMP_DIR, exist_ok=True)
+    upload = ResumeUpload.objects.create(
+        token=secrets.token_urlsafe(32),
+        filename=os.path.basename(filename),
+        size=size,
+        expires_at=timezone.now() + timedelta(seconds=settings.RESUME_UPLOAD_TTL_SECONDS)
+    )
+    open(_temp_path(upload), 'wb').close()
+    return upload
+
+
+def receive_chunk(upload, stream):
+    """
+    Read a chunk's request body into a spooled temp file, before the
+    upload row is locked, so a slow client never holds the lock
+
+    Raises UploadRejected once the body runs past the declared size.
+    """
+    remaining = upload.size - upload.offset
+    spool = tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE)
+    received = 0
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        received += len(chunk)
+        if received > remaining:
+            spool.close()
+            raise UploadRejected("Chunk runs past the declared upload size")
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def append_chunk(upload, offset, stream):
+    """
+    Append a received chunk (see receive_chunk) at `offset`
+
+    `upload` must be locked (select_for_update) by the caller. Raises
+    UploadRejected for a wrong offset, oversize data or a bad signature.
+    """
+    if offset != upload.offset:
+        raise UploadRejected(f"Expected offset {upload.offset}")
+    path = _temp_path(upload)
+    with open(path, 'r+b') as f:
+        f.seek(offset)
+        end = offset
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if end + len(chunk) > upload.size:
+                f.truncate(offset)
+                raise UploadRejected("Chunk runs past the declared upload size")
+            f.write(chunk)
+            end += len(chunk)
+
+        # Check the signature once the head of the file is in
+        if offset < SIGNATURE_LENGTH <= end or offset < end == upload.size:
+            f.seek(0)
+            try:
+                check_signature(upload.filename, f.read(SIGNATURE_LENGTH))
+            except UploadRejected:
+                f.truncate(0)
+                upload.offset = 0
+                upload.save(update_fields=['offset'])
+                raise
+
+    upload.offset = end
+    if upload.is_complete:
+        upload.sha256 = _hash_file(path)
+    upload.save(update_fields=['offset', 'sha256'])
+    return upload
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_completed_upload(token):
+    """Completed, unexpired upload for a token, or None"""
+    return ResumeUpload.objects.filter(token=token, expires_at__gt=timezone.now()).exclude(sha256='').first()
+
+
+def open_upload(upload):
+    """Django File over the assembled upload, named as the candidate's file"""
+    return File(open(_temp_path(upload), 'rb'), name=upload.filename)
+
+
+def discard_upload(upload):
+    try:
+        os.remove(_temp_path(upload))
+    except FileNotFoundError:
+        pass
+    upload.delete()
+
+
+def prune_expired_uploads():
+    """Remove expired uploads and their temp files, return the number removed"""
+    expired = list(ResumeUpload.objects.filter(expires_at__lte=timezone.now()))
+    for upload in expired:
+        discard_upload(upload)
+    return len(expired)
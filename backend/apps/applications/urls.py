@@ -1,8 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ApplicationViewSet
+from .views import ApplicationViewSet, ArchivedApplicationViewSet, ResumeUploadViewSet, SavedViewViewSet
 
 router = DefaultRouter()
+# Registered first so "archived/", "uploads/" and "views/" are not taken as application ids
+router.register(r'archived', ArchivedApplicationViewSet, basename='archived-application')
+router.register(r'uploads', ResumeUploadViewSet, basename='resume-upload')
+router.register(r'views', SavedViewViewSet, basename='saved-view')
 router.register(r'', ApplicationViewSet, basename='application')
 
 urlpatterns = [
@@ -5,17 +5,47 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse, HttpResponseRedirect
+from django.utils import timezone
 import requests
 import logging
+import io
 import os
 
-from .models import Application, ApplicationStatusHistory
+from .models import Application, ApplicationStatusHistory, ArchivedApplication, ResumeUpload, SavedView
 from .serializers import (
     ApplicationSerializer, ApplicationListSerializer,
     ApplicationCreateSerializer, ApplicationUpdateSerializer,
-    BulkStatusUpdateSerializer, ApplicationStatusHistorySerializer
+    BulkStatusUpdateSerializer, ApplicationStatusHistorySerializer,
+    ApplicationSyncSerializer, ArchivedApplicationSerializer,
+    ArchivedApplicationListSerializer, BulkDeleteSerializer, MatchQuerySerializer,
+    ResumeSearchQuerySerializer, ResumeUploadSerializer, ResumeUploadStartSerializer,
+    SavedViewSerializer, SyncQuerySerializer
 )
+from .deletion import delete_applications, start_file_sweep
+from .facets import FACETS, get_facets
+from .filters import ApplicationFilter
+from .idempotency import (
+    MAX_KEY_LENGTH, request_fingerprint, get_cached_response, store_response,
+    acquire_submission_lock, release_submission_lock, find_duplicate
+)
+from .parsing import parse_resume, apply_parsed_data, ResumeParseError
+from .resume_search import make_snippet, search_resumes, store_resume_texts
+from .saved_views import get_results, reset_view
+from .storage import resume_storage, signed_url, signs_urls
+from .sync import get_changes, InvalidSyncToken, SyncTokenExpired
+from .throttling import (
+    ApplicationIPThrottle, ApplicationJobThrottle, ResumeUploadThrottle, check_parse_capacity,
+    intake_parses
+)
+from .uploads import (
+    ResumeUploadHandler, UploadRejected, append_chunk, discard_upload, receive_chunk, start_upload
+)
+from apps.jobs.matching import match_jobs
 from apps.jobs.models import Job
+from apps.realtime.events import publish_application_event, PARSE_COMPLETE
+from apps.webhooks.outbox import record_event, APPLICATION_PARSED
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +60,150 @@ class IsAuthenticatedOrCreateOnly(permissions.BasePermission):
         return request.user and request.user.is_authenticated
 
 
+class ArchivedApplicationViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only access to applications archived from long-closed jobs
+    """
+    queryset = ArchivedApplication.objects.select_related('job')
+    permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_fields = ['status', 'job']
+    search_fields = ['candidate_name', 'candidate_email']
+    ordering_fields = ['applied_at', 'score', 'candidate_name']
+    ordering = ['-applied_at']
+    
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ArchivedApplicationListSerializer
+        return ArchivedApplicationSerializer
+
+
+class SavedViewViewSet(viewsets.ModelViewSet):
+    """
+    The current user's saved application views
+
+    GET /{id}/results/ pages through the view's materialized result ids
+    (refreshed incrementally, see saved_views.py) and loads only the
+    applications on the requested page.
+    """
+    serializer_class = SavedViewSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        # The materialized results are only read by the results action
+        return SavedView.objects.filter(user=self.request.user).defer('results')
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+    def perform_update(self, serializer):
+        view = serializer.save()
+        if {'criteria', 'ordering'} & set(serializer.validated_data):
+            reset_view(view)
+
+    @action(detail=True, methods=['get'])
+    def results(self, request, pk=None):
+        view = self.get_object()
+        entries = get_results(view)
+        page = self.paginate_queryset(entries)
+        ids = [application_id for _, application_id in page]
+        # Rows deleted since the last refresh are skipped
+        applications = Application.objects.select_related('job').in_bulk(ids)
+        visible = [applications[application_id] for application_id in ids if application_id in applications]
+
+        response = self.get_paginated_response(ApplicationListSerializer(visible, many=True).data)
+        view.refresh_from_db(fields=['truncated', 'refreshed_at'])
+        response.data['truncated'] = view.truncated
+        response.data['refreshed_at'] = view.refreshed_at
+        return response
+
+
+class ResumeUploadViewSet(viewsets.ViewSet):
+    """
+    Resumable resume uploads (public)
+
+    POST {filename, size} starts an upload and returns its token.
+    PATCH /{token}/ with an Upload-Offset header appends the raw request
+    body at that offset; a mismatched offset answers 409 with the current
+    one so the client can resume. GET /{token}/ reports progress.
+    Pass the token of a complete upload to create as `upload_token`.
+    """
+    permission_classes = [permissions.AllowAny]
+    lookup_field = 'token'
+
+    def get_throttles(self):
+        if self.action == 'create':
+            return [ResumeUploadThrottle()]
+        return super().get_throttles()
+
+    def create(self, request):
+        serializer = ResumeUploadStartSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload = start_upload(serializer.validated_data['filename'], serializer.validated_data['size'])
+        except UploadRejected as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        data = ResumeUploadSerializer(upload).data
+        data['chunk_size'] = settings.RESUME_UPLOAD_CHUNK_SIZE
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def retrieve(self, request, token=None):
+        upload = self._get_upload(token)
+        if upload is None:
+            return Response({'error': 'Upload not found or expired'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ResumeUploadSerializer(upload).data, headers={'Upload-Offset': str(upload.offset)})
+
+    def partial_update(self, request, token=None):
+        try:
+            offset = int(request.headers.get('Upload-Offset', ''))
+        except ValueError:
+            return Response({'error': 'Upload-Offset header is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = self._get_upload(token)
+        if upload is None:
+            return Response({'error': 'Upload not found or expired'}, status=status.HTTP_404_NOT_FOUND)
+        if offset != upload.offset:
+            return self._offset_conflict(upload)
+        # Read the body first; the row lock is only held for the append
+        try:
+            chunk = receive_chunk(upload, request.stream or io.BytesIO())
+        except UploadRejected as e:
+            return self._rejected(upload, e)
+
+        with chunk, transaction.atomic():
+            upload = self._get_upload(token, lock=True)
+            if upload is None:
+                return Response({'error': 'Upload not found or expired'}, status=status.HTTP_404_NOT_FOUND)
+            if offset != upload.offset:
+                # Another request appended this chunk meanwhile
+                return self._offset_conflict(upload)
+            try:
+                append_chunk(upload, offset, chunk)
+            except UploadRejected as e:
+                return self._rejected(upload, e)
+        return Response(ResumeUploadSerializer(upload).data, headers={'Upload-Offset': str(upload.offset)})
+
+    def _offset_conflict(self, upload):
+        return Response(
+            {'error': f'Expected offset {upload.offset}', 'offset': upload.offset},
+            status=status.HTTP_409_CONFLICT,
+            headers={'Upload-Offset': str(upload.offset)}
+        )
+
+    def _rejected(self, upload, error):
+        return Response(
+            {'error': str(error), 'offset': upload.offset},
+            status=status.HTTP_400_BAD_REQUEST,
+            headers={'Upload-Offset': str(upload.offset)}
+        )
+
+    def _get_upload(self, token, lock=False):
+        uploads = ResumeUpload.objects.filter(token=token, expires_at__gt=timezone.now())
+        if lock:
+            uploads = uploads.select_for_update()
+        return uploads.first()
+
+
 class ApplicationViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Application CRUD operations
@@ -41,9 +215,11 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrCreateOnly]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['status', 'job']
+    filterset_class = ApplicationFilter
     search_fields = ['candidate_name', 'candidate_email', 'parsed_skills']
-    ordering_fields = ['applied_at', 'updated_at', 'score', 'candidate_name']
+    ordering_fields = [
+        'applied_at', 'updated_at', 'score', 'candidate_name', 'experience_years', 'education_level'
+    ]
     ordering = ['-applied_at']
     
     def get_serializer_class(self):
@@ -55,7 +231,108 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         elif self.action in ['update', 'partial_update']:
             return ApplicationUpdateSerializer
         return ApplicationSerializer
-    
+
+    def initialize_request(self, request, *args, **kwargs):
+        """Stream and check resume uploads as they arrive (see uploads.py)"""
+        drf_request = super().initialize_request(request, *args, **kwargs)
+        if self.action == 'create':
+            request.upload_handlers = [ResumeUploadHandler(request)]
+        return drf_request
+
+    def get_throttles(self):
+        """Public intake is rate limited; recruiter endpoints are not"""
+        if self.action == 'create':
+            return [ApplicationIPThrottle(), ApplicationJobThrottle()]
+        return super().get_throttles()
+
+    def check_throttles(self, request):
+        """
+        Shed load first, then check the buckets in order, stopping at
+        the first refusal so later buckets are not charged for it
+        """
+        if self.action == 'create':
+            check_parse_capacity()
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())
+
+    def create(self, request, *args, **kwargs):
+        """
+        Create an application, idempotently
+
+        A retry with the same Idempotency-Key replays the first response;
+        a resubmission of the same resume for the same job and email within
+        the dedupe window returns the existing application.
+        """
+        idempotency_key = request.headers.get('Idempotency-Key')
+        fingerprint = request_fingerprint(
+            request.data.get('job_id'), request.data.get('candidate_email', '')
+        )
+        if idempotency_key:
+            if len(idempotency_key) > MAX_KEY_LENGTH:
+                return Response(
+                    {'error': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            cached = get_cached_response(idempotency_key)
+            if cached:
+                if cached['fingerprint'] != fingerprint:
+                    return Response(
+                        {'error': 'Idempotency-Key was already used for a different application'},
+                        status=status.HTTP_422_UNPROCESSABLE_ENTITY
+                    )
+                return Response(cached['data'], status=cached['status'], headers={'Idempotent-Replayed': 'true'})
+
+        upload_error = getattr(request._request, 'resume_upload_error', None)
+        if upload_error:
+            return Response({'resume_file': [upload_error]}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        query_job_id = request.query_params.get('job_id')
+        if query_job_id is None:
+            job_throttle = ApplicationJobThrottle()
+            if not job_throttle.allow_key(data['job_id']):
+                self.throttled(request, job_throttle.wait())
+        elif query_job_id != str(data['job_id']):
+            return Response(
+                {'error': 'job_id in the query string does not match the submitted job_id'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        # Set when the file was assembled by a resumable upload
+        resume_upload = getattr(serializer, 'resume_upload', None)
+        try:
+            submission = (data['job_id'], data['candidate_email'], data['resume_sha256'])
+
+            if not acquire_submission_lock(*submission):
+                return Response(
+                    {'error': 'This application is already being submitted'},
+                    status=status.HTTP_409_CONFLICT,
+                    headers={'Retry-After': '5'}
+                )
+            try:
+                duplicate = find_duplicate(*submission)
+                if duplicate:
+                    logger.info(f"Duplicate submission returned existing application {duplicate.id}")
+                    response_status = status.HTTP_200_OK
+                    response_data = self.get_serializer(duplicate).data
+                else:
+                    self.perform_create(serializer)
+                    response_status = status.HTTP_201_CREATED
+                    response_data = serializer.data
+                if idempotency_key:
+                    store_response(idempotency_key, fingerprint, response_status, response_data)
+            finally:
+                release_submission_lock(*submission)
+        finally:
+            if resume_upload is not None:
+                data['resume_file'].close()
+        if resume_upload is not None:
+            discard_upload(resume_upload)
+
+        return Response(response_data, status=response_status, headers=self.get_success_headers(response_data))
+
     def perform_create(self, serializer):
         """
         Create application and call Golang service for resume parsing
@@ -69,52 +346,39 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         # Only parse if not disabled
         if not os.environ.get('DISABLE_RESUME_PARSING'):
-           self._parse_resume(application)
+            with intake_parses.hold():
+                self._parse_resume(application)
     
     def _parse_resume(self, application):
         """
-        Call Golang microservice to parse resume
+        Parse the resume with the configured parser backend
         Feature #6: Resume Parsing & Scoring
         """
         try:
-            # Prepare request data
-            resume_url = self.request.build_absolute_uri(application.resume_file.url)
             job_requirements = application.job.get_requirements_list()
+            parsed_data = parse_resume(
+                application, job_requirements, self.request.build_absolute_uri('/')
+            )
             
-            golang_url = f"{settings.GOLANG_SERVICE_URL}/parse-resume"
-            
-            payload = {
-                "file_url": resume_url,
-                "job_requirements": job_requirements
-            }
-            
-            # Call Golang service
-            response = requests.post(
-                golang_url,
-                json=payload,
-                timeout=180
+            # Update application with parsed data
+            apply_parsed_data(application, parsed_data)
+            with transaction.atomic():
+                application.save()
+                if parsed_data.get('text') is not None:
+                    store_resume_texts([(application.id, parsed_data['text'])])
+                record_event(
+                    application, APPLICATION_PARSED,
+                    score=application.score, skills=application.parsed_skills
+                )
+            publish_application_event(
+                application, PARSE_COMPLETE,
+                score=application.score, skills=application.parsed_skills
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    parsed_data = data.get('data', {})
-                    
-                    # Update application with parsed data
-                    application.parsed_skills = parsed_data.get('skills', [])
-                    application.parsed_experience = parsed_data.get('experience', '')
-                    application.parsed_education = parsed_data.get('education', '')
-                    application.parsed_email = parsed_data.get('email', '')
-                    application.parsed_phone = parsed_data.get('phone', '')
-                    application.score = parsed_data.get('score', 0)
-                    application.save()
-                    
-                    logger.info(f"Resume parsed successfully for application {application.id}")
-                else:
-                    logger.warning(f"Golang service returned error: {data.get('error')}")
-            else:
-                logger.error(f"Golang service error: {response.status_code} - {response.text}")
+            logger.info(f"Resume parsed successfully for application {application.id}")
                 
+        except ResumeParseError as e:
+            logger.error(str(e))
         except requests.exceptions.Timeout:
             logger.error(f"Timeout calling Golang service for application {application.id}")
         except requests.exceptions.ConnectionError:
@@ -139,6 +403,11 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 changed_by=self.request.user
             )
     
+    def perform_destroy(self, instance):
+        """Delete through the batched path so the resume file is swept too"""
+        delete_applications([instance.id])
+        start_file_sweep()
+    
     @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def history(self, request, pk=None):
         """
@@ -149,6 +418,110 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         serializer = ApplicationStatusHistorySerializer(history, many=True)
         return Response(serializer.data)
     
+    @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def resume(self, request, pk=None):
+        """
+        Download the resume file
+
+        Redirects to a short-lived presigned URL on object storage, so the
+        file never passes through the API; streams it from local storage.
+        """
+        application = self.get_object()
+        if not application.resume_file:
+            return Response({'error': 'No resume file'}, status=status.HTTP_404_NOT_FOUND)
+
+        name = application.resume_file.name
+        if signs_urls():
+            return HttpResponseRedirect(signed_url(name, settings.RESUME_URL_EXPIRY))
+        try:
+            resume = resume_storage().open(name, 'rb')
+        except FileNotFoundError:
+            return Response({'error': 'Resume file is missing'}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(resume, as_attachment=True, filename=os.path.basename(name))
+    
+    @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def matches(self, request, pk=None):
+        """
+        Active jobs ranked by how well this candidate's parsed skills cover
+        their required skills (the candidate's own job is left out unless
+        ?include_current=true)
+        """
+        application = self.get_object()
+        query = MatchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        results = match_jobs(
+            application.parsed_skills,
+            exclude_job_id=None if query.validated_data['include_current'] else application.job_id,
+            min_score=query.validated_data['min_score'],
+            limit=query.validated_data['limit'],
+        )
+        return Response({
+            'application_id': application.id,
+            'count': len(results),
+            'results': results
+        })
+    
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def facets(self, request):
+        """
+        Counts by status, job, score bucket and skill for the list filters
+
+        Takes the same query params as the list, plus ?facets=status,skills
+        to pick facets (all by default).
+        """
+        requested = request.query_params.get('facets')
+        facets = [facet.strip() for facet in requested.split(',') if facet.strip()] if requested else list(FACETS)
+        unknown = sorted(set(facets) - set(FACETS))
+        if unknown:
+            return Response(
+                {'error': f"Unknown facets: {', '.join(unknown)}. Choose from {', '.join(FACETS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = self.filter_queryset(Application.objects.all())
+        return Response({'facets': get_facets(queryset, request.query_params, facets)})
+    
+    @action(
+        detail=False, methods=['get'], url_path='resume-search',
+        permission_classes=[permissions.IsAuthenticated]
+    )
+    def resume_search(self, request):
+        """
+        Full-text search over candidates' resume text, best match first
+
+        Query params: q, job, status, limit (capped at RESUME_SEARCH_MAX_RESULTS).
+        """
+        query = ResumeSearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        ranked = search_resumes(
+            params['q'],
+            min(params['limit'], settings.RESUME_SEARCH_MAX_RESULTS),
+            job_id=params.get('job'),
+            status=params.get('status'),
+        )
+        relevance = dict(ranked)
+        position = {application_id: i for i, (application_id, _) in enumerate(ranked)}
+        applications = sorted(
+            Application.objects.filter(id__in=relevance).select_related('job', 'resume_text'),
+            key=lambda application: position[application.id]
+        )
+
+        results = []
+        for application, data in zip(applications, ApplicationListSerializer(applications, many=True).data):
+            results.append({
+                **data,
+                'relevance': relevance[application.id],
+                'snippet': make_snippet(application.resume_text.text, params['q']),
+            })
+        return Response({
+            'query': params['q'],
+            'count': len(results),
+            'results': results
+        })
+    
     @action(detail=False, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def bulk_update(self, request):
         """
@@ -185,6 +558,27 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             'message': f'{updated_count} applications updated to {new_status}'
         })
     
+    @action(detail=False, methods=['post'], permission_classes=[permissions.IsAuthenticated])
+    def bulk_delete(self, request):
+        """
+        Bulk delete applications in indexed batches
+        """
+        serializer = BulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        application_ids = serializer.validated_data['application_ids']
+        batch_size = settings.DELETE_BATCH_SIZE
+        deleted_count = 0
+        for start in range(0, len(application_ids), batch_size):
+            deleted_count += delete_applications(application_ids[start:start + batch_size])
+        start_file_sweep()
+        
+        return Response({
+            'success': True,
+            'deleted_count': deleted_count,
+            'message': f'{deleted_count} applications deleted'
+        })
+    
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def reparse(self, request, pk=None):
         """
@@ -202,3 +596,35 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             'message': 'Resume parsing triggered',
             'data': serializer.data
         })
+    
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def sync(self, request):
+        """
+        Incremental sync: applications changed and deleted since a sync token
+        
+        Query params: token (from the previous response), job, limit.
+        Keep calling with the returned token while has_more is true. The
+        most recent changes may be sent again on the next call; apply them
+        by id.
+        """
+        query = SyncQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        
+        try:
+            changed, deleted_ids, cursor, has_more = get_changes(
+                Application.objects.select_related('job'),
+                token=query.validated_data.get('token'),
+                limit=query.validated_data.get('limit'),
+                job_id=query.validated_data.get('job'),
+            )
+        except InvalidSyncToken as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except SyncTokenExpired as e:
+            return Response({'error': str(e)}, status=status.HTTP_410_GONE)
+        
+        return Response({
+            'changed': ApplicationSyncSerializer(changed, many=True).data,
+            'deleted': deleted_ids,
+            'sync_token': cursor.encode(),
+            'has_more': has_more
+        })
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class DiagnosticsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.diagnostics'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .slow_queries import install
+        connection_created.connect(install, dispatch_uid='diagnostics-slow-query-log')
@@ -0,0 +1,7 @@
+"""
+Request context available to code far from the view, such as DB wrappers
+"""
+from contextvars import ContextVar
+
+# (view, action) of the request being handled, e.g. ('JobViewSet', 'list')
+current_view = ContextVar('current_view', default=('', ''))
@@ -0,0 +1,89 @@
+import io
+import pstats
+from collections import defaultdict
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.diagnostics.profiling import load_profiles, make_profile_token, profile_dir
+
+
+class Command(BaseCommand):
+    help = 'List and summarize captured request profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--view', help='Only profiles for this view, e.g. ApplicationViewSet')
+        parser.add_argument('--action', help='Only profiles for this action, e.g. list')
+        parser.add_argument('--list', action='store_true', help='List individual profiles instead of the summary')
+        parser.add_argument('--show', metavar='PROFILE_ID', help='Print the hottest functions and slowest queries of one profile')
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--mint-token', metavar='USERNAME', help='Print an X-Profile-Token header value for a staff user')
+
+    def handle(self, *args, **options):
+        if options['mint_token']:
+            return self.mint_token(options['mint_token'])
+        if options['show']:
+            return self.show(options['show'], options['limit'])
+
+        profiles = [
+            profile for profile in load_profiles()
+            if (not options['view'] or profile['view'] == options['view'])
+            and (not options['action'] or profile['action'] == options['action'])
+        ]
+        if not profiles:
+            self.stdout.write('No profiles captured')
+            return
+        if options['list']:
+            self.list_profiles(profiles[:options['limit']])
+        else:
+            self.summarize(profiles)
+
+    def mint_token(self, username):
+        try:
+            user = User.objects.get(username=username, is_staff=True, is_active=True)
+        except User.DoesNotExist:
+            raise CommandError(f'No active staff user "{username}"')
+        self.stdout.write(make_profile_token(user))
+
+    def list_profiles(self, profiles):
+        for profile in profiles:
+            self.stdout.write(
+                f"{profile['id']}  {profile['view']}.{profile['action']:<16} "
+                f"{profile['method']} {profile['status']} {profile['duration_ms']:>9.1f} ms  "
+                f"{profile['query_count']:>4} queries {profile['query_ms']:>8.1f} ms  "
+                f"[{profile['trigger']}] {profile['path']}"
+            )
+
+    def summarize(self, profiles):
+        groups = defaultdict(list)
+        for profile in profiles:
+            groups[(profile['view'], profile['action'])].append(profile)
+
+        self.stdout.write(
+            f"{'view.action':<40} {'count':>6} {'avg ms':>9} {'max ms':>9} {'avg queries':>12} {'avg SQL ms':>11}"
+        )
+        rows = sorted(groups.items(), key=lambda item: -sum(p['duration_ms'] for p in item[1]))
+        for (view, action), group in rows:
+            count = len(group)
+            self.stdout.write(
+                f"{view + '.' + action:<40} {count:>6} "
+                f"{sum(p['duration_ms'] for p in group) / count:>9.1f} "
+                f"{max(p['duration_ms'] for p in group):>9.1f} "
+                f"{sum(p['query_count'] for p in group) / count:>12.1f} "
+                f"{sum(p['query_ms'] for p in group) / count:>11.1f}"
+            )
+
+    def show(self, profile_id, limit):
+        profile = next((p for p in load_profiles() if p['id'] == profile_id), None)
+        if profile is None:
+            raise CommandError(f'Profile {profile_id} not found')
+
+        self.list_profiles([profile])
+        output = io.StringIO()
+        stats = pstats.Stats(str(profile_dir() / f'{profile_id}.prof'), stream=output)
+        stats.sort_stats('cumulative').print_stats(limit)
+        self.stdout.write(output.getvalue())
+
+        self.stdout.write('Slowest queries:')
+        for query in sorted(profile['queries'], key=lambda q: -q['duration_ms'])[:limit]:
+            self.stdout.write(f"{query['duration_ms']:>9.2f} ms  {query['sql']}")
@@ -0,0 +1,40 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from apps.diagnostics.slow_queries import read_entries
+
+
+class Command(BaseCommand):
+    help = 'Summarize the slow-query log grouped by SQL fingerprint, costliest first'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=10, help='Number of fingerprints to show')
+        parser.add_argument('--view', help='Only queries issued by this view, e.g. ApplicationViewSet')
+        parser.add_argument('--explain', action='store_true', help='Print the EXPLAIN of the slowest sample')
+
+    def handle(self, *args, **options):
+        groups = defaultdict(list)
+        for entry in read_entries():
+            if options['view'] and entry['view'] != options['view']:
+                continue
+            groups[entry['fingerprint']].append(entry)
+
+        if not groups:
+            self.stdout.write('No slow queries logged')
+            return
+
+        ranked = sorted(groups.items(), key=lambda item: -sum(e['duration_ms'] for e in item[1]))
+        for fingerprint, entries in ranked[:options['limit']]:
+            total = sum(entry['duration_ms'] for entry in entries)
+            slowest = max(entries, key=lambda entry: entry['duration_ms'])
+            sources = sorted({f"{e['view']}.{e['action']}" if e['view'] else '(no view)' for e in entries})
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{fingerprint}  total {total:.1f} ms  count {len(entries)}  "
+                f"avg {total / len(entries):.1f} ms  max {slowest['duration_ms']:.1f} ms"
+            ))
+            self.stdout.write(f"  from: {', '.join(sources)}")
+            self.stdout.write(f"  sql:  {slowest['normalized']}")
+            if options['explain'] and slowest.get('explain'):
+                for row in slowest['explain']:
+                    self.stdout.write(f"    {' | '.join(row)}")
@@ -0,0 +1,95 @@
+"""
+Diagnostics middleware
+
+ProfilingMiddleware: opt-in request profiling. A request is profiled
+when it carries a valid X-Profile-Token header (minted for a staff user
+with `manage.py profiles --mint-token`) or when it is picked by
+1-in-PROFILING_SAMPLE_RATE sampling. Nothing runs unless
+PROFILING_ENABLED is set.
+
+QueryContextMiddleware: records the resolved view/action so slow-query
+log entries can name the code that issued them.
+"""
+import cProfile
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from .context import current_view
+from .profiling import QueryRecorder, describe_view, redacted_path, save_profile, verify_profile_token
+
+logger = logging.getLogger(__name__)
+
+TOKEN_HEADER = 'X-Profile-Token'
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        trigger = self._trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        view, action = describe_view(request)
+        try:
+            profile_id = save_profile(profiler, {
+                'method': request.method,
+                'path': redacted_path(request),
+                'view': view,
+                'action': action,
+                'status': response.status_code,
+                'trigger': trigger,
+                'duration_ms': round(duration_ms, 3),
+                'query_count': len(recorder.queries),
+                'query_ms': round(sum(query['duration_ms'] for query in recorder.queries), 3),
+                'queries': recorder.queries,
+            })
+        except OSError as e:
+            logger.error(f"Could not write profile for {request.path}: {str(e)}")
+            return response
+
+        if trigger == 'header':
+            response['X-Profile-Id'] = profile_id
+        return response
+
+    def _trigger(self, request):
+        if not settings.PROFILING_ENABLED:
+            return None
+        token = request.headers.get(TOKEN_HEADER)
+        if token and verify_profile_token(token):
+            return 'header'
+        rate = settings.PROFILING_SAMPLE_RATE
+        if rate > 0 and random.randrange(rate) == 0:
+            return 'sample'
+        return None
+
+
+class QueryContextMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = current_view.set(('', ''))
+        try:
+            return self.get_response(request)
+        finally:
+            current_view.reset(token)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        current_view.set(describe_view(request))
@@ -0,0 +1,122 @@
+"""
+Request profiling
+
+A profile is a cProfile dump (`<id>.prof`) plus a JSON sidecar
+(`<id>.json`) describing the request and every SQL query it ran, kept in
+PROFILING_DIR. Only the newest PROFILING_MAX_FILES profiles are kept.
+"""
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+TOKEN_SALT = 'apps.diagnostics.profiling'
+
+# Query parameters that carry credentials (e.g. the SSE ?token=<JWT>)
+REDACTED_PARAMS = {'token', 'access', 'refresh', 'password'}
+
+
+def make_profile_token(user):
+    """Signed value for the X-Profile-Token header, bound to a staff user"""
+    return signing.dumps({'u': user.pk}, salt=TOKEN_SALT)
+
+
+def verify_profile_token(token):
+    """Return True if the token is valid, unexpired and its user is still active staff"""
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    return User.objects.filter(pk=payload.get('u'), is_staff=True, is_active=True).exists()
+
+
+def redacted_path(request):
+    """The request path and query string, with credential values replaced"""
+    params = request.GET.copy()
+    for key in REDACTED_PARAMS & set(params):
+        params.setlist(key, ['[redacted]'])
+    query = params.urlencode(safe='[]')
+    return f"{request.path}?{query}" if query else request.path
+
+
+def describe_view(request):
+    """
+    (view, action) for a resolved request, e.g. ('ApplicationViewSet', 'list')
+
+    DRF viewsets expose their class and method -> action mapping on the
+    function returned by as_view().
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return '', ''
+    func = match.func
+    view_class = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+    view = view_class.__name__ if view_class else getattr(func, '__name__', '')
+    actions = getattr(func, 'actions', None) or {}
+    return view, actions.get(request.method.lower(), request.method.lower())
+
+
+class QueryRecorder:
+    """Execute wrapper collecting each query's SQL and duration"""
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.queries.append({'sql': sql, 'duration_ms': round(elapsed, 3), 'many': many})
+
+
+def profile_dir():
+    return Path(settings.PROFILING_DIR)
+
+
+def save_profile(profiler, metadata):
+    """Write a profile and its metadata, then rotate old profiles out"""
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    profile_id = f"{timezone.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+    metadata = {'id': profile_id, 'created_at': timezone.now().isoformat(), **metadata}
+
+    profiler.dump_stats(directory / f"{profile_id}.prof")
+    with open(directory / f"{profile_id}.json", 'w') as f:
+        json.dump(metadata, f)
+    rotate(directory)
+    return profile_id
+
+
+def rotate(directory):
+    profiles = sorted(directory.glob('*.json'), key=os.path.getmtime, reverse=True)
+    for stale in profiles[settings.PROFILING_MAX_FILES:]:
+        for path in (stale, stale.with_suffix('.prof')):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def load_profiles():
+    """Metadata of every stored profile, newest first"""
+    directory = profile_dir()
+    if not directory.exists():
+        return []
+    profiles = []
+    for path in directory.glob('*.json'):
+        try:
+            with open(path) as f:
+                profiles.append(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable profile {path.name}: {str(e)}")
+    return sorted(profiles, key=lambda profile: profile['id'], reverse=True)
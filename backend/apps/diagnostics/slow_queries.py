@@ -0,0 +1,154 @@
+"""
+Slow-query log with EXPLAIN capture
+
+An execute wrapper is installed on every new database connection. Any
+query slower than SLOW_QUERY_THRESHOLD_MS is written as one JSON line to
+SLOW_QUERY_LOG_FILE together with the view/action that ran it, a
+fingerprint of its normalized SQL and its EXPLAIN output, taken on the
+same connection right after the query. Parameter values are personal
+data and only logged with SLOW_QUERY_LOG_PARAMS.
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+from .context import current_view
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_PREFIX = {
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+    'mysql': 'EXPLAIN ',
+    'postgresql': 'EXPLAIN ',
+}
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+_local = threading.local()
+_log = None
+_log_lock = threading.Lock()
+
+
+def normalize_sql(sql):
+    """Replace literals and parameter lists so equivalent queries compare equal"""
+    sql = _STRING.sub('?', sql)
+    sql = sql.replace('%s', '?')
+    sql = _NUMBER.sub('?', sql)
+    sql = _PLACEHOLDER_LIST.sub('(?)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def fingerprint(normalized_sql):
+    return hashlib.sha1(normalized_sql.encode()).hexdigest()[:16]
+
+
+def log_path():
+    return Path(settings.SLOW_QUERY_LOG_FILE)
+
+
+def _get_log():
+    global _log
+    if _log is None:
+        with _log_lock:
+            if _log is None:
+                path = log_path()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                handler = RotatingFileHandler(
+                    path,
+                    maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+                    backupCount=settings.SLOW_QUERY_LOG_BACKUPS
+                )
+                handler.setFormatter(logging.Formatter('%(message)s'))
+                slow_log = logging.getLogger('ats.slow_queries')
+                slow_log.setLevel(logging.INFO)
+                slow_log.propagate = False
+                slow_log.addHandler(handler)
+                _log = slow_log
+    return _log
+
+
+def explain(connection, sql, params):
+    """EXPLAIN rows for a SELECT, or None if it can't be explained here"""
+    prefix = EXPLAIN_PREFIX.get(connection.vendor)
+    if prefix is None or not sql.lstrip().upper().startswith('SELECT'):
+        return None
+    # The EXPLAIN goes through this wrapper too; don't time or explain it
+    _local.explaining = True
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql, params)
+            return [[str(value) for value in row] for row in cursor.fetchall()]
+    except Exception as e:
+        return [[f'EXPLAIN failed: {str(e)}']]
+    finally:
+        _local.explaining = False
+
+
+def slow_query_wrapper(execute, sql, params, many, context):
+    if getattr(_local, 'explaining', False):
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+        try:
+            _record(context['connection'], sql, params, many, duration_ms)
+        except Exception as e:
+            logger.warning(f"Could not record slow query: {str(e)}")
+    return result
+
+
+def _loggable_params(params, many):
+    # Parameters hold candidate data (emails, names, phone numbers)
+    if many or not settings.SLOW_QUERY_LOG_PARAMS:
+        return None
+    return [str(param)[:200] for param in params or []]
+
+
+def _record(connection, sql, params, many, duration_ms):
+    normalized = normalize_sql(sql)
+    view, action = current_view.get()
+    _get_log().info(json.dumps({
+        'at': timezone.now().isoformat(),
+        'view': view,
+        'action': action,
+        'duration_ms': round(duration_ms, 3),
+        'fingerprint': fingerprint(normalized),
+        'normalized': normalized,
+        'sql': sql,
+        'params': _loggable_params(params, many),
+        'explain': None if many else explain(connection, sql, params),
+    }))
+
+
+def install(sender, connection, **kwargs):
+    """connection_created receiver: add the wrapper to each new connection"""
+    if settings.SLOW_QUERY_LOG_ENABLED and slow_query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(slow_query_wrapper)
+
+
+def read_entries():
+    """Every logged entry, oldest rotated file first"""
+    path = log_path()
+    files = [path.with_name(f'{path.name}.{n}') for n in range(settings.SLOW_QUERY_LOG_BACKUPS, 0, -1)]
+    for file in files + [path]:
+        if not file.exists():
+            continue
+        with open(file) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
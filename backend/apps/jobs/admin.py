@@ -7,12 +7,19 @@ class JobAdmin(admin.ModelAdmin):
     list_display = ['title', 'location', 'status', 'created_by', 'created_at', 'application_count']
     list_filter = ['status', 'location', 'created_at']
     search_fields = ['title', 'description', 'requirements']
-    readonly_fields = ['created_at', 'updated_at', 'application_count']
+    readonly_fields = [
+        'created_at', 'updated_at', 'application_count',
+        'requirement_skills', 'requirement_other', 'min_experience_years'
+    ]
     
     fieldsets = (
         ('Job Information', {
             'fields': ('title', 'description', 'requirements', 'location')
         }),
+        ('Normalized Requirements', {
+            'fields': ('requirement_skills', 'requirement_other', 'min_experience_years'),
+            'classes': ('collapse',)
+        }),
         ('Compensation', {
             'fields': ('salary_min', 'salary_max')
         }),
@@ -0,0 +1,89 @@
+"""
+Recruiter dashboard in one response
+
+Replaces the landing page's request waterfall (/auth/me/, /jobs/, then
+/applications/?job= per job) with a fixed number of queries regardless of
+how many jobs the recruiter owns:
+- one aggregate for the ETag validator
+- one for the recruiter's jobs with per-stage counts
+- one for the latest applications of every job (window function)
+"""
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, F, Max, Q, Window
+from django.db.models.functions import RowNumber
+
+from apps.applications.models import Application
+from apps.applications.serializers import ApplicationListSerializer
+from apps.users.serializers import UserSerializer
+from .models import Job
+from .serializers import DashboardJobSerializer
+
+STAGES = [value for value, _ in Application.STATUS_CHOICES]
+
+
+def dashboard_etag(user, latest):
+    """
+    Validator that changes whenever the dashboard content could
+
+    Any job or application write bumps a max(updated_at) or changes a count
+    (including deletes, which skip updated_at).
+    """
+    state = Job.objects.filter(created_by=user).aggregate(
+        job_total=Count('id', distinct=True),
+        job_updated=Max('updated_at'),
+        application_total=Count('applications'),
+        application_updated=Max('applications__updated_at'),
+    )
+    user_data = UserSerializer(user).data
+    raw = f"{latest}|{sorted(user_data.items())}|{sorted(state.items())}"
+    return f'"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+
+def build_dashboard(user, latest):
+    stage_counts = {
+        f'count_{stage}': Count('applications', filter=Q(applications__status=stage))
+        for stage in STAGES
+    }
+    jobs = list(
+        Job.objects.filter(created_by=user)
+        .select_related('created_by')
+        .annotate(total_applications=Count('applications'), **stage_counts)
+        .order_by('-created_at')[:settings.DASHBOARD_MAX_JOBS]
+    )
+    jobs_by_id = {job.id: job for job in jobs}
+
+    latest_by_job = {job.id: [] for job in jobs}
+    if latest > 0 and jobs:
+        applications = (
+            Application.objects.filter(job_id__in=jobs_by_id)
+            # Exactly ApplicationListSerializer's fields: a missing one is a query per row
+            .only(
+                'id', 'job_id', 'candidate_name', 'candidate_email', 'status', 'score',
+                'experience_years', 'education_level', 'applied_at'
+            )
+            .annotate(row=Window(
+                expression=RowNumber(),
+                partition_by=[F('job_id')],
+                order_by=[F('applied_at').desc(), F('id').desc()]
+            ))
+            .filter(row__lte=latest)
+            .order_by('job_id', 'row')
+        )
+        for application in applications:
+            # Reuse the loaded job so the serializer doesn't fetch it again
+            application.job = jobs_by_id[application.job_id]
+            latest_by_job[application.job_id].append(application)
+
+    return {
+        'user': UserSerializer(user).data,
+        'jobs': [
+            {
+                **DashboardJobSerializer(job).data,
+                'stage_counts': {stage: getattr(job, f'count_{stage}') for stage in STAGES},
+                'latest_applications': ApplicationListSerializer(latest_by_job[job.id], many=True).data,
+            }
+            for job in jobs
+        ],
+    }
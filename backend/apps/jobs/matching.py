@@ -0,0 +1,112 @@
+"""
+Candidate-to-job matching
+
+Ranks active jobs for a set of candidate skills with the parser's score:
+the share of the job's requirements (get_requirements_list(): canonical
+skills plus free-text items) the candidate covers. Each active job is
+held in memory as a sparse skill vector where every requirement weighs
+1 / (number of requirements). Vectors live in an inverted index
+(skill -> [(job, weight)]), so a query only touches jobs sharing at least
+one canonical skill with the candidate; free-text items of those jobs
+are then matched with the parser's substring rule.
+
+The index is rebuilt in each process when the shared 'job-matching' cache
+version changes. Every job save/delete bumps that version (see signals.py).
+"""
+import heapq
+import threading
+from collections import defaultdict
+
+from apps.applications.caching import bump_version, get_version
+from apps.applications.text_analyzer import requirement_matched
+from .models import Job
+from .skills import canonical_skill_id, skill_name
+
+NAMESPACE = 'job-matching'
+
+
+def invalidate_index():
+    bump_version(NAMESPACE)
+
+
+class MatchIndex:
+    def __init__(self, rows):
+        self.postings = defaultdict(list)
+        self.jobs = {}
+        for job_id, title, location, skills, other in rows:
+            skills = list(dict.fromkeys(skills or []))
+            if not skills:
+                continue
+            other = list(other or [])
+            weight = 1.0 / (len(skills) + len(other))
+            self.jobs[job_id] = {
+                'title': title, 'location': location, 'skills': skills, 'other': other, 'weight': weight
+            }
+            for skill_id in skills:
+                self.postings[skill_id].append((job_id, weight))
+
+    def rank(self, skill_ids, skill_names=(), exclude_job_id=None, min_score=0, limit=10):
+        scores = defaultdict(float)
+        for skill_id in skill_ids:
+            for job_id, weight in self.postings.get(skill_id, ()):
+                scores[job_id] += weight
+        scores.pop(exclude_job_id, None)
+
+        names_lower = {name.strip().lower() for name in skill_names}
+        matched_other = {}
+        for job_id in scores:
+            job = self.jobs[job_id]
+            matched_other[job_id] = [item for item in job['other'] if requirement_matched(item, names_lower)]
+            scores[job_id] += len(matched_other[job_id]) * job['weight']
+
+        # Small slack so summed fractions like 3 * (1/3) still reach 100
+        threshold = min_score / 100 - 1e-9
+        ranked = heapq.nlargest(
+            limit,
+            ((score, job_id) for job_id, score in scores.items() if score >= threshold)
+        )
+        results = []
+        for score, job_id in ranked:
+            job = self.jobs[job_id]
+            matched = matched_other[job_id]
+            results.append({
+                'job_id': job_id,
+                'title': job['title'],
+                'location': job['location'],
+                'score': min(int(score * 100 + 1e-9), 100),
+                'matched_skills': [skill_name(s) for s in job['skills'] if s in skill_ids] + matched,
+                'missing_skills': (
+                    [skill_name(s) for s in job['skills'] if s not in skill_ids] +
+                    [item for item in job['other'] if item not in matched]
+                ),
+            })
+        return results
+
+
+_index = None
+_index_version = None
+_lock = threading.Lock()
+
+
+def get_index():
+    """This process's index, rebuilt if a job changed since it was built"""
+    global _index, _index_version
+    version = get_version(NAMESPACE)
+    if _index is None or _index_version != version:
+        with _lock:
+            if _index is None or _index_version != version:
+                rows = Job.objects.filter(status='active').values_list(
+                    'id', 'title', 'location', 'requirement_skills', 'requirement_other'
+                )
+                _index = MatchIndex(rows)
+                _index_version = version
+    return _index
+
+
+def match_jobs(parsed_skills, exclude_job_id=None, min_score=0, limit=10):
+    """Best active jobs for a candidate's parsed skills, highest score first"""
+    skill_ids = {canonical_skill_id(name) for name in parsed_skills or []}
+    skill_ids.discard(None)
+    if not skill_ids:
+        return []
+    return get_index().rank(skill_ids, parsed_skills, exclude_job_id, min_score, limit)
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """Create the vendor's full-text index over title, description, requirements"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'mysql':
+        schema_editor.execute(
+            "ALTER TABLE jobs_job ADD FULLTEXT INDEX jobs_job_fulltext "
+            "(title, description, requirements)"
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE jobs_job_fts USING fts5"
+            "(title, description, requirements, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            "INSERT INTO jobs_job_fts (rowid, title, description, requirements) "
+            "SELECT id, title, description, requirements FROM jobs_job"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'mysql':
+        schema_editor.execute("ALTER TABLE jobs_job DROP INDEX jobs_job_fulltext")
+    elif vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS jobs_job_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:18
+
+from django.db import migrations, models
+
+
+def normalize_existing_requirements(apps, schema_editor):
+    from apps.jobs.requirements import normalize_requirements
+    
+    Job = apps.get_model('jobs', 'Job')
+    for job in Job.objects.only('id', 'requirements').iterator():
+        skills, other, min_experience = normalize_requirements(job.requirements)
+        Job.objects.filter(pk=job.pk).update(
+            requirement_skills=skills,
+            requirement_other=other,
+            min_experience_years=min_experience
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='min_experience_years',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='requirement_other',
+            field=models.JSONField(blank=True, default=list, help_text='Free-text requirements'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='requirement_skills',
+            field=models.JSONField(blank=True, default=list, help_text='Canonical skill IDs'),
+        ),
+        migrations.RunPython(normalize_existing_requirements, migrations.RunPython.noop),
+    ]
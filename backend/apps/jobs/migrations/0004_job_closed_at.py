@@ -0,0 +1,26 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:20
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_closed_at(apps, schema_editor):
+    # Best available estimate for jobs closed before closed_at existed
+    Job = apps.get_model('jobs', 'Job')
+    Job.objects.filter(status='closed', closed_at__isnull=True).update(closed_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_normalized_requirements'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_closed_at, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+from .requirements import normalize_requirements
+from .skills import skill_name
 
 
 class Job(models.Model):
@@ -19,10 +23,16 @@ class Job(models.Model):
     salary_max = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
     
+    # Normalized from `requirements` on save (see requirements.py)
+    requirement_skills = models.JSONField(default=list, blank=True, help_text="Canonical skill IDs")
+    requirement_other = models.JSONField(default=list, blank=True, help_text="Free-text requirements")
+    min_experience_years = models.PositiveSmallIntegerField(null=True, blank=True)
+    
     # Metadata
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='jobs_created')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    closed_at = models.DateTimeField(null=True, blank=True, db_index=True)
     
     class Meta:
         ordering = ['-created_at']
@@ -30,15 +40,71 @@ class Job(models.Model):
     def __str__(self):
         return f"{self.title} - {self.status}"
     
+    def save(self, *args, **kwargs):
+        """Normalize requirements once so readers never re-parse the text"""
+        (
+            self.requirement_skills,
+            self.requirement_other,
+            self.min_experience_years
+        ) = normalize_requirements(self.requirements)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'requirements' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {
+                'requirement_skills', 'requirement_other', 'min_experience_years'
+            }
+        
+        # Track when the posting was closed (drives archival)
+        if self.status == 'closed' and self.closed_at is None:
+            self.closed_at = timezone.now()
+        elif self.status != 'closed':
+            self.closed_at = None
+        if update_fields is not None and 'status' in update_fields:
+            kwargs['update_fields'] = set(kwargs['update_fields']) | {'closed_at'}
+        super().save(*args, **kwargs)
+    
     @property
     def application_count(self):
         """Return count of applications for this job"""
         return self.applications.count()
     
     def get_requirements_list(self):
-        """Parse requirements into a list"""
-        if not self.requirements:
-            return []
-        # Split by newlines or commas
-        requirements = self.requirements.replace('\n', ',').split(',')
-        return [req.strip() for req in requirements if req.strip()]
+        """
+        Requirements as sent to the scorer: skill names plus free-text items
+        
+        Experience figures are kept out - they are not skills and only
+        dragged scores down as unmatched tokens.
+        """
+        return [skill_name(skill_id) for skill_id in self.requirement_skills] + list(self.requirement_other)
+
+
+class JobDeletion(models.Model):
+    """
+    Progress of a batched job deletion (outlives the job it deletes)
+    """
+    STATUS_CHOICES = [
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    job_id = models.BigIntegerField(db_index=True)
+    job_title = models.CharField(max_length=200)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='running')
+    total = models.PositiveIntegerField(default=0)
+    deleted = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    started_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='job_deletions'
+    )
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-started_at']
+    
+    def __str__(self):
+        return f"Delete job {self.job_id} ({self.status}) {self.deleted}/{self.total}"
@@ -0,0 +1,73 @@
+"""
+Requirement text normalization
+
+Turns the free-form `Job.requirements` text into a structured form once,
+on save, so scoring and matching never re-parse it:
+
+    "Python, Django, 5+ years experience, Strong communication"
+    -> skills: ['python', 'django']
+       other: ['Strong communication']
+       min_experience_years: 5
+"""
+import re
+
+from .skills import find_skills
+
+# Requirements are written one per line, comma-separated or as bullets
+SEPARATOR_PATTERN = re.compile(r'[\n,;•]+')
+BULLET_PATTERN = re.compile(r'^[\s\-*•·>]+|\s+$')
+EXPERIENCE_PATTERN = re.compile(
+    r'(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years?|yrs?)'
+    r'(?:\s+(?:of\s+)?(?:professional\s+|relevant\s+|industry\s+)?experience)?',
+    re.IGNORECASE
+)
+FILLER_PATTERN = re.compile(
+    r'^(?:experience|exp|minimum|min|at least|with|in|of|and|or)$',
+    re.IGNORECASE
+)
+
+
+def split_requirements(text):
+    """Split raw requirement text into trimmed, non-empty items"""
+    if not text:
+        return []
+    items = (BULLET_PATTERN.sub('', item) for item in SEPARATOR_PATTERN.split(text))
+    return [re.sub(r'\s+', ' ', item) for item in items if item]
+
+
+def normalize_requirements(text):
+    """
+    Parse requirement text into (skills, other, min_experience_years)
+
+    - skills: canonical skill IDs, in first-mention order
+    - other: free-text requirements that name no known skill
+    - min_experience_years: the largest "N+ years" figure, or None
+    """
+    skills = []
+    other = []
+    seen_other = set()
+    min_experience = None
+
+    for item in split_requirements(text):
+        remainder = item
+        for match in EXPERIENCE_PATTERN.finditer(item):
+            years = int(match.group(1))
+            min_experience = years if min_experience is None else max(min_experience, years)
+            remainder = remainder.replace(match.group(0), ' ')
+
+        item_skills = find_skills(remainder)
+        for skill_id in item_skills:
+            if skill_id not in skills:
+                skills.append(skill_id)
+        if item_skills:
+            continue
+
+        # Drop what is left of an experience item ("5+ years experience")
+        words = [word for word in remainder.split() if not FILLER_PATTERN.match(word)]
+        if not words:
+            continue
+        if item.lower() not in seen_other:
+            seen_other.add(item.lower())
+            other.append(item)
+
+    return skills, other, min_experience
@@ -0,0 +1,160 @@
+"""
+Full-text search over job postings
+
+Replaces SearchFilter's `icontains` scans over the description and
+requirements TextFields with the database's full-text index:
+- MySQL: FULLTEXT index on (title, description, requirements)
+- SQLite: FTS5 virtual table (local development and tests)
+
+Other databases fall back to the stock SearchFilter behaviour.
+
+The match and its relevance are expressions on the jobs queryset, so the
+view's status/location filters, the ordering and the pagination all run
+in the same query as the ranking.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from rest_framework.filters import OrderingFilter, SearchFilter
+
+FTS_TABLE = 'jobs_job_fts'
+FULLTEXT_INDEX = 'jobs_job_fulltext'
+
+
+def tokenize(query):
+    """Split a user query into plain word tokens (drops search operators)"""
+    return re.findall(r'\w+', query.lower())
+
+
+class BaseSearchBackend:
+    """
+    Full-text backend interface
+
+    filter() narrows a Job queryset to the matches and annotates
+    `relevance` (higher is better); tokens are never empty.
+    index()/remove() keep the index in sync for backends that need it.
+    """
+    def filter(self, queryset, tokens):
+        raise NotImplementedError
+
+    def index(self, job):
+        pass
+
+    def remove(self, job_id):
+        pass
+
+
+class MySQLFullTextBackend(BaseSearchBackend):
+    """
+    InnoDB FULLTEXT index - maintained by MySQL itself on every write
+    """
+    def filter(self, queryset, tokens):
+        # Boolean mode: every term required, prefix match for search-as-you-type
+        against = ' '.join(f'+{token}*' for token in tokens)
+        relevance = RawSQL(
+            "MATCH(jobs_job.title, jobs_job.description, jobs_job.requirements) AGAINST (%s IN BOOLEAN MODE)",
+            [against],
+            output_field=FloatField()
+        )
+        # MATCH(...) > 0 in the WHERE clause is served by the FULLTEXT index
+        return queryset.annotate(relevance=relevance).filter(relevance__gt=0)
+
+
+class SQLiteFTS5Backend(BaseSearchBackend):
+    """
+    FTS5 virtual table keyed on the job id (rowid), synced on Job save
+    """
+    # bm25 column weights: title, description, requirements
+    WEIGHTS = (10.0, 1.0, 3.0)
+
+    def filter(self, queryset, tokens):
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        weights = ', '.join(str(weight) for weight in self.WEIGHTS)
+        # bm25 is lower-is-better; flip it so relevance sorts descending
+        relevance = RawSQL(
+            f"SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = jobs_job.id",
+            [match],
+            output_field=FloatField()
+        )
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        ).annotate(relevance=relevance)
+
+    def index(self, job):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description, requirements) "
+                f"VALUES (%s, %s, %s, %s)",
+                [job.pk, job.title, job.description, job.requirements]
+            )
+
+    def remove(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [job_id])
+
+
+VENDOR_BACKENDS = {
+    'mysql': MySQLFullTextBackend,
+    'sqlite': SQLiteFTS5Backend,
+}
+
+_backend = None
+
+
+def get_search_backend():
+    """
+    Return the configured backend, or pick one for the database vendor
+
+    Returns None when the database has no supported full-text index.
+    """
+    global _backend
+    if _backend is None:
+        if settings.JOB_SEARCH_BACKEND:
+            _backend = import_string(settings.JOB_SEARCH_BACKEND)()
+        else:
+            backend_class = VENDOR_BACKENDS.get(connection.vendor)
+            _backend = backend_class() if backend_class else False
+    return _backend or None
+
+
+class JobSearchFilter(SearchFilter):
+    """
+    SearchFilter backed by the full-text index
+
+    Matching jobs are annotated with `relevance` (higher is better) so
+    RelevanceOrderingFilter can sort on it.
+    """
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        backend = get_search_backend()
+        if backend is None:
+            return super().filter_queryset(request, queryset, view)
+
+        tokens = tokenize(' '.join(search_terms))
+        if not tokens:
+            return queryset.none()
+        return backend.filter(queryset, tokens)
+
+
+class RelevanceOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that sorts search results by relevance unless the
+    client asked for an explicit ordering
+    """
+    def filter_queryset(self, request, queryset, view):
+        if not self.get_ordering_from_params(request) and 'relevance' in queryset.query.annotations:
+            return queryset.order_by('-relevance', '-created_at')
+        return super().filter_queryset(request, queryset, view)
+
+    def get_ordering_from_params(self, request):
+        params = request.query_params.get(self.ordering_param)
+        return [param.strip() for param in params.split(',')] if params else []
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Job
+from .models import Job, JobDeletion
 from apps.users.serializers import UserSerializer
 
 
@@ -15,9 +15,13 @@ class JobSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'requirements', 'location',
             'salary_min', 'salary_max', 'status', 'created_by',
-            'created_at', 'updated_at', 'application_count'
+            'created_at', 'updated_at', 'application_count',
+            'requirement_skills', 'requirement_other', 'min_experience_years'
+        ]
+        read_only_fields = [
+            'id', 'created_at', 'updated_at', 'created_by',
+            'requirement_skills', 'requirement_other', 'min_experience_years'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at', 'created_by']
     
     def validate(self, data):
         """Validate salary range"""
@@ -47,6 +51,14 @@ class JobListSerializer(serializers.ModelSerializer):
         ]
 
 
+class DashboardJobSerializer(JobListSerializer):
+    """
+    Job listing row for the dashboard, reading the count annotated by the
+    dashboard query instead of counting per job
+    """
+    application_count = serializers.IntegerField(source='total_applications', read_only=True)
+
+
 class JobCreateUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and updating jobs
@@ -69,3 +81,20 @@ class JobCreateUpdateSerializer(serializers.ModelSerializer):
             })
         
         return data
+
+
+class JobDeletionSerializer(serializers.ModelSerializer):
+    """
+    Progress of a batched job deletion
+    """
+    remaining = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = JobDeletion
+        fields = [
+            'id', 'job_id', 'job_title', 'status', 'total', 'deleted',
+            'remaining', 'error', 'started_at', 'finished_at'
+        ]
+    
+    def get_remaining(self, obj):
+        return max(obj.total - obj.deleted, 0)
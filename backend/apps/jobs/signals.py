@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .matching import invalidate_index
+from .models import Job
+from .search import get_search_backend
+
+
+@receiver(post_save, sender=Job)
+def job_saved(sender, instance, **kwargs):
+    """Keep the full-text and matching indexes in sync"""
+    backend = get_search_backend()
+    if backend is not None:
+        backend.index(instance)
+    invalidate_index()
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted(sender, instance, **kwargs):
+    backend = get_search_backend()
+    if backend is not None:
+        backend.remove(instance.pk)
+    invalidate_index()
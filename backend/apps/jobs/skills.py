@@ -0,0 +1,189 @@
+"""
+Canonical skill vocabulary
+
+Mirrors the keyword list in the Go parser (parsers/text_analyzer.go) so
+requirement skills and parsed resume skills share one set of IDs.
+"""
+import re
+
+# Canonical skill ID -> display name (the name the Go parser reports)
+SKILLS = {
+    # Programming Languages
+    'python': 'Python',
+    'java': 'Java',
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'go': 'Go',
+    'cpp': 'C++',
+    'csharp': 'C#',
+    'ruby': 'Ruby',
+    'php': 'PHP',
+    'swift': 'Swift',
+    'kotlin': 'Kotlin',
+    'rust': 'Rust',
+    'scala': 'Scala',
+    'r': 'R',
+    'matlab': 'MATLAB',
+
+    # Web Technologies
+    'html': 'HTML',
+    'css': 'CSS',
+    'react': 'React',
+    'angular': 'Angular',
+    'vue': 'Vue',
+    'nodejs': 'Node.js',
+    'express': 'Express',
+    'django': 'Django',
+    'flask': 'Flask',
+    'fastapi': 'FastAPI',
+    'spring': 'Spring',
+    'aspnet': 'ASP.NET',
+    'jquery': 'jQuery',
+
+    # Databases
+    'sql': 'SQL',
+    'mysql': 'MySQL',
+    'postgresql': 'PostgreSQL',
+    'mongodb': 'MongoDB',
+    'redis': 'Redis',
+    'oracle': 'Oracle',
+    'sql_server': 'SQL Server',
+    'mariadb': 'MariaDB',
+    'cassandra': 'Cassandra',
+    'dynamodb': 'DynamoDB',
+    'sqlite': 'SQLite',
+
+    # Cloud & DevOps
+    'aws': 'AWS',
+    'azure': 'Azure',
+    'gcp': 'GCP',
+    'docker': 'Docker',
+    'kubernetes': 'Kubernetes',
+    'jenkins': 'Jenkins',
+    'git': 'Git',
+    'github': 'GitHub',
+    'gitlab': 'GitLab',
+    'ci_cd': 'CI/CD',
+    'terraform': 'Terraform',
+    'ansible': 'Ansible',
+
+    # Data Science & ML
+    'machine_learning': 'Machine Learning',
+    'deep_learning': 'Deep Learning',
+    'tensorflow': 'TensorFlow',
+    'pytorch': 'PyTorch',
+    'scikit_learn': 'scikit-learn',
+    'pandas': 'Pandas',
+    'numpy': 'NumPy',
+    'data_analysis': 'Data Analysis',
+    'nlp': 'NLP',
+
+    # Mobile Development
+    'android': 'Android',
+    'ios': 'iOS',
+    'react_native': 'React Native',
+    'flutter': 'Flutter',
+    'xamarin': 'Xamarin',
+
+    # Other
+    'rest_api': 'REST API',
+    'graphql': 'GraphQL',
+    'microservices': 'Microservices',
+    'agile': 'Agile',
+    'scrum': 'Scrum',
+    'linux': 'Linux',
+    'unix': 'Unix',
+    'windows_server': 'Windows Server',
+    'networking': 'Networking',
+    'security': 'Security',
+}
+
+# Alternative spellings -> canonical skill ID
+ALIASES = {
+    'golang': 'go',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'c#': 'csharp',
+    'c++': 'cpp',
+    'node': 'nodejs',
+    'node js': 'nodejs',
+    'nodejs': 'nodejs',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vue.js': 'vue',
+    'vuejs': 'vue',
+    'postgres': 'postgresql',
+    'mssql': 'sql_server',
+    'mongo': 'mongodb',
+    'amazon web services': 'aws',
+    'google cloud': 'gcp',
+    'google cloud platform': 'gcp',
+    'k8s': 'kubernetes',
+    'ci cd': 'ci_cd',
+    'ml': 'machine_learning',
+    'sklearn': 'scikit_learn',
+    'scikit learn': 'scikit_learn',
+    'rest': 'rest_api',
+    'restful api': 'rest_api',
+    'restful apis': 'rest_api',
+    'rest apis': 'rest_api',
+    'micro services': 'microservices',
+}
+
+# Plain words this short are only recognised as a whole requirement
+# ("Go", "R"), never inside a longer phrase ("Go-getter", "R&D")
+MIN_EMBEDDED_LENGTH = 3
+
+# Ordinary English words that only count as skills on their own
+WHOLE_ONLY = {'rest', 'node'}
+
+
+def _normalize(text):
+    return re.sub(r'\s+', ' ', text.strip().lower())
+
+
+def _build_lookup():
+    lookup = {}
+    for skill_id, name in SKILLS.items():
+        lookup[_normalize(name)] = skill_id
+        lookup[skill_id.replace('_', ' ')] = skill_id
+    for alias, skill_id in ALIASES.items():
+        lookup[_normalize(alias)] = skill_id
+    return lookup
+
+
+SKILL_LOOKUP = _build_lookup()
+
+# Longest names first so "React Native" wins over "React"
+_EMBEDDED_PATTERN = re.compile(
+    r'(?<![\w+#.])(' + '|'.join(
+        re.escape(name) for name in sorted(SKILL_LOOKUP, key=len, reverse=True)
+        if (len(name) >= MIN_EMBEDDED_LENGTH or not name.isalpha()) and name not in WHOLE_ONLY
+    ) + r')(?![\w+#])'
+)
+
+
+def canonical_skill_id(name):
+    """Return the canonical ID for a skill name or alias, or None"""
+    if not name:
+        return None
+    return SKILL_LOOKUP.get(_normalize(name))
+
+
+def find_skills(text):
+    """Return canonical IDs of every known skill mentioned in a phrase, in order"""
+    normalized = _normalize(text)
+    whole = SKILL_LOOKUP.get(normalized)
+    if whole:
+        return [whole]
+    found = []
+    for match in _EMBEDDED_PATTERN.finditer(normalized):
+        skill_id = SKILL_LOOKUP[match.group(1)]
+        if skill_id not in found:
+            found.append(skill_id)
+    return found
+
+
+def skill_name(skill_id):
+    """Display name for a canonical skill ID"""
+    return SKILLS.get(skill_id, skill_id)
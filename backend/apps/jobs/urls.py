@@ -1,8 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import JobViewSet
+from .views import JobViewSet, JobDeletionViewSet
 
 router = DefaultRouter()
+# Registered first so "deletions/" is not taken as a job id
+router.register(r'deletions', JobDeletionViewSet, basename='job-deletion')
 router.register(r'', JobViewSet, basename='job')
 
 urlpatterns = [
@@ -1,10 +1,14 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.conf import settings
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
-from .models import Job
-from .serializers import JobSerializer, JobListSerializer, JobCreateUpdateSerializer
+from .models import Job, JobDeletion
+from .search import JobSearchFilter, RelevanceOrderingFilter
+from .serializers import (
+    JobSerializer, JobListSerializer, JobCreateUpdateSerializer, JobDeletionSerializer
+)
 
 
 class IsAuthenticatedOrReadOnly(permissions.BasePermission):
@@ -17,6 +21,43 @@ class IsAuthenticatedOrReadOnly(permissions.BasePermission):
         return request.user and request.user.is_authenticated
 
 
+class DashboardView(APIView):
+    """
+    Recruiter landing page data in one request: the current user, their
+    jobs with per-stage counts and the latest applications of each job
+
+    ?latest=N sets how many applications per job (default
+    DASHBOARD_LATEST_APPLICATIONS). Supports If-None-Match.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        from .dashboard import build_dashboard, dashboard_etag
+        try:
+            latest = int(request.query_params.get('latest', settings.DASHBOARD_LATEST_APPLICATIONS))
+        except ValueError:
+            return Response({'error': 'latest must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        latest = max(0, min(latest, settings.DASHBOARD_MAX_LATEST_APPLICATIONS))
+
+        etag = dashboard_etag(request.user, latest)
+        if etag in request.headers.get('If-None-Match', ''):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(build_dashboard(request.user, latest))
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+class JobDeletionViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Progress of batched job deletions
+    """
+    queryset = JobDeletion.objects.all()
+    serializer_class = JobDeletionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+
 class JobViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Job CRUD operations
@@ -26,8 +67,9 @@ class JobViewSet(viewsets.ModelViewSet):
     """
     queryset = Job.objects.all()
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, JobSearchFilter, RelevanceOrderingFilter]
     filterset_fields = ['status', 'location']
+    # Served from the full-text index (see search.py); these are the fallback
     search_fields = ['title', 'description', 'requirements']
     ordering_fields = ['created_at', 'title', 'application_count']
     ordering = ['-created_at']
@@ -40,20 +82,79 @@ class JobViewSet(viewsets.ModelViewSet):
             return JobCreateUpdateSerializer
         return JobSerializer
     
+    def filter_queryset(self, queryset):
+        """
+        List filters apply to job listings only - detail actions take their
+        own query parameters (e.g. application ?status=) and must not have
+        them applied to the job lookup
+        """
+        if self.detail:
+            return queryset
+        return super().filter_queryset(queryset)
+    
     def perform_create(self, serializer):
         """Set created_by to current user"""
         serializer.save(created_by=self.request.user)
     
+    def destroy(self, request, *args, **kwargs):
+        """
+        Delete a job with the batched deletion path
+        
+        Returns 204 when done inline, or 202 with a progress record
+        (see /api/jobs/deletions/{id}/) for large jobs.
+        """
+        job = self.get_object()
+        from apps.applications.deletion import start_job_deletion
+        deletion = start_job_deletion(job, request.user)
+        if deletion.status == 'running':
+            return Response(JobDeletionSerializer(deletion).data, status=status.HTTP_202_ACCEPTED)
+        if deletion.status == 'failed':
+            return Response(
+                JobDeletionSerializer(deletion).data,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    
     @action(detail=True, methods=['get'], permission_classes=[permissions.AllowAny])
     def applications(self, request, pk=None):
         """
-        Get all applications for a specific job
+        Get applications for a specific job, highest score first (paginated)
         """
         job = self.get_object()
         from apps.applications.serializers import ApplicationListSerializer
-        applications = job.applications.all()
-        serializer = ApplicationListSerializer(applications, many=True)
-        return Response(serializer.data)
+        applications = job.applications.select_related('job').order_by('-score', 'id')
+        
+        status_filter = request.query_params.get('status')
+        if status_filter:
+            applications = applications.filter(status=status_filter)
+        
+        page = self.paginate_queryset(applications)
+        serializer = ApplicationListSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+    
+    @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
+    def leaderboard(self, request, pk=None):
+        """
+        Top-K candidates for a job, optionally within one status and above a score cut-off
+        """
+        job = self.get_object()
+        from apps.applications.leaderboard import get_leaderboard
+        from apps.applications.serializers import LeaderboardQuerySerializer
+        
+        query = LeaderboardQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        
+        results = get_leaderboard(
+            job,
+            status=query.validated_data.get('status'),
+            min_score=query.validated_data.get('min_score'),
+            limit=query.validated_data['limit'],
+        )
+        return Response({
+            'job_id': job.id,
+            'count': len(results),
+            'results': results
+        })
     
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def close(self, request, pk=None):
@@ -69,10 +170,60 @@ class JobViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def reopen(self, request, pk=None):
         """
-        Reopen a closed job posting
+        Reopen a closed job posting, restoring any archived applications
+        
+        Returns 202 when a large archive is being restored in the background;
+        its applications reappear batch by batch. Reopening again resumes a
+        restore that failed part way.
         """
         job = self.get_object()
+        # Active first, so the archiver leaves the job alone while it restores
         job.status = 'active'
         job.save()
+        from apps.applications.archive import start_restore
+        finished = start_restore(job)
         serializer = self.get_serializer(job)
+        if not finished:
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
         return Response(serializer.data)
+    
+    @action(
+        detail=True, methods=['get', 'post', 'delete'],
+        permission_classes=[permissions.IsAuthenticated]
+    )
+    def reparse_all(self, request, pk=None):
+        """
+        Batch re-parse every application for this job
+        
+        GET: progress of the latest run
+        POST: start a run ({"resume": true} continues the latest unfinished run)
+        DELETE: cancel the running run after its current batch
+        """
+        job = self.get_object()
+        from apps.applications.reparse import start_reparse, cancel_reparse, ReparseConflict
+        from apps.applications.serializers import ReparseRunSerializer, ReparseStartSerializer
+        
+        if request.method == 'POST':
+            options = ReparseStartSerializer(data=request.data)
+            options.is_valid(raise_exception=True)
+            try:
+                run = start_reparse(
+                    job,
+                    request.user,
+                    base_url=request.build_absolute_uri('/'),
+                    resume=options.validated_data['resume']
+                )
+            except ReparseConflict as e:
+                return Response({'error': str(e)}, status=status.HTTP_409_CONFLICT)
+            return Response(ReparseRunSerializer(run).data, status=status.HTTP_202_ACCEPTED)
+        
+        run = job.reparse_runs.first()
+        if run is None:
+            return Response(
+                {'error': 'No reparse run for this job'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        if request.method == 'DELETE':
+            run = cancel_reparse(run)
+        return Response(ReparseRunSerializer(run).data)
@@ -0,0 +1,40 @@
+"""
+ASGI wrapper that ends SSE streams when the client goes away
+
+Django 4.2's ASGI handler stops reading `receive` once the request body
+is consumed, so it never sees `http.disconnect` while a streaming
+response is open and the stream would keep running for a closed socket.
+This wrapper owns `receive` for stream paths and cancels the response
+task on disconnect, which runs the stream's cleanup (unsubscribe).
+"""
+import asyncio
+from contextlib import suppress
+
+
+def disconnect_aware(app, path_prefix):
+    async def wrapper(scope, receive, send):
+        if scope['type'] != 'http' or not scope['path'].startswith(path_prefix):
+            return await app(scope, receive, send)
+
+        messages = asyncio.Queue()
+        response = asyncio.ensure_future(app(scope, messages.get, send))
+        try:
+            while True:
+                receiver = asyncio.ensure_future(receive())
+                done, _ = await asyncio.wait(
+                    {response, receiver}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if response in done:
+                    receiver.cancel()
+                    return response.result()
+                message = receiver.result()
+                await messages.put(message)
+                if message['type'] == 'http.disconnect':
+                    break
+        finally:
+            if not response.done():
+                response.cancel()
+                with suppress(asyncio.CancelledError):
+                    await response
+
+    return wrapper
@@ -0,0 +1,138 @@
+"""
+In-process event broker for Server-Sent Events
+
+Publishers (sync views, model saves) call `broker.publish()`; the
+configured backend carries the event to every process that has
+subscribers and hands it back to `EventBroker.deliver()`, which fans it
+out to the asyncio queues of the open SSE connections in this process.
+
+The default InProcessBackend delivers directly, which is enough for a
+single backend process. A multi-process deployment plugs in a backend
+that relays through a shared channel (e.g. Redis pub/sub) by subclassing
+BaseBackend and setting REALTIME_BROKER_BACKEND.
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class BaseBackend:
+    """
+    Transport between publishers and the broker's local subscribers
+    """
+    def __init__(self, deliver):
+        self.deliver = deliver
+
+    def publish(self, channel, event):
+        raise NotImplementedError
+
+
+class InProcessBackend(BaseBackend):
+    """
+    Deliver events to subscribers in the publishing process only
+    """
+    def publish(self, channel, event):
+        self.deliver(channel, event)
+
+
+class Subscription:
+    """
+    One SSE connection's view of the broker
+
+    Events are pushed from any thread and consumed on the connection's
+    event loop. A slow client drops its oldest events instead of growing
+    the queue without bound.
+    """
+    def __init__(self, broker, channels, loop):
+        self.broker = broker
+        self.channels = channels
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=settings.REALTIME_QUEUE_SIZE)
+
+    def push(self, event):
+        """Thread-safe enqueue"""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """Wait for the next event, or return None after `timeout` seconds"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class EventBroker:
+    """
+    Channel-based fan-out to SSE subscribers
+    """
+    def __init__(self, backend_class):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+        self.backend = backend_class(self.deliver)
+
+    def subscribe(self, channels):
+        """Register a subscription on the running event loop"""
+        subscription = Subscription(self, channels, asyncio.get_running_loop())
+        with self._lock:
+            for channel in channels:
+                self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def publish(self, channel, event):
+        try:
+            self.backend.publish(channel, event)
+        except Exception as e:
+            logger.error(f"Failed to publish event on {channel}: {str(e)}")
+
+    def deliver(self, channel, event):
+        """Hand an event to every local subscriber of a channel"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.push(event)
+            except RuntimeError:
+                # Event loop already closed - the connection is gone
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """Return the process-wide broker, creating it on first use"""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = EventBroker(import_string(settings.REALTIME_BROKER_BACKEND))
+    return _broker
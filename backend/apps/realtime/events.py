@@ -0,0 +1,42 @@
+"""
+Application events pushed to SSE subscribers
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .broker import get_broker
+
+PARSE_COMPLETE = 'parse-complete'
+SCORE_UPDATED = 'score-updated'
+STATUS_CHANGED = 'status-changed'
+
+
+def job_channel(job_id):
+    return f"job:{job_id}"
+
+
+def application_channel(application_id):
+    return f"application:{application_id}"
+
+
+def publish_application_event(application, event_type, **data):
+    """
+    Publish an event on the application's job and application channels
+    once the surrounding transaction commits
+    """
+    event = {
+        'event': event_type,
+        'data': {
+            'application_id': application.id,
+            'job_id': application.job_id,
+            'timestamp': timezone.now().isoformat(),
+            **data
+        }
+    }
+
+    def send():
+        broker = get_broker()
+        broker.publish(job_channel(application.job_id), event)
+        broker.publish(application_channel(application.id), event)
+
+    transaction.on_commit(send)
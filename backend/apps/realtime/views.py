@@ -0,0 +1,96 @@
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from apps.users.authentication import RevocableJWTAuthentication
+
+from .broker import get_broker
+from .events import application_channel, job_channel
+
+logger = logging.getLogger(__name__)
+
+
+async def _authenticate(request):
+    """
+    Authenticate from the Authorization header or a ?token= query param
+    (EventSource cannot set request headers)
+    """
+    authenticator = RevocableJWTAuthentication()
+    header = authenticator.get_header(request)
+    raw_token = authenticator.get_raw_token(header) if header else request.GET.get('token')
+    if not raw_token:
+        return None
+    try:
+        # The revocation check may poll the database
+        validated_token = await sync_to_async(authenticator.get_validated_token)(raw_token)
+        user = await sync_to_async(authenticator.get_user)(validated_token)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+    return user if user.is_active else None
+
+
+def _parse_channels(request):
+    """Build the channel set from ?job= and ?application= (comma-separated ids)"""
+    channels = set()
+    for param, channel_for in (('job', job_channel), ('application', application_channel)):
+        for value in request.GET.get(param, '').split(','):
+            if value.strip():
+                channels.add(channel_for(int(value)))
+    return channels
+
+
+def _format_event(event):
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+async def _stream(channels):
+    subscription = get_broker().subscribe(channels)
+    try:
+        yield f"retry: {settings.REALTIME_RETRY_MS}\n\n"
+        while True:
+            event = await subscription.get(settings.REALTIME_HEARTBEAT_SECONDS)
+            if event is None:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+            yield _format_event(event)
+    finally:
+        subscription.close()
+
+
+async def event_stream(request):
+    """
+    Server-Sent Events stream of application events
+
+    Events: parse-complete, score-updated, status-changed
+    Query params: job and/or application (comma-separated ids), token
+    Requires the ASGI app - each open stream is one idle coroutine.
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    user = await _authenticate(request)
+    if user is None:
+        return JsonResponse(
+            {'detail': 'Authentication credentials were not provided.'},
+            status=401
+        )
+
+    try:
+        channels = _parse_channels(request)
+    except ValueError:
+        return JsonResponse({'error': 'job and application must be integer ids'}, status=400)
+    if not channels:
+        return JsonResponse({'error': 'Provide at least one job or application id'}, status=400)
+
+    logger.info(f"SSE stream opened by {user.username} for {sorted(channels)}")
+
+    response = StreamingHttpResponse(_stream(channels), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
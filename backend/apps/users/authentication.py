@@ -0,0 +1,20 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from .revocation import denylist
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that also rejects revoked tokens
+
+    The revocation check is an in-memory lookup (see revocation.py).
+    """
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if denylist.is_revoked(validated_token.payload):
+            raise InvalidToken({
+                'detail': 'Token has been revoked',
+                'code': 'token_revoked',
+            })
+        return validated_token
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.users.revocation import prune_revoked_tokens
+
+
+class Command(BaseCommand):
+    help = 'Delete token revocations whose tokens have all expired'
+
+    def handle(self, *args, **options):
+        deleted = prune_revoked_tokens()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired revocations'))
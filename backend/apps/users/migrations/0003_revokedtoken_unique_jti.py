@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+def blank_jti_to_null(apps, schema_editor):
+    RevokedToken = apps.get_model('users', 'RevokedToken')
+    RevokedToken.objects.filter(jti='').update(jti=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='revokedtoken',
+            name='jti',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.RunPython(blank_jti_to_null, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='revokedtoken',
+            name='jti',
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+    ]
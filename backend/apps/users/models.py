@@ -15,3 +15,33 @@ class RecruiterProfile(models.Model):
     
     def __str__(self):
         return f"{self.user.username} - {self.company}"
+
+
+class RevokedToken(models.Model):
+    """
+    A revoked JWT, or a per-user cutoff
+
+    A row with a `jti` revokes that one token; the jti is unique, so a
+    token can only be revoked (and a refresh token rotated) once. A row
+    with `not_before`
+    revokes every token of `user` issued before that time (password change,
+    deactivation). Rows are only needed until `expires_at`, when the tokens
+    they cover have expired anyway. Each process mirrors the table in
+    memory (see revocation.py).
+    """
+    # NULL for per-user cutoffs (a unique column allows several NULLs)
+    jti = models.CharField(max_length=255, null=True, blank=True, unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='revoked_tokens')
+    not_before = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField()
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+    
+    def __str__(self):
+        if self.jti:
+            return f"Revoked token {self.jti}"
+        return f"Tokens of user {self.user_id} issued before {self.not_before}"
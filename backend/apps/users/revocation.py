@@ -0,0 +1,130 @@
+"""
+Server-side JWT revocation
+
+Revocations are written to RevokedToken and mirrored in every process by
+an in-memory denylist, so authenticating a request checks revocation
+with two dict lookups and no query:
+- revoked jti -> expiry
+- user id (as a string) -> (not-before cutoff, expiry)
+
+The denylist catches up by polling the table for rows revoked since the
+last poll, at most once every TOKEN_REVOCATION_POLL_SECONDS. Each poll
+re-reads TOKEN_REVOCATION_POLL_OVERLAP seconds of rows in case a row was
+committed after a later one was already seen. Entries are dropped once
+their tokens have expired, so memory stays bounded by the revocations of
+one token lifetime. A revocation made in this process applies here at
+once; other processes see it within one poll interval.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken
+
+
+def _timestamp(value):
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+class TokenDenylist:
+    def __init__(self):
+        self._jtis = {}
+        self._users = {}
+        self._cursor = None
+        self._next_poll = 0.0
+        self._lock = threading.RLock()
+
+    def is_revoked(self, payload):
+        """True if the token with these claims has been revoked"""
+        self.sync()
+        if payload.get(api_settings.JTI_CLAIM) in self._jtis:
+            return True
+        # The user id claim may be a string (simplejwt stringifies it)
+        cutoff = self._users.get(str(payload.get(api_settings.USER_ID_CLAIM)))
+        # iat has whole-second precision; a token from the cutoff's own second stays valid
+        return cutoff is not None and payload.get('iat', 0) < int(cutoff[0])
+
+    def add(self, revoked):
+        """Mirror one RevokedToken row"""
+        expires = _timestamp(revoked.expires_at)
+        with self._lock:
+            if revoked.jti:
+                self._jtis[revoked.jti] = expires
+            elif revoked.user_id is not None:
+                not_before = _timestamp(revoked.not_before)
+                user_key = str(revoked.user_id)
+                current = self._users.get(user_key)
+                if current is None or current[0] < not_before:
+                    self._users[user_key] = (not_before, max(expires, current[1] if current else 0))
+
+    def sync(self, force=False):
+        """Pull revocations made since the last poll (rate limited unless forced)"""
+        now = time.monotonic()
+        if not force and now < self._next_poll:
+            return
+        with self._lock:
+            if not force and now < self._next_poll:
+                return
+            self._next_poll = now + settings.TOKEN_REVOCATION_POLL_SECONDS
+
+            rows = RevokedToken.objects.filter(expires_at__gt=timezone.now())
+            if self._cursor is not None:
+                overlap = timedelta(seconds=settings.TOKEN_REVOCATION_POLL_OVERLAP)
+                rows = rows.filter(revoked_at__gt=self._cursor - overlap)
+            for revoked in rows.order_by('revoked_at').iterator():
+                self.add(revoked)
+                self._cursor = revoked.revoked_at if self._cursor is None else max(self._cursor, revoked.revoked_at)
+            if self._cursor is None:
+                self._cursor = timezone.now()
+            self._prune()
+
+    def _prune(self):
+        now = time.time()
+        self._jtis = {jti: expires for jti, expires in self._jtis.items() if expires > now}
+        self._users = {user_id: entry for user_id, entry in self._users.items() if entry[1] > now}
+
+
+denylist = TokenDenylist()
+
+
+def revoke_token(token):
+    """
+    Revoke one access or refresh token (a simplejwt Token)
+
+    Returns None if it was already revoked, by this or any other process.
+    """
+    try:
+        with transaction.atomic():
+            revoked = RevokedToken.objects.create(
+                jti=token[api_settings.JTI_CLAIM],
+                user_id=token.get(api_settings.USER_ID_CLAIM),
+                expires_at=datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc)
+            )
+    except IntegrityError:
+        return None
+    denylist.add(revoked)
+    return revoked
+
+
+def revoke_user_tokens(user):
+    """Revoke every token issued to a user so far"""
+    now = timezone.now()
+    revoked = RevokedToken.objects.create(
+        user=user,
+        not_before=now,
+        # No token issued before now outlives the longest token lifetime
+        expires_at=now + max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+    )
+    denylist.add(revoked)
+    return revoked
+
+
+def prune_revoked_tokens():
+    """Delete rows whose tokens have all expired, return the number deleted"""
+    deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
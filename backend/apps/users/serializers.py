@@ -1,6 +1,12 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 from .models import RecruiterProfile
+from .revocation import denylist, revoke_token
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -53,3 +59,58 @@ class RecruiterProfileSerializer(serializers.ModelSerializer):
         model = RecruiterProfile
         fields = ['id', 'user', 'phone', 'company', 'created_at']
         read_only_fields = ['id', 'created_at']
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh that refuses revoked refresh tokens and, with rotation on,
+    revokes the refresh token it replaces
+
+    The revocation is inserted before the new pair is issued; the unique
+    jti makes a concurrent or replayed refresh of the same token fail,
+    even on a process whose denylist has not caught up yet.
+    """
+    def validate(self, attrs):
+        refresh = RefreshToken(attrs['refresh'])
+        revoked = denylist.is_revoked(refresh.payload)
+        if not revoked and api_settings.ROTATE_REFRESH_TOKENS:
+            revoked = revoke_token(refresh) is None
+        if revoked:
+            raise InvalidToken({
+                'detail': 'Token has been revoked',
+                'code': 'token_revoked',
+            })
+        return super().validate(attrs)
+
+
+class LogoutSerializer(serializers.Serializer):
+    """
+    Optional refresh token to revoke along with the current access token
+    """
+    refresh = serializers.CharField(required=False)
+    
+    def validate_refresh(self, value):
+        try:
+            token = RefreshToken(value)
+        except TokenError:
+            raise serializers.ValidationError("Invalid refresh token")
+        if str(token.get(api_settings.USER_ID_CLAIM)) != str(self.context['request'].user.id):
+            raise serializers.ValidationError("Refresh token belongs to another user")
+        return token
+
+
+class ChangePasswordSerializer(serializers.Serializer):
+    """
+    Serializer for changing the current user's password
+    """
+    old_password = serializers.CharField(write_only=True)
+    new_password = serializers.CharField(write_only=True, min_length=8)
+    
+    def validate_old_password(self, value):
+        if not self.context['request'].user.check_password(value):
+            raise serializers.ValidationError("Current password is incorrect")
+        return value
+    
+    def validate_new_password(self, value):
+        validate_password(value, self.context['request'].user)
+        return value
@@ -0,0 +1,30 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from .revocation import revoke_user_tokens
+
+# Fields whose change ends every session of the user
+SESSION_FIELDS = {'password', 'is_active'}
+
+
+@receiver(pre_save, sender=User)
+def note_credential_change(sender, instance, update_fields=None, **kwargs):
+    """Flag a password change or deactivation for user_saved below"""
+    instance._revoke_tokens = False
+    if instance.pk is None or (update_fields is not None and not SESSION_FIELDS & set(update_fields)):
+        return
+    old = User.objects.filter(pk=instance.pk).values('password', 'is_active').first()
+    if old is not None:
+        instance._revoke_tokens = (
+            old['password'] != instance.password
+            or (old['is_active'] and not instance.is_active)
+        )
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    """Revoke the user's tokens after a password change or deactivation"""
+    if getattr(instance, '_revoke_tokens', False):
+        instance._revoke_tokens = False
+        revoke_user_tokens(instance)
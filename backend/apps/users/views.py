@@ -2,8 +2,13 @@ from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth.models import User
-from .serializers import RegisterSerializer, UserSerializer, RecruiterProfileSerializer
+from rest_framework_simplejwt.tokens import RefreshToken
+from .serializers import (
+    RegisterSerializer, UserSerializer, RecruiterProfileSerializer,
+    LogoutSerializer, ChangePasswordSerializer
+)
 from .models import RecruiterProfile
+from .revocation import revoke_token
 
 
 class RegisterView(generics.CreateAPIView):
@@ -38,11 +43,45 @@ class CurrentUserView(APIView):
 
 class LogoutView(APIView):
     """
-    Logout view (client-side token removal)
+    Logout: revoke the access token used for this request, and the
+    refresh token if one is sent as `refresh`
     """
     permission_classes = [permissions.IsAuthenticated]
     
     def post(self, request):
+        serializer = LogoutSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        
+        if request.auth is not None:
+            revoke_token(request.auth)
+        if serializer.validated_data.get('refresh'):
+            revoke_token(serializer.validated_data['refresh'])
+        
         return Response({
             'message': 'Logged out successfully'
         }, status=status.HTTP_200_OK)
+
+
+class ChangePasswordView(APIView):
+    """
+    Change the current user's password
+
+    Every token issued before the change is revoked (see signals.py);
+    the response carries a fresh token pair for this client.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def post(self, request):
+        serializer = ChangePasswordSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        
+        user = request.user
+        user.set_password(serializer.validated_data['new_password'])
+        user.save()
+        
+        refresh = RefreshToken.for_user(user)
+        return Response({
+            'message': 'Password changed successfully',
+            'refresh': str(refresh),
+            'access': str(refresh.access_token)
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,21 @@
+from django.contrib import admin
+from .models import OutboxEvent, Webhook
+
+
+@admin.register(Webhook)
+class WebhookAdmin(admin.ModelAdmin):
+    list_display = ['name', 'url', 'is_active', 'last_event_id', 'failures', 'last_delivered_at']
+    list_filter = ['is_active']
+    search_fields = ['name', 'url']
+    readonly_fields = [
+        'last_event_id', 'last_delivered_at', 'failures', 'next_attempt_at',
+        'last_error', 'locked_until', 'created_at', 'updated_at'
+    ]
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'event_type', 'application_id', 'job_id', 'created_at']
+    list_filter = ['event_type']
+    search_fields = ['=application_id']
+    readonly_fields = ['event_type', 'application_id', 'job_id', 'payload', 'created_at']
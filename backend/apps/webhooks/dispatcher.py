@@ -0,0 +1,155 @@
+"""
+Webhook delivery from the outbox
+
+Each webhook receives events in id order, up to WEBHOOK_BATCH_SIZE per
+POST, and its cursor only moves past a batch once the endpoint answers
+2xx. A failed batch is retried with capped exponential backoff before
+anything newer is sent, so one application's events always arrive in
+the order they were written. Retries may repeat events; receivers
+deduplicate on the event id.
+
+Webhooks are served concurrently by a thread pool sharing one pooled
+HTTP session, so a slow or failing endpoint only delays itself. Several
+dispatchers can run at once: a webhook is leased (locked_until) to one
+of them while a batch is in flight.
+
+Events become deliverable OUTBOX_SETTLE_SECONDS after they are written.
+Ids are allocated before commit, so a lower id can become visible after
+a higher one; the delay lets such transactions finish before the cursor
+moves past them.
+"""
+import hashlib
+import hmac
+import json
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboxEvent, Webhook
+
+logger = logging.getLogger(__name__)
+
+
+class DeliveryError(Exception):
+    """Raised when an endpoint does not accept a batch"""
+
+
+def retry_delay(failures):
+    """Seconds to wait after `failures` consecutive failed batches, with jitter"""
+    delay = min(settings.WEBHOOK_RETRY_BASE_SECONDS * 2 ** (failures - 1), settings.WEBHOOK_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1)
+
+
+def sign(secret, body):
+    return 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def make_session(concurrency):
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class Dispatcher:
+    def __init__(self, workers=None):
+        self.workers = workers or settings.WEBHOOK_DISPATCH_WORKERS
+        self.session = make_session(self.workers)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='webhook')
+
+    def close(self):
+        self.executor.shutdown()
+        self.session.close()
+
+    def run_once(self):
+        """
+        Deliver the next batch of every due webhook, return the number of
+        events the cursors moved past (0 means there is nothing to do)
+        """
+        now = timezone.now()
+        due = (
+            Webhook.objects.filter(is_active=True)
+            .filter(Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now))
+            .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+            .values_list('id', flat=True)
+        )
+        futures = [self.executor.submit(self._deliver_next, webhook_id) for webhook_id in due]
+        return sum(future.result() for future in futures)
+
+    def _claim(self, webhook_id):
+        """Lease the webhook to this dispatcher, or None if another has it"""
+        now = timezone.now()
+        claimed = (
+            Webhook.objects.filter(pk=webhook_id, is_active=True)
+            .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+            .update(locked_until=now + timedelta(seconds=settings.WEBHOOK_LEASE_SECONDS))
+        )
+        return Webhook.objects.filter(pk=webhook_id).first() if claimed else None
+
+    def _deliver_next(self, webhook_id):
+        # Pool threads are long-lived; drop connections the server has closed
+        close_old_connections()
+        webhook = self._claim(webhook_id)
+        if webhook is None:
+            return 0
+
+        settled = timezone.now() - timedelta(seconds=settings.OUTBOX_SETTLE_SECONDS)
+        events = list(
+            OutboxEvent.objects.filter(id__gt=webhook.last_event_id, created_at__lte=settled)
+            .order_by('id')[:settings.WEBHOOK_BATCH_SIZE]
+        )
+        batch = [event for event in events if webhook.wants(event.event_type)]
+        try:
+            if batch:
+                self._post(webhook, batch)
+        except Exception as e:
+            failures = webhook.failures + 1
+            Webhook.objects.filter(pk=webhook.pk).update(
+                failures=failures,
+                next_attempt_at=timezone.now() + timedelta(seconds=retry_delay(failures)),
+                last_error=str(e)[:1000],
+                locked_until=None
+            )
+            logger.warning(f"Webhook {webhook.id} delivery failed ({failures} in a row): {str(e)}")
+            return 0
+
+        update = {'locked_until': None}
+        if events:
+            update['last_event_id'] = events[-1].id
+        if batch:
+            update['last_delivered_at'] = timezone.now()
+            logger.info(f"Delivered {len(batch)} events to webhook {webhook.id}")
+        if webhook.failures:
+            update.update(failures=0, next_attempt_at=None, last_error='')
+        Webhook.objects.filter(pk=webhook.pk).update(**update)
+        return len(events)
+
+    def _post(self, webhook, events):
+        body = json.dumps({
+            'webhook': webhook.id,
+            'events': [
+                {
+                    'id': event.id,
+                    'type': event.event_type,
+                    'created_at': event.created_at,
+                    'data': event.payload,
+                }
+                for event in events
+            ]
+        }, cls=DjangoJSONEncoder).encode()
+        headers = {'Content-Type': 'application/json'}
+        if webhook.secret:
+            headers['X-ATS-Signature'] = sign(webhook.secret, body)
+
+        response = self.session.post(webhook.url, data=body, headers=headers, timeout=settings.WEBHOOK_TIMEOUT)
+        if not 200 <= response.status_code < 300:
+            raise DeliveryError(f"HTTP {response.status_code}: {response.text[:200]}")
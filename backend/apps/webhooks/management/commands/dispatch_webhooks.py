@@ -0,0 +1,30 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.webhooks.dispatcher import Dispatcher
+
+
+class Command(BaseCommand):
+    help = 'Deliver outbox events to registered webhooks (runs until stopped unless --once)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Deliver until the outbox is drained, then exit')
+        parser.add_argument('--workers', type=int, default=None, help='Webhooks delivered concurrently')
+        parser.add_argument('--poll-interval', type=float, default=None, help='Seconds to sleep when idle')
+
+    def handle(self, *args, **options):
+        poll_interval = options['poll_interval'] or settings.WEBHOOK_POLL_INTERVAL
+        dispatcher = Dispatcher(options['workers'])
+        try:
+            while True:
+                if dispatcher.run_once():
+                    continue
+                if options['once']:
+                    break
+                time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            dispatcher.close()
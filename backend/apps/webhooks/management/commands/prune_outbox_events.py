@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.webhooks.outbox import prune_outbox
+
+
+class Command(BaseCommand):
+    help = 'Delete outbox events older than OUTBOX_RETENTION_DAYS that every active webhook has received'
+
+    def handle(self, *args, **options):
+        deleted = prune_outbox()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} outbox events'))
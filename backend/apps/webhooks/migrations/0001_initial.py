@@ -0,0 +1,54 @@
+# Generated by Django 4.2.27 on 2026-10-19 02:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('application.created', 'Application created'), ('application.parsed', 'Application parsed'), ('application.status_changed', 'Application status changed')], max_length=50)),
+                ('application_id', models.BigIntegerField(db_index=True)),
+                ('job_id', models.BigIntegerField()),
+                ('payload', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Webhook',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('url', models.URLField(max_length=500)),
+                ('secret', models.CharField(blank=True, help_text='Signs each delivery (X-ATS-Signature: sha256=<HMAC of the body>)', max_length=100)),
+                ('event_types', models.JSONField(blank=True, default=list, help_text='Empty for every event type')),
+                ('is_active', models.BooleanField(default=True)),
+                ('last_event_id', models.BigIntegerField(default=0)),
+                ('last_delivered_at', models.DateTimeField(blank=True, null=True)),
+                ('failures', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='webhooks', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
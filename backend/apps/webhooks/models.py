@@ -0,0 +1,82 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class Webhook(models.Model):
+    """
+    External endpoint that receives ATS events (see dispatcher.py)
+
+    Events are delivered in id order; `last_event_id` is the delivery
+    cursor - every event up to it has been sent, or skipped because its
+    type is not in `event_types`.
+    """
+    name = models.CharField(max_length=200)
+    url = models.URLField(max_length=500)
+    secret = models.CharField(
+        max_length=100, blank=True,
+        help_text="Signs each delivery (X-ATS-Signature: sha256=<HMAC of the body>)"
+    )
+    event_types = models.JSONField(default=list, blank=True, help_text="Empty for every event type")
+    is_active = models.BooleanField(default=True)
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='webhooks'
+    )
+
+    # Delivery cursor
+    last_event_id = models.BigIntegerField(default=0)
+    last_delivered_at = models.DateTimeField(null=True, blank=True)
+
+    # Retry state: consecutive failed batches and when to try again
+    failures = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    # Lease held by the dispatcher process delivering a batch
+    locked_until = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.name} ({self.url})"
+
+    def wants(self, event_type):
+        return not self.event_types or event_type in self.event_types
+
+
+class OutboxEvent(models.Model):
+    """
+    ATS event written in the same transaction as the change it describes
+
+    Ids increase in commit order per application, so delivering in id
+    order preserves each application's event order.
+    """
+    APPLICATION_CREATED = 'application.created'
+    APPLICATION_PARSED = 'application.parsed'
+    APPLICATION_STATUS_CHANGED = 'application.status_changed'
+
+    EVENT_TYPE_CHOICES = [
+        (APPLICATION_CREATED, 'Application created'),
+        (APPLICATION_PARSED, 'Application parsed'),
+        (APPLICATION_STATUS_CHANGED, 'Application status changed'),
+    ]
+
+    event_type = models.CharField(max_length=50, choices=EVENT_TYPE_CHOICES)
+    # Plain ids: events outlive the applications they describe
+    application_id = models.BigIntegerField(db_index=True)
+    job_id = models.BigIntegerField()
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.event_type} for application {self.application_id}"
@@ -0,0 +1,60 @@
+"""
+Transactional outbox for ATS events
+
+Writers call record_event() inside the transaction that changes the
+application, so an event exists exactly when its change committed. The
+dispatcher (dispatcher.py) delivers events to webhooks afterwards, out
+of the request path.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Min
+from django.utils import timezone
+
+from .models import OutboxEvent, Webhook
+
+APPLICATION_CREATED = OutboxEvent.APPLICATION_CREATED
+APPLICATION_PARSED = OutboxEvent.APPLICATION_PARSED
+APPLICATION_STATUS_CHANGED = OutboxEvent.APPLICATION_STATUS_CHANGED
+
+
+def _event(application, event_type, data):
+    return OutboxEvent(
+        event_type=event_type,
+        application_id=application.id,
+        job_id=application.job_id,
+        payload={
+            'application_id': application.id,
+            'job_id': application.job_id,
+            **data
+        }
+    )
+
+
+def record_event(application, event_type, **data):
+    """Write one event - call inside the transaction making the change"""
+    event = _event(application, event_type, data)
+    event.save()
+    return event
+
+
+def record_events(events):
+    """Write [(application, event_type, data)] in one insert"""
+    return OutboxEvent.objects.bulk_create([
+        _event(application, event_type, data) for application, event_type, data in events
+    ])
+
+
+def prune_outbox():
+    """
+    Delete events older than OUTBOX_RETENTION_DAYS that every active
+    webhook has received, return the count
+    """
+    cutoff = timezone.now() - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+    events = OutboxEvent.objects.filter(created_at__lt=cutoff)
+    lowest_cursor = Webhook.objects.filter(is_active=True).aggregate(cursor=Min('last_event_id'))['cursor']
+    if lowest_cursor is not None:
+        events = events.filter(id__lte=lowest_cursor)
+    deleted, _ = events.delete()
+    return deleted
@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from .models import OutboxEvent, Webhook
+
+EVENT_TYPES = [event_type for event_type, _ in OutboxEvent.EVENT_TYPE_CHOICES]
+
+
+class WebhookSerializer(serializers.ModelSerializer):
+    """
+    Webhook registration and its delivery state
+    """
+    event_types = serializers.ListField(
+        child=serializers.ChoiceField(choices=EVENT_TYPES), required=False
+    )
+
+    class Meta:
+        model = Webhook
+        fields = [
+            'id', 'name', 'url', 'secret', 'event_types', 'is_active',
+            'last_event_id', 'last_delivered_at', 'failures', 'next_attempt_at',
+            'last_error', 'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'id', 'last_event_id', 'last_delivered_at', 'failures',
+            'next_attempt_at', 'last_error', 'created_at', 'updated_at'
+        ]
+        extra_kwargs = {'secret': {'write_only': True}}
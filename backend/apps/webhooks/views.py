@@ -0,0 +1,19 @@
+from django.db.models import Max
+from rest_framework import viewsets, permissions
+
+from .models import OutboxEvent, Webhook
+from .serializers import WebhookSerializer
+
+
+class WebhookViewSet(viewsets.ModelViewSet):
+    """
+    Register webhooks for ATS events (staff only)
+    """
+    queryset = Webhook.objects.all()
+    serializer_class = WebhookSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+    def perform_create(self, serializer):
+        # Start from events written after registration, not the whole outbox
+        latest = OutboxEvent.objects.aggregate(latest=Max('id'))['latest'] or 0
+        serializer.save(created_by=self.request.user, last_event_id=latest)
@@ -1,9 +1,64 @@
 """
 ASGI config for ats_backend project.
+
+Serves the SSE endpoint (/api/events/) without tying up a worker per
+open stream. Run with an ASGI worker, e.g.:
+    gunicorn ats_backend.asgi -k uvicorn.workers.UvicornWorker
+
+Django's ASGI handler reads the whole request body to a temp file before
+any view or upload handler sees it, so oversized bodies are cut off here,
+while they arrive.
 """
+import json
 import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ats_backend.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402 (needs Django set up)
+from apps.realtime.asgi import disconnect_aware  # noqa: E402
+
+
+def limit_body_size(app, max_size):
+    async def wrapper(scope, receive, send):
+        if scope['type'] != 'http':
+            return await app(scope, receive, send)
+
+        headers = dict(scope['headers'])
+        try:
+            declared = int(headers.get(b'content-length', 0))
+        except ValueError:
+            declared = 0
+        if declared > max_size:
+            body = json.dumps({'error': f'Request body cannot exceed {max_size // (1024 * 1024)}MB'}).encode()
+            await send({
+                'type': 'http.response.start',
+                'status': 413,
+                'headers': [(b'content-type', b'application/json'), (b'connection', b'close')],
+            })
+            await send({'type': 'http.response.body', 'body': body})
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > max_size:
+                    # Chunked body past the limit: Django aborts the request
+                    return {'type': 'http.disconnect'}
+            return message
+
+        return await app(scope, limited_receive, send)
+
+    return wrapper
+
+
+application = limit_body_size(
+    disconnect_aware(django_application, path_prefix='/api/events/'),
+    settings.REQUEST_MAX_BODY_SIZE
+)
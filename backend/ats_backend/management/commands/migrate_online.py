@@ -0,0 +1,103 @@
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.operations import AlterModelManagers, AlterModelOptions
+
+from ats_backend.online_migrations import format_seconds, rebuild_seconds, table_rows
+
+# Operations that only change Django's model state, never the table
+STATE_ONLY_OPERATIONS = (AlterModelManagers, AlterModelOptions)
+
+
+class Command(BaseCommand):
+    help = (
+        'Apply migrations like migrate. With --dry-run, change nothing and list each '
+        'pending operation with its table size and estimated duration, flagging '
+        'operations that block writes on large tables.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('app_label', nargs='?')
+        parser.add_argument('migration_name', nargs='?')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--dry-run', action='store_true', help='Estimate instead of applying')
+
+    def handle(self, *args, **options):
+        targets = [name for name in (options['app_label'], options['migration_name']) if name]
+        if not options['dry_run']:
+            call_command(
+                'migrate', *targets, database=options['database'],
+                verbosity=options['verbosity'], stdout=self.stdout
+            )
+            return
+
+        connection = connections[options['database']]
+        executor = MigrationExecutor(connection)
+        plan = executor.migration_plan(self._targets(executor, options))
+        if not plan:
+            self.stdout.write('No migrations to apply')
+            return
+
+        state = executor._create_project_state(with_applied_migrations=True)
+        total = 0
+        for migration, backwards in plan:
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{migration.app_label}.{migration.name}{' (unapply)' if backwards else ''}"
+            ))
+            if backwards:
+                self.stdout.write('  not estimated')
+                continue
+            for operation in migration.operations:
+                total += self._estimate(operation, migration.app_label, connection, state)
+                operation.state_forwards(migration.app_label, state)
+
+        self.stdout.write(self.style.SUCCESS(f"Estimated total: ~{format_seconds(total)}"))
+
+    def _targets(self, executor, options):
+        app_label, migration_name = options['app_label'], options['migration_name']
+        graph = executor.loader.graph
+        if not app_label:
+            return graph.leaf_nodes()
+        if app_label not in executor.loader.migrated_apps:
+            raise CommandError(f"App '{app_label}' does not have migrations.")
+        if not migration_name:
+            return [key for key in graph.leaf_nodes() if key[0] == app_label]
+        if migration_name == 'zero':
+            return [(app_label, None)]
+        try:
+            migration = executor.loader.get_migration_by_prefix(app_label, migration_name)
+        except KeyError as e:
+            raise CommandError(str(e))
+        return [(app_label, migration.name)]
+
+    def _estimate(self, operation, app_label, connection, state):
+        """Write one operation's line, return its estimated seconds"""
+        description = operation.describe()
+        try:
+            if hasattr(operation, 'estimate'):
+                rows, seconds, note = operation.estimate(app_label, connection, state)
+                self.stdout.write(f"  {description}: {rows} rows, ~{format_seconds(seconds)} ({note})")
+                return seconds
+
+            model_name = getattr(operation, 'model_name', None)
+            if model_name is None or isinstance(operation, STATE_ONLY_OPERATIONS):
+                self.stdout.write(f"  {description}: not estimated")
+                return 0
+            model = state.apps.get_model(app_label, model_name)
+            rows = table_rows(connection, model._meta.db_table)
+        except (DatabaseError, LookupError):
+            self.stdout.write(f"  {description}: not estimated (table not created yet)")
+            return 0
+
+        # Plain operations may copy the table; estimate them as a rebuild
+        seconds = rebuild_seconds(rows)
+        if rows >= settings.ONLINE_MIGRATION_WARN_ROWS:
+            self.stdout.write(self.style.WARNING(
+                f"  {description}: {rows} rows, ~{format_seconds(seconds)} - may block writes, "
+                f"consider an online operation"
+            ))
+        else:
+            self.stdout.write(f"  {description}: {rows} rows, ~{format_seconds(seconds)}")
+        return seconds
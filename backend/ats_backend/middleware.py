@@ -0,0 +1,135 @@
+"""
+Response compression
+
+Compresses API responses with brotli (when the `brotli` package is
+installed) or gzip, chosen from the client's Accept-Encoding. Responses
+below COMPRESSION_MIN_SIZE, already encoded, or of a content type not in
+COMPRESSION_CONTENT_TYPES are left alone. Streaming responses are
+compressed chunk by chunk. text/event-stream is deliberately not in the
+default list so Server-Sent Events are not held back in the compressor.
+"""
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; fall back to gzip only
+    brotli = None
+
+
+def parse_accept_encoding(header):
+    """{'gzip': 1.0, 'br': 0.5, ...} from an Accept-Encoding header"""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(header):
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+    candidates = (['br'] if brotli else []) + ['gzip']
+    quality = {coding: accepted.get(coding, wildcard) for coding in candidates}
+    best = max(candidates, key=lambda coding: quality[coding])
+    return best if quality[best] > 0 else None
+
+
+class _Compressor:
+    """Incremental gzip/brotli compressor with one interface"""
+    def __init__(self, encoding):
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._compress = self._compressor.process
+            self._flush = self._compressor.finish
+        else:
+            # wbits=31 writes a gzip header and trailer
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._compress = self._compressor.compress
+            self._flush = self._compressor.flush
+
+    def compress(self, data):
+        return self._compress(data)
+
+    def finish(self):
+        return self._flush()
+
+
+def compress_bytes(content, encoding):
+    compressor = _Compressor(encoding)
+    return compressor.compress(content) + compressor.finish()
+
+
+def compress_stream(chunks, encoding):
+    compressor = _Compressor(encoding)
+    for chunk in chunks:
+        output = compressor.compress(chunk)
+        if output:
+            yield output
+    yield compressor.finish()
+
+
+async def compress_async_stream(chunks, encoding):
+    compressor = _Compressor(encoding)
+    async for chunk in chunks:
+        output = compressor.compress(chunk)
+        if output:
+            yield output
+    yield compressor.finish()
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self._compressible(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compress_async_stream(response.streaming_content, encoding)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, encoding)
+            # Length is unknown until the stream is done
+            response.headers.pop('Content-Length', None)
+        else:
+            if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            compressed = compress_bytes(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # The body differs from the uncompressed one, so a strong ETag no longer holds
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
+
+    def _compressible(self, response):
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return False
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return False
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        return content_type in settings.COMPRESSION_CONTENT_TYPES
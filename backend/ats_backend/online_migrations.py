@@ -0,0 +1,369 @@
+"""
+Online schema migration operations for large tables
+
+Drop-in replacements for AddIndex and AddField that keep the table
+writable while they run, plus a batched data backfill:
+
+- AddIndexOnline: CREATE INDEX ... ALGORITHM=INPLACE LOCK=NONE
+- AddFieldOnline: ALTER TABLE ... ADD COLUMN with ALGORITHM=INSTANT,
+  falling back to ALGORITHM=INPLACE, LOCK=NONE
+- BackfillOnline: UPDATE in primary key batches with a pause after each
+  batch, progress on stdout and a cursor stored in
+  online_migrations_backfill, so an interrupted migrate resumes where it
+  stopped
+
+On MySQL a statement the server can't run online fails instead of
+falling back to a copying ALTER. Even online DDL briefly needs an
+exclusive metadata lock; it waits at most ONLINE_MIGRATION_LOCK_WAIT_TIMEOUT
+seconds for it (so it never queues submissions behind a long transaction)
+and retries. Other databases run the plain operations.
+
+Backfills commit per batch on MySQL. On databases with transactional
+DDL, put them in a migration with `atomic = False`.
+
+`manage.py migrate_online --dry-run` estimates each pending operation.
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+from django.apps.registry import Apps
+from django.conf import settings
+from django.db import DatabaseError, models, transaction
+from django.db.migrations.operations import AddField, AddIndex
+from django.db.migrations.operations.base import Operation
+from django.db.models import Max, Min
+from django.utils import timezone
+
+# MySQL error codes
+LOCK_WAIT_TIMEOUT = 1205
+ALGORITHM_NOT_SUPPORTED = {1845, 1846}
+
+# Clauses tried in order, per statement type
+ONLINE_CLAUSES = {
+    'ALTER TABLE': [', ALGORITHM=INSTANT', ', ALGORITHM=INPLACE, LOCK=NONE'],
+    'CREATE INDEX': [' ALGORITHM=INPLACE LOCK=NONE'],
+    'CREATE UNIQUE INDEX': [' ALGORITHM=INPLACE LOCK=NONE'],
+    'DROP INDEX': [' ALGORITHM=INPLACE LOCK=NONE'],
+}
+
+
+class OnlineMigrationError(Exception):
+    """Raised when DDL can't run without blocking writes"""
+
+
+def _online_clauses(sql):
+    for prefix, clauses in ONLINE_CLAUSES.items():
+        if sql.upper().startswith(prefix):
+            return clauses
+    return None
+
+
+def _execute_online(schema_editor, execute, sql, params=()):
+    sql = str(sql)
+    clauses = _online_clauses(sql)
+    if clauses is None:
+        return execute(sql, params)
+    if schema_editor.collect_sql:
+        # sqlmigrate: show the statement that is guaranteed to be online
+        return execute(sql + clauses[-1], params)
+
+    for attempt in range(settings.ONLINE_MIGRATION_LOCK_RETRIES + 1):
+        if attempt:
+            time.sleep(min(2 ** attempt, 30))
+        for clause in clauses:
+            try:
+                return execute(sql + clause, params)
+            except DatabaseError as e:
+                code = e.args[0] if e.args else None
+                if code in ALGORITHM_NOT_SUPPORTED:
+                    continue
+                if code == LOCK_WAIT_TIMEOUT:
+                    break
+                raise
+        else:
+            raise OnlineMigrationError(f"MySQL can't run this without locking the table: {sql}")
+    raise OnlineMigrationError(
+        f"Gave up waiting for the metadata lock after {settings.ONLINE_MIGRATION_LOCK_RETRIES + 1} attempts "
+        f"(a long transaction holds the table): {sql}"
+    )
+
+
+@contextmanager
+def online_ddl(schema_editor):
+    """Run the schema editor's DDL online (MySQL) until the block exits"""
+    if schema_editor.connection.vendor != 'mysql':
+        yield
+        return
+
+    execute = schema_editor.execute
+    deferred = len(schema_editor.deferred_sql)
+    schema_editor.execute = lambda sql, params=(): _execute_online(schema_editor, execute, sql, params)
+    previous_timeout = None
+    if not schema_editor.collect_sql:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT @@SESSION.lock_wait_timeout")
+            previous_timeout = cursor.fetchone()[0]
+            cursor.execute("SET SESSION lock_wait_timeout = %s", [settings.ONLINE_MIGRATION_LOCK_WAIT_TIMEOUT])
+    try:
+        yield
+        # Django defers some DDL (e.g. a new field's index) to the end of
+        # the migration; run it now while the online rules apply
+        for statement in schema_editor.deferred_sql[deferred:]:
+            schema_editor.execute(statement)
+        del schema_editor.deferred_sql[deferred:]
+    finally:
+        del schema_editor.execute
+        if previous_timeout is not None:
+            with schema_editor.connection.cursor() as cursor:
+                cursor.execute("SET SESSION lock_wait_timeout = %s", [previous_timeout])
+
+
+def table_rows(connection, table):
+    """Row count of a table, from the statistics on MySQL (approximate, instant)"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", [table]
+            )
+            row = cursor.fetchone()
+            return (row[0] or 0) if row else 0
+        cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}")
+        return cursor.fetchone()[0]
+
+
+def rebuild_seconds(rows):
+    """Rough time for MySQL to rebuild a table or build an index over `rows` rows"""
+    return rows / settings.ONLINE_MIGRATION_DDL_ROWS_PER_SECOND
+
+
+class AddIndexOnline(AddIndex):
+    """AddIndex that builds the index without blocking writes"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        with online_ddl(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        with online_ddl(schema_editor):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return super().describe() + ' (online)'
+
+    def estimate(self, app_label, connection, from_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        rows = table_rows(connection, model._meta.db_table)
+        return rows, rebuild_seconds(rows), 'in-place index build, table stays writable'
+
+
+class AddFieldOnline(AddField):
+    """
+    AddField that adds the column without blocking writes
+
+    The column should be nullable or have a default so existing rows
+    don't need a value; fill it afterwards with BackfillOnline.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        with online_ddl(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        with online_ddl(schema_editor):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return super().describe() + ' (online)'
+
+    def estimate(self, app_label, connection, from_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        rows = table_rows(connection, model._meta.db_table)
+        if self.field.db_index or self.field.unique or self.field.is_relation:
+            return rows, rebuild_seconds(rows), 'in-place rebuild for the index, table stays writable'
+        return rows, 0, f'instant on MySQL 8.0.12+, otherwise ~{rebuild_seconds(rows):.0f}s in-place rebuild'
+
+
+class BackfillProgress(models.Model):
+    """Cursor of a BackfillOnline run (not part of any app)"""
+    name = models.CharField(max_length=255, unique=True)
+    last_pk = models.BigIntegerField(default=0)
+    updated_rows = models.BigIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True)
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        apps = Apps()
+        app_label = 'online_migrations'
+        db_table = 'online_migrations_backfill'
+
+
+def _progress_table(schema_editor):
+    """Create the progress table on first use, like django_migrations"""
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if BackfillProgress._meta.db_table not in connection.introspection.table_names(cursor):
+            schema_editor.create_model(BackfillProgress)
+    return BackfillProgress.objects.using(connection.alias)
+
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+
+class BackfillOnline(Operation):
+    """
+    Fill existing rows in primary key batches
+
+    Either `values` ({field: value or expression}, applied with one UPDATE
+    per batch) or `function(queryset)`, called with each batch's rows.
+    `where` (a Q) limits the rows touched, e.g. to those still NULL. `name`
+    identifies the run's progress, so it must be unique.
+
+    After each batch the backfill pauses for ONLINE_BACKFILL_SLEEP_RATIO
+    times the batch's duration, leaving the database to live traffic.
+    """
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, name, model_name, values=None, function=None, where=None, batch_size=None):
+        if (values is None) == (function is None):
+            raise ValueError("BackfillOnline needs exactly one of values and function")
+        self.name = name
+        self.model_name = model_name
+        self.values = values
+        self.function = function
+        self.where = where
+        self.batch_size = batch_size
+
+    def deconstruct(self):
+        kwargs = {'name': self.name, 'model_name': self.model_name}
+        for key in ('values', 'function', 'where', 'batch_size'):
+            if getattr(self, key) is not None:
+                kwargs[key] = getattr(self, key)
+        return self.__class__.__name__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def describe(self):
+        return f"Backfill {self.model_name} in batches ({self.name})"
+
+    def _progress_name(self, app_label):
+        return f"{app_label}.{self.model_name}.{self.name}"
+
+    def _apply(self, queryset):
+        if self.where is not None:
+            queryset = queryset.filter(self.where)
+        if self.values is not None:
+            return queryset.update(**self.values)
+        return self.function(queryset) or 0
+
+    def _next_bound(self, manager, low, batch_size):
+        """Highest pk of the next batch after `low`, or None when done"""
+        bounds = list(manager.filter(pk__gt=low).order_by('pk').values_list('pk', flat=True)[batch_size - 1:batch_size])
+        if bounds:
+            return bounds[0]
+        return manager.filter(pk__gt=low).aggregate(high=Max('pk'))['high']
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.collect_sql:
+            schema_editor.deferred_sql.append(f"-- {self.describe()}: runs in batches, no SQL to show")
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        connection = schema_editor.connection
+        manager = model._base_manager.using(connection.alias)
+        batch_size = self.batch_size or settings.ONLINE_BACKFILL_BATCH_SIZE
+
+        progresses = _progress_table(schema_editor)
+        progress, _ = progresses.get_or_create(
+            name=self._progress_name(app_label), defaults={'updated_at': timezone.now()}
+        )
+        if progress.finished_at:
+            return
+
+        span = manager.aggregate(low=Min('pk'), high=Max('pk'))
+        if span['high'] is None:
+            progresses.filter(pk=progress.pk).update(finished_at=timezone.now(), updated_at=timezone.now())
+            return
+        first = span['low'] - 1
+        started = time.monotonic()
+        if progress.last_pk:
+            self._report(f"resuming after pk {progress.last_pk}")
+        start_pk = max(progress.last_pk, first)
+
+        last_report = started
+        while True:
+            high = self._next_bound(manager, progress.last_pk, batch_size)
+            if high is None:
+                break
+            batch_started = time.monotonic()
+            with transaction.atomic(using=connection.alias):
+                updated = self._apply(manager.filter(pk__gt=progress.last_pk, pk__lte=high))
+                progress.last_pk = high
+                progress.updated_rows += updated
+                progress.updated_at = timezone.now()
+                progress.save(update_fields=['last_pk', 'updated_rows', 'updated_at'])
+            elapsed = time.monotonic() - batch_started
+
+            now = time.monotonic()
+            if now - last_report >= settings.ONLINE_BACKFILL_REPORT_SECONDS:
+                last_report = now
+                done = (high - first) / (span['high'] - first)
+                rate = (high - start_pk) / (now - started)
+                remaining = (span['high'] - high) / rate if rate else 0
+                self._report(
+                    f"pk {high}/{span['high']} ({done:.1%}), {progress.updated_rows} rows updated, "
+                    f"{format_seconds(now - started)} elapsed, ~{format_seconds(remaining)} left"
+                )
+            time.sleep(elapsed * settings.ONLINE_BACKFILL_SLEEP_RATIO)
+
+        progresses.filter(pk=progress.pk).update(finished_at=timezone.now(), updated_at=timezone.now())
+        self._report(f"done, {progress.updated_rows} rows updated in {format_seconds(time.monotonic() - started)}")
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        # The data stays; forget the cursor so re-applying backfills again
+        if not schema_editor.collect_sql:
+            _progress_table(schema_editor).filter(name=self._progress_name(app_label)).delete()
+
+    def _report(self, message):
+        sys.stdout.write(f"  {self.name}: {message}\n")
+        sys.stdout.flush()
+
+    def estimate(self, app_label, connection, from_state):
+        """
+        Rows left and seconds to go, timing one sample batch that is
+        rolled back (falls back to the DDL rate if the columns don't exist yet)
+        """
+        model = from_state.apps.get_model(app_label, self.model_name)
+        manager = model._base_manager.using(connection.alias)
+        batch_size = self.batch_size or settings.ONLINE_BACKFILL_BATCH_SIZE
+        try:
+            progress = BackfillProgress.objects.using(connection.alias).filter(
+                name=self._progress_name(app_label)
+            ).first()
+        except DatabaseError:
+            progress = None
+        if progress and progress.finished_at:
+            return 0, 0, 'already done'
+
+        last_pk = progress.last_pk if progress else 0
+        rows = manager.filter(pk__gt=last_pk).count()
+        batches = -(-rows // batch_size)
+        note = f"{batches} batches of {batch_size}"
+        if progress:
+            note += f", resuming after pk {last_pk}"
+        try:
+            high = self._next_bound(manager, last_pk, batch_size)
+            with transaction.atomic(using=connection.alias):
+                started = time.monotonic()
+                if high is not None:
+                    self._apply(manager.filter(pk__gt=last_pk, pk__lte=high))
+                batch_seconds = time.monotonic() - started
+                transaction.set_rollback(True, using=connection.alias)
+        except DatabaseError:
+            return rows, rebuild_seconds(rows), note + ', not sampled (columns not created yet)'
+        return rows, batches * batch_seconds * (1 + settings.ONLINE_BACKFILL_SLEEP_RATIO), note
@@ -0,0 +1,37 @@
+"""
+Additional API response formats
+
+MessagePackRenderer is selected with `Accept: application/msgpack` or
+`?format=msgpack`. It encodes the same data as the JSON renderer in a
+compact binary form.
+"""
+import datetime
+import decimal
+import uuid
+
+import msgpack
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _encode_extra(value):
+    """Fallback for values msgpack can't encode natively (same as JSON output)"""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID, Promise)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encode_extra, use_bin_type=True)
@@ -43,14 +43,21 @@ INSTALLED_APPS = [
     'django_filters',
     
     # Local apps
+    'ats_backend',  # project-wide management commands (migrate_online)
     'apps.users',
     'apps.jobs',
     'apps.applications',
+    'apps.realtime',
+    'apps.diagnostics',
+    'apps.webhooks',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'apps.diagnostics.middleware.ProfilingMiddleware',
+    'apps.diagnostics.middleware.QueryContextMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Moved up, comma added
+    'ats_backend.middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -111,6 +118,16 @@ DATABASES = {
     )
 }
 
+# Cache
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# cache (e.g. Redis) when running more than one backend process.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='ats-cache'),
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -128,12 +145,54 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 # Media files (User uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Resume Storage Configuration
+# 'local' keeps resumes under MEDIA_ROOT (single instance only); 's3' uses
+# any S3-compatible object store so every API replica sees the same files
+RESUME_STORAGE = config('RESUME_STORAGE', default='local')
+RESUME_S3_BUCKET = config('RESUME_S3_BUCKET', default='')
+RESUME_S3_ENDPOINT_URL = config('RESUME_S3_ENDPOINT_URL', default='') or None  # MinIO etc., empty for AWS
+RESUME_S3_REGION = config('RESUME_S3_REGION', default='') or None
+RESUME_S3_ACCESS_KEY_ID = config('RESUME_S3_ACCESS_KEY_ID', default='') or None
+RESUME_S3_SECRET_ACCESS_KEY = config('RESUME_S3_SECRET_ACCESS_KEY', default='') or None
+RESUME_URL_EXPIRY = config('RESUME_URL_EXPIRY', default=300, cast=int)  # seconds a recruiter download link lives
+RESUME_PARSER_URL_EXPIRY = config('RESUME_PARSER_URL_EXPIRY', default=900, cast=int)  # seconds the parser's link lives
+
+RESUME_STORAGES = {
+    'local': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    's3': {
+        'BACKEND': 'storages.backends.s3.S3Storage',
+        'OPTIONS': {
+            'bucket_name': RESUME_S3_BUCKET,
+            'endpoint_url': RESUME_S3_ENDPOINT_URL,
+            'region_name': RESUME_S3_REGION,
+            'access_key': RESUME_S3_ACCESS_KEY_ID,
+            'secret_key': RESUME_S3_SECRET_ACCESS_KEY,
+            'default_acl': None,
+            'file_overwrite': False,
+            'querystring_auth': True,
+            'querystring_expire': RESUME_URL_EXPIRY,
+            'signature_version': 's3v4',
+        },
+    },
+}
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+    'resumes': RESUME_STORAGES[RESUME_STORAGE],
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -171,11 +230,16 @@ CORS_ALLOW_HEADERS = [
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.RevocableJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'ats_backend.renderers.MessagePackRenderer',
+    ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
         'rest_framework.parsers.FormParser',
@@ -189,6 +253,10 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DATETIME_FORMAT': '%Y-%m-%d %H:%M:%S',
+    # Proxies in front of the app (1 for the platform router). Throttles
+    # key on the client address this many hops from the end of
+    # X-Forwarded-For; 0 uses REMOTE_ADDR and ignores the header
+    'NUM_PROXIES': config('NUM_PROXIES', default=1, cast=int),
 }
 
 # JWT Configuration
@@ -196,7 +264,10 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=8),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
-    'BLACKLIST_AFTER_ROTATION': True,
+    # The token_blacklist app is not used; rotated refresh tokens are revoked
+    # by RevocableTokenRefreshSerializer instead (apps/users/revocation.py)
+    'BLACKLIST_AFTER_ROTATION': False,
+    'TOKEN_REFRESH_SERIALIZER': 'apps.users.serializers.RevocableTokenRefreshSerializer',
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'AUTH_HEADER_TYPES': ('Bearer',),
@@ -204,9 +275,155 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
+# Token Revocation Configuration
+TOKEN_REVOCATION_POLL_SECONDS = config('TOKEN_REVOCATION_POLL_SECONDS', default=5, cast=int)  # how stale another process's denylist may be
+TOKEN_REVOCATION_POLL_OVERLAP = config('TOKEN_REVOCATION_POLL_OVERLAP', default=30, cast=int)  # seconds re-read per poll for late commits
+
+# Online Migration Configuration (ats_backend/online_migrations.py)
+ONLINE_MIGRATION_LOCK_WAIT_TIMEOUT = config('ONLINE_MIGRATION_LOCK_WAIT_TIMEOUT', default=5, cast=int)  # seconds DDL waits for the metadata lock
+ONLINE_MIGRATION_LOCK_RETRIES = config('ONLINE_MIGRATION_LOCK_RETRIES', default=5, cast=int)
+ONLINE_MIGRATION_DDL_ROWS_PER_SECOND = config('ONLINE_MIGRATION_DDL_ROWS_PER_SECOND', default=200000, cast=int)  # for --dry-run estimates
+ONLINE_MIGRATION_WARN_ROWS = config('ONLINE_MIGRATION_WARN_ROWS', default=100000, cast=int)  # flag blocking operations on tables this big
+ONLINE_BACKFILL_BATCH_SIZE = config('ONLINE_BACKFILL_BATCH_SIZE', default=1000, cast=int)
+ONLINE_BACKFILL_SLEEP_RATIO = config('ONLINE_BACKFILL_SLEEP_RATIO', default=1.0, cast=float)  # pause after a batch, in multiples of its duration
+ONLINE_BACKFILL_REPORT_SECONDS = config('ONLINE_BACKFILL_REPORT_SECONDS', default=10, cast=int)
+
 # Golang Service Configuration
 GOLANG_SERVICE_URL = config('GOLANG_SERVICE_URL', default='http://localhost:8080')
 
+# Resume Parser Configuration
+# RemoteParserBackend calls the Golang service; LocalParserBackend parses in a local process pool
+RESUME_PARSER_BACKEND = config('RESUME_PARSER_BACKEND', default='apps.applications.parsing.RemoteParserBackend')
+LOCAL_PARSER_WORKERS = config('LOCAL_PARSER_WORKERS', default=2, cast=int)
+LOCAL_PARSER_TIMEOUT = config('LOCAL_PARSER_TIMEOUT', default=30, cast=int)  # seconds per file
+LOCAL_PARSER_QUEUE_TIMEOUT = config('LOCAL_PARSER_QUEUE_TIMEOUT', default=120, cast=int)  # seconds waiting for a free worker
+LOCAL_PARSER_MEMORY_LIMIT_MB = config('LOCAL_PARSER_MEMORY_LIMIT_MB', default=512, cast=int)  # address space per worker, 0 for no limit
+LOCAL_PARSER_MAX_TASKS_PER_CHILD = config('LOCAL_PARSER_MAX_TASKS_PER_CHILD', default=200, cast=int)  # recycle workers, 0 to keep them
+
 # File Upload Configuration
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
+# Resumes stream to disk (apps/applications/uploads.py); only small
+# files and form fields are held in memory
+FILE_UPLOAD_MAX_MEMORY_SIZE = 262144  # 256KB
+DATA_UPLOAD_MAX_MEMORY_SIZE = 2621440  # 2.5MB, form fields only
+RESUME_MAX_UPLOAD_SIZE = config('RESUME_MAX_UPLOAD_SIZE', default=10485760, cast=int)  # 10MB
+# Whole request body under ASGI, enforced before Django spools it (asgi.py)
+REQUEST_MAX_BODY_SIZE = RESUME_MAX_UPLOAD_SIZE + DATA_UPLOAD_MAX_MEMORY_SIZE
+RESUME_UPLOAD_TEMP_DIR = config('RESUME_UPLOAD_TEMP_DIR', default=os.path.join(BASE_DIR, 'upload_tmp'))  # outside MEDIA_ROOT, shared by workers
+RESUME_UPLOAD_TTL_SECONDS = config('RESUME_UPLOAD_TTL_SECONDS', default=3600, cast=int)
+RESUME_UPLOAD_CHUNK_SIZE = config('RESUME_UPLOAD_CHUNK_SIZE', default=1048576, cast=int)  # suggested to clients
+
+# Leaderboard Configuration
+LEADERBOARD_MAX_SIZE = config('LEADERBOARD_MAX_SIZE', default=100, cast=int)
+LEADERBOARD_CACHE_TIMEOUT = config('LEADERBOARD_CACHE_TIMEOUT', default=300, cast=int)  # seconds
+
+# Application Facet Counts Configuration
+APPLICATION_FACETS_CACHE_TIMEOUT = config('APPLICATION_FACETS_CACHE_TIMEOUT', default=30, cast=int)  # seconds
+APPLICATION_FACETS_JOB_LIMIT = config('APPLICATION_FACETS_JOB_LIMIT', default=50, cast=int)
+APPLICATION_FACETS_SKILL_LIMIT = config('APPLICATION_FACETS_SKILL_LIMIT', default=20, cast=int)
+APPLICATION_FACETS_SCORE_BUCKET = config('APPLICATION_FACETS_SCORE_BUCKET', default=20, cast=int)  # bucket width in score points
+
+# Incremental Sync Configuration
+SYNC_PAGE_SIZE = config('SYNC_PAGE_SIZE', default=500, cast=int)
+SYNC_MAX_PAGE_SIZE = config('SYNC_MAX_PAGE_SIZE', default=2000, cast=int)
+SYNC_TOMBSTONE_RETENTION_DAYS = config('SYNC_TOMBSTONE_RETENTION_DAYS', default=30, cast=int)
+SYNC_SETTLE_SECONDS = config('SYNC_SETTLE_SECONDS', default=30, cast=int)  # changes this recent are sent again on the next call
+
+# Saved View Configuration
+SAVED_VIEW_MAX_RESULTS = config('SAVED_VIEW_MAX_RESULTS', default=5000, cast=int)  # ids materialized per view
+SAVED_VIEW_REFRESH_SECONDS = config('SAVED_VIEW_REFRESH_SECONDS', default=5, cast=int)  # pages read within this reuse one list
+SAVED_VIEW_REBUILD_THRESHOLD = config('SAVED_VIEW_REBUILD_THRESHOLD', default=2000, cast=int)  # more changes than this rebuild instead
+
+# Realtime (Server-Sent Events) Configuration
+REALTIME_BROKER_BACKEND = config('REALTIME_BROKER_BACKEND', default='apps.realtime.broker.InProcessBackend')
+REALTIME_HEARTBEAT_SECONDS = config('REALTIME_HEARTBEAT_SECONDS', default=20, cast=int)
+REALTIME_RETRY_MS = config('REALTIME_RETRY_MS', default=5000, cast=int)
+REALTIME_QUEUE_SIZE = config('REALTIME_QUEUE_SIZE', default=100, cast=int)
+
+# Webhook Outbox Configuration
+OUTBOX_SETTLE_SECONDS = config('OUTBOX_SETTLE_SECONDS', default=5, cast=int)  # event age before delivery, covers late commits
+OUTBOX_RETENTION_DAYS = config('OUTBOX_RETENTION_DAYS', default=7, cast=int)  # delivered events kept this long
+WEBHOOK_BATCH_SIZE = config('WEBHOOK_BATCH_SIZE', default=100, cast=int)  # events per POST
+WEBHOOK_DISPATCH_WORKERS = config('WEBHOOK_DISPATCH_WORKERS', default=8, cast=int)  # webhooks delivered concurrently
+WEBHOOK_TIMEOUT = config('WEBHOOK_TIMEOUT', default=10, cast=int)  # seconds per POST
+WEBHOOK_LEASE_SECONDS = config('WEBHOOK_LEASE_SECONDS', default=60, cast=int)  # must exceed WEBHOOK_TIMEOUT
+WEBHOOK_RETRY_BASE_SECONDS = config('WEBHOOK_RETRY_BASE_SECONDS', default=5, cast=int)
+WEBHOOK_RETRY_MAX_SECONDS = config('WEBHOOK_RETRY_MAX_SECONDS', default=3600, cast=int)
+WEBHOOK_POLL_INTERVAL = config('WEBHOOK_POLL_INTERVAL', default=1, cast=float)  # seconds the dispatcher sleeps when idle
+
+# Job Search Configuration
+# Empty picks the backend for the database vendor (MySQL FULLTEXT / SQLite FTS5)
+JOB_SEARCH_BACKEND = config('JOB_SEARCH_BACKEND', default='')
+
+# Resume Text Search Configuration
+# Empty picks the backend for the database vendor (MySQL FULLTEXT / SQLite FTS5)
+RESUME_SEARCH_BACKEND = config('RESUME_SEARCH_BACKEND', default='')
+RESUME_SEARCH_MAX_RESULTS = config('RESUME_SEARCH_MAX_RESULTS', default=100, cast=int)
+RESUME_SEARCH_SNIPPET_CHARS = config('RESUME_SEARCH_SNIPPET_CHARS', default=200, cast=int)
+RESUME_TEXT_MAX_CHARS = config('RESUME_TEXT_MAX_CHARS', default=100000, cast=int)  # longer text is truncated before storing
+
+# Batch Reparse Configuration
+REPARSE_CONCURRENCY = config('REPARSE_CONCURRENCY', default=8, cast=int)  # parser calls in flight
+REPARSE_BATCH_SIZE = config('REPARSE_BATCH_SIZE', default=100, cast=int)
+REPARSE_STALE_SECONDS = config('REPARSE_STALE_SECONDS', default=300, cast=int)
+
+# Archival Configuration
+ARCHIVE_AFTER_DAYS = config('ARCHIVE_AFTER_DAYS', default=180, cast=int)  # days closed before archiving
+ARCHIVE_BATCH_SIZE = config('ARCHIVE_BATCH_SIZE', default=500, cast=int)
+ARCHIVE_COMPRESSION_LEVEL = config('ARCHIVE_COMPRESSION_LEVEL', default=6, cast=int)
+ARCHIVE_RESTORE_INLINE_LIMIT = config('ARCHIVE_RESTORE_INLINE_LIMIT', default=1000, cast=int)  # larger archives restore in the background
+
+# Bulk Deletion Configuration
+DELETE_BATCH_SIZE = config('DELETE_BATCH_SIZE', default=1000, cast=int)
+JOB_DELETE_INLINE_LIMIT = config('JOB_DELETE_INLINE_LIMIT', default=1000, cast=int)  # larger jobs delete in the background
+
+# Application Intake Admission Control
+# Token-bucket rates as "<requests>/<s|min|hour|day>"; the count is also the burst size
+APPLICATION_THROTTLE_BACKEND = config('APPLICATION_THROTTLE_BACKEND', default='apps.applications.throttling.LocMemTokenBucketBackend')
+APPLICATION_THROTTLE_RATES = {
+    'ip': config('APPLICATION_THROTTLE_IP_RATE', default='5/min'),
+    'job': config('APPLICATION_THROTTLE_JOB_RATE', default='120/min'),
+    'upload': config('APPLICATION_THROTTLE_UPLOAD_RATE', default='10/min'),
+}
+# Intake parses in flight before shedding, counted in the default cache: size
+# it to the parser service's capacity and set a shared CACHE_BACKEND (e.g.
+# Redis) so every web worker counts against the same slots
+INTAKE_PARSE_MAX_IN_FLIGHT = config('INTAKE_PARSE_MAX_IN_FLIGHT', default=16, cast=int)
+INTAKE_PARSE_SLOT_TIMEOUT = config('INTAKE_PARSE_SLOT_TIMEOUT', default=300, cast=int)  # seconds; must exceed the longest parse
+PARSE_QUEUE_RETRY_AFTER = config('PARSE_QUEUE_RETRY_AFTER', default=30, cast=int)  # seconds
+
+# Idempotent Submission Configuration
+IDEMPOTENCY_KEY_TTL = config('IDEMPOTENCY_KEY_TTL', default=86400, cast=int)  # seconds a response is replayable
+IDEMPOTENCY_LOCK_SECONDS = config('IDEMPOTENCY_LOCK_SECONDS', default=300, cast=int)  # covers a full parse
+APPLICATION_DEDUPE_WINDOW_SECONDS = config('APPLICATION_DEDUPE_WINDOW_SECONDS', default=3600, cast=int)
+
+# Request Profiling Configuration
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_SAMPLE_RATE = config('PROFILING_SAMPLE_RATE', default=0, cast=int)  # profile 1 in N requests, 0 disables sampling
+PROFILING_DIR = config('PROFILING_DIR', default=str(BASE_DIR / 'profiles'))
+PROFILING_MAX_FILES = config('PROFILING_MAX_FILES', default=200, cast=int)
+PROFILING_TOKEN_MAX_AGE = config('PROFILING_TOKEN_MAX_AGE', default=3600, cast=int)  # seconds
+
+# Slow Query Log Configuration
+SLOW_QUERY_LOG_ENABLED = config('SLOW_QUERY_LOG_ENABLED', default=False, cast=bool)
+SLOW_QUERY_THRESHOLD_MS = config('SLOW_QUERY_THRESHOLD_MS', default=200, cast=int)
+SLOW_QUERY_LOG_PARAMS = config('SLOW_QUERY_LOG_PARAMS', default=False, cast=bool)  # parameter values are personal data
+SLOW_QUERY_LOG_FILE = config('SLOW_QUERY_LOG_FILE', default=str(BASE_DIR / 'logs' / 'slow_queries.jsonl'))
+SLOW_QUERY_LOG_MAX_BYTES = config('SLOW_QUERY_LOG_MAX_BYTES', default=10 * 1024 * 1024, cast=int)
+SLOW_QUERY_LOG_BACKUPS = config('SLOW_QUERY_LOG_BACKUPS', default=3, cast=int)
+
+# Dashboard Configuration
+DASHBOARD_LATEST_APPLICATIONS = config('DASHBOARD_LATEST_APPLICATIONS', default=5, cast=int)  # per job
+DASHBOARD_MAX_LATEST_APPLICATIONS = config('DASHBOARD_MAX_LATEST_APPLICATIONS', default=20, cast=int)
+DASHBOARD_MAX_JOBS = config('DASHBOARD_MAX_JOBS', default=100, cast=int)
+
+# Response Compression Configuration
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)  # bytes
+COMPRESSION_GZIP_LEVEL = config('COMPRESSION_GZIP_LEVEL', default=6, cast=int)
+COMPRESSION_BROTLI_QUALITY = config('COMPRESSION_BROTLI_QUALITY', default=5, cast=int)
+COMPRESSION_CONTENT_TYPES = [
+    'application/json',
+    'application/msgpack',
+    'text/html',
+    'text/plain',
+    'text/csv',
+]
@@ -6,6 +6,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from apps.jobs.views import DashboardView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -18,6 +19,11 @@ urlpatterns = [
     # Application endpoints
     path('api/jobs/', include('apps.jobs.urls')),
     path('api/applications/', include('apps.applications.urls')),
+    path('api/dashboard/', DashboardView.as_view(), name='dashboard'),
+    path('api/webhooks/', include('apps.webhooks.urls')),
+    
+    # Server-Sent Events (ASGI only)
+    path('api/events/', include('apps.realtime.urls')),
 ]
 
 # Serve media files in development
@@ -7,11 +7,58 @@ import {
   ApplicationStatus,
   PaginatedResponse,
   ApplicationStatusHistory,
+  ResumeUpload,
+  ResumeSearchResponse,
+  ApplicationFacet,
+  ApplicationFacets,
+  SavedView,
+  SavedViewResults,
 } from '../types';
 
+// Resumes above this size are sent in resumable chunks
+const RESUMABLE_UPLOAD_THRESHOLD = 1024 * 1024;
+
 export const applicationService = {
+  /**
+   * Upload a resume in resumable chunks and return its upload token.
+   * A failed chunk is retried from the offset the server reports.
+   */
+  async uploadResume(file: File, maxRetries: number = 3): Promise<string> {
+    const start = await apiClient.post<ResumeUpload>('/api/applications/uploads/', {
+      filename: file.name,
+      size: file.size,
+    });
+    const { token } = start.data;
+    const chunkSize = start.data.chunk_size ?? RESUMABLE_UPLOAD_THRESHOLD;
+    let offset = 0;
+    let retries = 0;
+
+    while (offset < file.size) {
+      try {
+        const response = await apiClient.patch<ResumeUpload>(
+          `/api/applications/uploads/${token}/`,
+          file.slice(offset, offset + chunkSize),
+          {
+            headers: {
+              'Content-Type': 'application/offset+octet-stream',
+              'Upload-Offset': offset.toString(),
+            },
+          }
+        );
+        offset = response.data.offset;
+        retries = 0;
+      } catch (err) {
+        if (retries++ >= maxRetries) throw err;
+        const status = await apiClient.get<ResumeUpload>(`/api/applications/uploads/${token}/`);
+        offset = status.data.offset;
+      }
+    }
+    return token;
+  },
+
   /**
    * Submit job application (public endpoint)
+   * Large resumes go through the resumable upload first.
    */
   async submitApplication(data: ApplicationFormData): Promise<Application> {
     const formData = new FormData();
@@ -22,11 +69,16 @@ export const applicationService = {
     formData.append('linkedin_url', data.linkedin_url);
     formData.append('cover_letter', data.cover_letter);
     
-    if (data.resume_file) {
+    if (data.resume_file && data.resume_file.size > RESUMABLE_UPLOAD_THRESHOLD) {
+      formData.append('upload_token', await applicationService.uploadResume(data.resume_file));
+    } else if (data.resume_file) {
       formData.append('resume_file', data.resume_file);
     }
 
+    // job_id also goes in the query string so the per-job rate limit can
+    // refuse a request before its body is read
     const response = await apiClient.post<Application>('/api/applications/', formData, {
+      params: { job_id: data.job_id },
       headers: {
         'Content-Type': 'multipart/form-data',
       },
@@ -47,6 +99,10 @@ export const applicationService = {
     if (filters?.status) params.append('status', filters.status);
     if (filters?.search) params.append('search', filters.search);
     if (filters?.ordering) params.append('ordering', filters.ordering);
+    if (filters?.min_experience != null) params.append('min_experience', filters.min_experience.toString());
+    if (filters?.max_experience != null) params.append('max_experience', filters.max_experience.toString());
+    if (filters?.min_education_level) params.append('min_education_level', filters.min_education_level.toString());
+    if (filters?.education_field) params.append('education_field', filters.education_field);
     params.append('page', page.toString());
 
     const response = await apiClient.get<PaginatedResponse<ApplicationList>>(
@@ -56,6 +112,51 @@ export const applicationService = {
     return response.data;
   },
 
+  /**
+   * Facet counts for the current list filters (requires auth)
+   */
+  async getApplicationFacets(
+    filters?: ApplicationFilters,
+    facets?: ApplicationFacet[]
+  ): Promise<ApplicationFacets> {
+    const params = new URLSearchParams();
+
+    if (filters?.job) params.append('job', filters.job.toString());
+    if (filters?.status) params.append('status', filters.status);
+    if (filters?.search) params.append('search', filters.search);
+    if (filters?.min_experience != null) params.append('min_experience', filters.min_experience.toString());
+    if (filters?.max_experience != null) params.append('max_experience', filters.max_experience.toString());
+    if (filters?.min_education_level) params.append('min_education_level', filters.min_education_level.toString());
+    if (filters?.education_field) params.append('education_field', filters.education_field);
+    if (facets?.length) params.append('facets', facets.join(','));
+
+    const response = await apiClient.get<{ facets: ApplicationFacets }>(
+      '/api/applications/facets/',
+      { params }
+    );
+    return response.data.facets;
+  },
+
+  /**
+   * Full-text search over candidates' resume text, best match first (requires auth)
+   */
+  async searchResumes(
+    query: string,
+    filters?: { job?: number; status?: ApplicationStatus; limit?: number }
+  ): Promise<ResumeSearchResponse> {
+    const params = new URLSearchParams({ q: query });
+
+    if (filters?.job) params.append('job', filters.job.toString());
+    if (filters?.status) params.append('status', filters.status);
+    if (filters?.limit) params.append('limit', filters.limit.toString());
+
+    const response = await apiClient.get<ResumeSearchResponse>(
+      '/api/applications/resume-search/',
+      { params }
+    );
+    return response.data;
+  },
+
   /**
    * Get single application by ID (requires auth)
    */
@@ -112,4 +213,51 @@ export const applicationService = {
     const response = await apiClient.post(`/api/applications/${id}/reparse/`);
     return response.data;
   },
+
+  /**
+   * The current user's saved views (requires auth)
+   */
+  async getSavedViews(): Promise<PaginatedResponse<SavedView>> {
+    const response = await apiClient.get<PaginatedResponse<SavedView>>('/api/applications/views/');
+    return response.data;
+  },
+
+  /**
+   * Save a view (requires auth)
+   */
+  async createSavedView(
+    data: Pick<SavedView, 'name' | 'criteria' | 'ordering'>
+  ): Promise<SavedView> {
+    const response = await apiClient.post<SavedView>('/api/applications/views/', data);
+    return response.data;
+  },
+
+  /**
+   * Rename or redefine a saved view (requires auth)
+   */
+  async updateSavedView(
+    id: number,
+    data: Partial<Pick<SavedView, 'name' | 'criteria' | 'ordering'>>
+  ): Promise<SavedView> {
+    const response = await apiClient.patch<SavedView>(`/api/applications/views/${id}/`, data);
+    return response.data;
+  },
+
+  /**
+   * Delete a saved view (requires auth)
+   */
+  async deleteSavedView(id: number): Promise<void> {
+    await apiClient.delete(`/api/applications/views/${id}/`);
+  },
+
+  /**
+   * One page of a saved view's results (requires auth)
+   */
+  async getSavedViewResults(id: number, page = 1): Promise<SavedViewResults> {
+    const response = await apiClient.get<SavedViewResults>(
+      `/api/applications/views/${id}/results/`,
+      { params: { page } }
+    );
+    return response.data;
+  },
 };
@@ -1,5 +1,5 @@
 import apiClient from './api';
-import { Job, JobFormData, JobFilters, PaginatedResponse } from '../types';
+import { Job, JobFormData, JobFilters, PaginatedResponse, ApplicationList, Dashboard } from '../types';
 
 export const jobService = {
   /**
@@ -66,10 +66,24 @@ export const jobService = {
   },
 
   /**
-   * Get applications for a specific job
+   * Get applications for a specific job, highest score first
    */
-  async getJobApplications(id: number): Promise<any[]> {
-    const response = await apiClient.get(`/api/jobs/${id}/applications/`);
+  async getJobApplications(id: number, page: number = 1): Promise<PaginatedResponse<ApplicationList>> {
+    const response = await apiClient.get<PaginatedResponse<ApplicationList>>(
+      `/api/jobs/${id}/applications/`,
+      { params: { page } }
+    );
+    return response.data;
+  },
+
+  /**
+   * Get the recruiter dashboard (user, own jobs with stage counts and
+   * latest applications) in a single request
+   */
+  async getDashboard(latest?: number): Promise<Dashboard> {
+    const response = await apiClient.get<Dashboard>('/api/dashboard/', {
+      params: latest !== undefined ? { latest } : undefined,
+    });
     return response.data;
   },
 };
@@ -61,6 +61,9 @@ export type ApplicationStatus =
   | 'offer'
   | 'rejected';
 
+// Ordinal: 1 diploma, 2 associate, 3 bachelor, 4 master, 5 doctorate
+export type EducationLevel = 1 | 2 | 3 | 4 | 5;
+
 export interface Application {
   id: number;
   job: Job;
@@ -78,6 +81,9 @@ export interface Application {
   parsed_email: string;
   parsed_phone: string;
   score: number;
+  experience_years: number | null;
+  education_level: EducationLevel | null;
+  education_field: string;
   applied_at: string;
   updated_at: string;
   status_history: ApplicationStatusHistory[];
@@ -91,6 +97,8 @@ export interface ApplicationList {
   candidate_email: string;
   status: ApplicationStatus;
   score: number;
+  experience_years: number | null;
+  education_level: EducationLevel | null;
   applied_at: string;
 }
 
@@ -104,6 +112,80 @@ export interface ApplicationFormData {
   resume_file: File | null;
 }
 
+export type ApplicationFacet = 'status' | 'job' | 'score' | 'skills';
+
+export interface FacetCount<T = string> {
+  value: T;
+  label?: string;
+  count: number;
+}
+
+export interface ApplicationFacets {
+  status?: FacetCount<ApplicationStatus>[];
+  job?: FacetCount<number>[];
+  score?: { min: number; max: number; count: number }[];
+  skills?: FacetCount[];
+}
+
+export interface ResumeSearchResult extends ApplicationList {
+  relevance: number;
+  snippet: string;
+}
+
+export interface ResumeSearchResponse {
+  query: string;
+  count: number;
+  results: ResumeSearchResult[];
+}
+
+export interface ResumeUpload {
+  token: string;
+  filename: string;
+  size: number;
+  offset: number;
+  complete: boolean;
+  expires_at: string;
+  chunk_size?: number;  // only when the upload is started
+}
+
+// Saved views: a stored query with materialized results
+export interface SavedViewCriteria {
+  job?: number;
+  status?: ApplicationStatus[];
+  min_score?: number;
+  max_score?: number;
+  skills?: string[];  // all required
+  min_experience?: number;
+  max_experience?: number;
+  min_education_level?: EducationLevel;
+  education_field?: string;
+  search?: string;
+}
+
+export type SavedViewSortField =
+  | 'score'
+  | 'applied_at'
+  | 'candidate_name'
+  | 'experience_years'
+  | 'education_level';
+
+export interface SavedView {
+  id: number;
+  name: string;
+  criteria: SavedViewCriteria;
+  ordering: SavedViewSortField | `-${SavedViewSortField}`;
+  result_count: number;
+  truncated: boolean;
+  refreshed_at: string | null;
+  created_at: string;
+  updated_at: string;
+}
+
+export interface SavedViewResults extends PaginatedResponse<ApplicationList> {
+  truncated: boolean;
+  refreshed_at: string;
+}
+
 export interface ApplicationStatusHistory {
   id: number;
   from_status: string;
@@ -114,6 +196,24 @@ export interface ApplicationStatusHistory {
   notes: string;
 }
 
+// Dashboard types
+export interface DashboardJob {
+  id: number;
+  title: string;
+  location: string;
+  status: 'active' | 'closed';
+  created_at: string;
+  application_count: number;
+  created_by_name: string;
+  stage_counts: Record<ApplicationStatus, number>;
+  latest_applications: ApplicationList[];
+}
+
+export interface Dashboard {
+  user: User;
+  jobs: DashboardJob[];
+}
+
 // Pagination types
 export interface PaginatedResponse<T> {
   count: number;
@@ -128,6 +228,10 @@ export interface ApplicationFilters {
   status?: ApplicationStatus;
   search?: string;
   ordering?: string;
+  min_experience?: number;
+  max_experience?: number;
+  min_education_level?: EducationLevel;
+  education_field?: string;
 }
 
 export interface JobFilters {
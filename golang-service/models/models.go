@@ -14,6 +14,7 @@ type ParsedData struct {
 	Email      string   `json:"email"`
 	Phone      string   `json:"phone"`
 	Score      int      `json:"score"`
+	Text       string   `json:"text,omitempty"` // full extracted text, for candidate search
 }
 
 // ParseResumeResponse represents the response body
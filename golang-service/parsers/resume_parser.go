@@ -64,5 +64,6 @@ func (r *ResumeParser) ParseResume(fileURL string, jobRequirements []string) (*m
 		Email:      email,
 		Phone:      phone,
 		Score:      score,
+		Text:       text,
 	}, nil
 }